@@ -0,0 +1,220 @@
+"""
+Content-addressed answer cache for the solution runner.
+
+Answers are keyed by a hash of everything that can change them: the day's
+source file, the utils package modules it can import and the bytes of its
+input (the loose input.txt or, failing that, the input store). An unchanged
+day therefore comes back instantly, while any edit to one of those files
+naturally misses the cache.
+
+Entries live as small JSON files under .aoc_cache/answers/. Writes are atomic
+and serialized with a lock file so parallel runs never corrupt the cache, and
+old or excess entries are evicted after every write.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import input_store
+
+CACHE_DIR = Path(os.getenv("AOC_CACHE_DIR", Path(__file__).parent / ".aoc_cache"))
+MAX_CACHE_BYTES = 50 * 1024 * 1024
+MAX_CACHE_AGE = 30 * 24 * 60 * 60
+# Helpers every year's utils package re-exports
+SHARED_UTILS_DIR = Path(__file__).parent / "aoc_utils"
+
+
+def resolve_utils_file(year: int) -> Optional[Path]:
+    """
+    Find the utils.py a day of the given year imports.
+
+    Args:
+        year: Year
+
+    Returns:
+        Path to the resolved utils module, or None if it cannot be found
+    """
+    try:
+        spec = importlib.util.find_spec(f"aoc{year}.utils.utils")
+    except ImportError:
+        return None
+    if spec is None or spec.origin is None:
+        return None
+    return Path(spec.origin)
+
+
+def utils_files(year: int) -> List[Path]:
+    """
+    List the modules of the utils package a day of the given year imports.
+
+    The year's package re-exports the shared aoc_utils package, so its
+    modules are listed too.
+
+    Args:
+        year: Year
+
+    Returns:
+        Sorted paths of every .py file next to utils.py (graph.py, ...),
+        then of every aoc_utils module; empty if the package cannot be found
+    """
+    utils_file = resolve_utils_file(year)
+    if utils_file is None or not utils_file.exists():
+        return []
+    shared = sorted(SHARED_UTILS_DIR.glob("*.py"))
+    return sorted(utils_file.parent.glob("*.py")) + shared
+
+
+def cache_key(day: int, year: int, variant: Optional[str] = None) -> Optional[str]:
+    """
+    Compute the content hash identifying a day's answers.
+
+    Args:
+        day: Day number (1-25)
+        year: Year
+        variant: Input variant, see input_store (default: the active one)
+
+    Returns:
+        Hex digest, or None if the source or input is missing
+    """
+    if variant is None:
+        variant = input_store.active_variant()
+    day_file = Path(__file__).parent / f"aoc{year}" / f"day{day}" / f"day{day}.py"
+    utils = utils_files(year)
+    if not utils or not day_file.exists():
+        return None
+    try:
+        input_data = input_store.read_bytes(year, day, variant, use_mmap=True)
+    except FileNotFoundError:
+        return None
+
+    digest = hashlib.sha256(f"{year}:{day}".encode())
+    parts = (day_file.read_bytes(), *(path.read_bytes() for path in utils), input_data)
+    for data in parts:
+        # Length-prefix each part so file boundaries can't be shifted
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+@contextmanager
+def cache_lock(cache_dir: Path = CACHE_DIR) -> Iterator[None]:
+    """Hold an exclusive lock on the cache directory for the duration."""
+    with input_store.dir_lock(cache_dir):
+        yield
+
+
+def _entry_path(key: str, cache_dir: Path) -> Path:
+    return cache_dir / "answers" / f"{key}.json"
+
+
+def get_answers(key: str, cache_dir: Path = CACHE_DIR) -> Dict[str, Any]:
+    """
+    Look up cached answers.
+
+    Args:
+        key: Content hash from cache_key()
+        cache_dir: Cache root (default: .aoc_cache)
+
+    Returns:
+        Dict mapping star number ("1"/"2") to answer; empty on a miss
+    """
+    path = _entry_path(key, cache_dir)
+    try:
+        answers = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    # Refresh the timestamp so eviction drops least recently used entries first
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return answers if isinstance(answers, dict) else {}
+
+
+def put_answer(key: str, star: int, answer: Any, cache_dir: Path = CACHE_DIR) -> bool:
+    """
+    Store one star's answer, merging with any answer already cached.
+
+    Args:
+        key: Content hash from cache_key()
+        star: 1 or 2
+        answer: JSON-serializable answer
+        cache_dir: Cache root (default: .aoc_cache)
+
+    Returns:
+        True if stored, False if the answer can't be serialized
+    """
+    try:
+        json.dumps(answer)
+    except (TypeError, ValueError):
+        return False
+
+    path = _entry_path(key, cache_dir)
+    with cache_lock(cache_dir):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        answers = get_answers(key, cache_dir)
+        answers[str(star)] = answer
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as tmp:
+            json.dump(answers, tmp)
+        os.replace(tmp_name, path)
+
+        evict(cache_dir=cache_dir)
+    return True
+
+
+def evict(max_bytes: int = MAX_CACHE_BYTES, max_age: float = MAX_CACHE_AGE,
+          cache_dir: Path = CACHE_DIR) -> int:
+    """
+    Remove expired entries, then least recently used ones until under budget.
+
+    Callers are expected to hold cache_lock().
+
+    Args:
+        max_bytes: Maximum total size of cached entries
+        max_age: Maximum entry age in seconds since last use
+        cache_dir: Cache root (default: .aoc_cache)
+
+    Returns:
+        Number of entries removed
+    """
+    answers_dir = cache_dir / "answers"
+    if not answers_dir.exists():
+        return 0
+
+    now = time.time()
+    entries = []
+    for path in answers_dir.glob("*.json"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    entries.sort()
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for mtime, size, path in entries:
+        if now - mtime <= max_age and total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+def clear(cache_dir: Path = CACHE_DIR) -> int:
+    """Remove every cached answer and return how many were removed."""
+    with cache_lock(cache_dir):
+        return evict(max_bytes=-1, cache_dir=cache_dir)
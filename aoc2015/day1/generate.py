@@ -0,0 +1,16 @@
+"""Synthetic input generator for 2015 day 1: a string of parentheses."""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generate floor instructions about 7000 * scale characters long.
+
+    The walk drifts upwards but dips to floor -1 early on, like real inputs,
+    so star2 has a basement position to find.
+    """
+    rng = random.Random(seed)
+    length = 7000 * scale
+    prefix = "()" * rng.randint(5, 50) + ")"
+    rest = rng.choices("()", weights=(52, 48), k=length - len(prefix))
+    return prefix + "".join(rest)
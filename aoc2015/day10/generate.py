@@ -0,0 +1,18 @@
+"""Synthetic input generator for 2015 day 10: a look-and-say seed."""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generate a look-and-say seed of 10 * scale digits.
+
+    Runs of the same digit are at most three long, as in any look-and-say
+    sequence, so the growth rate matches the real input.
+    """
+    rng = random.Random(seed)
+    digits = []
+    while len(digits) < 10 * scale:
+        digit = rng.choice("123")
+        if digits[-3:] != [digit] * 3:
+            digits.append(digit)
+    return "".join(digits)
@@ -0,0 +1,14 @@
+"""Synthetic input generator for 2015 day 11: Santa's current password."""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generate an 8-letter password without i, o or l.
+
+    The password length is fixed by the puzzle, so scale has no effect;
+    vary seed to sample different starting passwords instead.
+    """
+    rng = random.Random(seed)
+    letters = "abcdefghjkmnpqrstuvwxyz"
+    return "".join(rng.choices(letters, k=8))
@@ -0,0 +1,19 @@
+"""Synthetic input generator for 2015 day 12: a JSON accounting document."""
+import json
+import random
+
+
+def _value(rng: random.Random, depth: int):
+    kind = rng.random()
+    if depth > 4 or kind < 0.4:
+        return rng.choice([rng.randint(-200, 200), "red", "green", "blue", "violet"])
+    if kind < 0.7:
+        return [_value(rng, depth + 1) for _ in range(rng.randint(1, 6))]
+    return {chr(97 + i): _value(rng, depth + 1) for i in range(rng.randint(1, 6))}
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """Generate a JSON array of 100 * scale randomly nested documents."""
+    rng = random.Random(seed)
+    values = [_value(rng, 0) for _ in range(100 * scale)]
+    return json.dumps(values, separators=(",", ":"))
@@ -1,36 +1,35 @@
-from aoc2015.utils.utils import read_input
+from aoc2015.utils.utils import ints, parallel_map_reduce, read_input_bytes
+
+
+def wrapping_paper(d) -> int:
+    l,w,h = ints(d)
+    surface_area = 2*((l*w)+(w*h)+(h*l))
+    slack = min(l*w,w*h,h*l)
+    return surface_area+slack
+
+
+def ribbon_length(d) -> int:
+    vals = ints(d)
+    l,w,h = vals
+    vals.sort()
+    min_one,min_two = vals[0],vals[1]
+    perimeter = 2*(min_one+min_two)
+    ribbon = l*w*h
+    return perimeter+ribbon
 
 
 def star1() -> int:
-    data = read_input()
-    dimensions=[]
-    for d in data:
-        dimensions.append([int(x) for x in d.split('x')])
-    required_wrapper = 0
-    for vals in dimensions:
-        l,w,h = vals
-        surface_area = 2*((l*w)+(w*h)+(h*l))
-        slack = min(l*w,w*h,h*l)
-        required_wrapper += (surface_area+slack)
+    # One present per line, each independent of the others, so shard them
+    required_wrapper = parallel_map_reduce(wrapping_paper, read_input_bytes(),
+                                           initial=0)
 
     # TODO: Implement star 1 solution
     return required_wrapper
 
 
 def star2() -> int:
-    data = read_input()
-    # TODO: Implement star 2 solution
-    dimensions = []
-    for d in data:
-        dimensions.append([int(x) for x in d.split('x')])
-    required_wrapper = 0
-    for vals in dimensions:
-        l,w,h = vals
-        vals.sort()
-        min_one,min_two = vals[0],vals[1]
-        perimeter = 2*(min_one+min_two)
-        ribbon = l*w*h
-        required_wrapper += (perimeter+ribbon)
+    required_wrapper = parallel_map_reduce(ribbon_length, read_input_bytes(),
+                                           initial=0)
 
 
     return required_wrapper
@@ -0,0 +1,11 @@
+"""Synthetic input generator for 2015 day 2: present dimensions "LxWxH"."""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """Generate 1000 * scale boxes with sides between 1 and 30."""
+    rng = random.Random(seed)
+    return "\n".join(
+        f"{rng.randint(1, 30)}x{rng.randint(1, 30)}x{rng.randint(1, 30)}"
+        for _ in range(1000 * scale)
+    )
@@ -0,0 +1,8 @@
+"""Synthetic input generator for 2015 day 3: a string of ^v<> moves."""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """Generate 8192 * scale moves."""
+    rng = random.Random(seed)
+    return "".join(rng.choices("^v<>", k=8192 * scale))
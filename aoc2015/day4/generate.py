@@ -0,0 +1,14 @@
+"""Synthetic input generator for 2015 day 4: an MD5 mining secret key."""
+import random
+import string
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generate an 8-letter secret key.
+
+    The input is a single key whose difficulty is fixed by the puzzle, so
+    scale has no effect; vary seed to sample different keys instead.
+    """
+    rng = random.Random(seed)
+    return "".join(rng.choices(string.ascii_lowercase, k=8))
@@ -1,4 +1,5 @@
-from aoc2015.utils.utils import read_input
+from aoc2015.utils.utils import parallel_map_reduce, read_input_bytes
+
 
 def check_rules(string):
     vowel_count=0
@@ -32,23 +33,14 @@ def new_check_rules(string):
     return pair_appears_twice and repeat_middle
 
 def star1() -> int:
-    data = read_input()
-    nice_strings=0
-    # TODO: Implement star 1 solution
-    for strings in data:
-        if check_rules(strings):
-            nice_strings += 1
+    # Each string is judged on its own, so shard them across processes
+    nice_strings = parallel_map_reduce(check_rules, read_input_bytes(), initial=0)
 
     return nice_strings
 
 
 def star2() -> int:
-    data = read_input()
-    nice_strings=0
-    # TODO: Implement star 2 solution
-    for strings in data:
-        if new_check_rules(strings):
-            nice_strings+=1
+    nice_strings = parallel_map_reduce(new_check_rules, read_input_bytes(), initial=0)
     return nice_strings
 
 
@@ -0,0 +1,12 @@
+"""Synthetic input generator for 2015 day 5: naughty or nice strings."""
+import random
+import string
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """Generate 1000 * scale lowercase strings of 16 letters."""
+    rng = random.Random(seed)
+    return "\n".join(
+        "".join(rng.choices(string.ascii_lowercase, k=16))
+        for _ in range(1000 * scale)
+    )
@@ -1,6 +1,8 @@
-from aoc2015.utils.utils import read_input
-import numpy as np
 import copy
+
+from aoc2015.utils.utils import ints, lazy_import, read_input
+
+np = lazy_import("numpy")
 def switch_lights(light_arr,row1,col1,row2,col2,to_switch):
     lights_array = copy.deepcopy(light_arr)
     for row in range(row1,row2+1):
@@ -46,15 +48,14 @@ def star1() -> int:
     for instructions in data:
         switch_instructions = instructions.split(" ")
         if switch_instructions[0] == "turn":
-            r1,c1,r2,c2 = int(switch_instructions[2].split(",")[0]) ,int(switch_instructions[2].split(",")[1]),int(switch_instructions[4].split(",")[0]),int(switch_instructions[4].split(",")[1])
+            r1, c1, r2, c2 = ints(instructions)
             if switch_instructions[1] == "on":
                 to_switch = True
             else:
                 to_switch = False
             lights = switch_lights(lights,r1,c1,r2,c2,to_switch)
         else:
-            r1, c1, r2, c2 = int(switch_instructions[1].split(",")[0]), int(switch_instructions[1].split(",")[1]), int(
-                switch_instructions[3].split(",")[0]), int(switch_instructions[3].split(",")[1])
+            r1, c1, r2, c2 = ints(instructions)
             lights = toggle_lights(lights,r1,c1,r2,c2)
 
     for i in range(1000):
@@ -72,16 +73,14 @@ def star2() -> int:
     for instructions in data:
         switch_instructions = instructions.split(" ")
         if switch_instructions[0] == "turn":
-            r1, c1, r2, c2 = int(switch_instructions[2].split(",")[0]), int(switch_instructions[2].split(",")[1]), int(
-                switch_instructions[4].split(",")[0]), int(switch_instructions[4].split(",")[1])
+            r1, c1, r2, c2 = ints(instructions)
             if switch_instructions[1] == "on":
                 to_switch = True
             else:
                 to_switch = False
             lights = increase_switch_lights(lights, r1, c1, r2, c2, to_switch)
         else:
-            r1, c1, r2, c2 = int(switch_instructions[1].split(",")[0]), int(switch_instructions[1].split(",")[1]), int(
-                switch_instructions[3].split(",")[0]), int(switch_instructions[3].split(",")[1])
+            r1, c1, r2, c2 = ints(instructions)
             lights = increase_toggle_lights(lights, r1, c1, r2, c2)
 
     for i in range(1000):
@@ -0,0 +1,18 @@
+"""Synthetic input generator for 2015 day 6: light grid instructions."""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generate 300 * scale instructions on the puzzle's fixed 1000x1000 grid.
+
+    Rectangles are up to 1000 cells per side, like the real input.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(300 * scale):
+        r1, r2 = sorted(rng.randrange(1000) for _ in range(2))
+        c1, c2 = sorted(rng.randrange(1000) for _ in range(2))
+        action = rng.choice(("turn on", "turn off", "toggle"))
+        lines.append(f"{action} {r1},{c1} through {r2},{c2}")
+    return "\n".join(lines)
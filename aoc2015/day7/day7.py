@@ -1,3 +1,4 @@
+from aoc2015.utils.graph import Graph
 from aoc2015.utils.utils import read_input
 
 OPERATORS = ['AND','OR','NOT','RSHIFT','LSHIFT']
@@ -6,138 +7,76 @@ def get_val(item, wires):
         return int(item)
     return wires.get(item)
 
-def star1() -> int:
-    data = read_input()
-    value = []
-    digit = lambda x : int(x) if x.isdigit() else wires[x]
+def parse_circuit(data):
+    """Map each target wire to its instruction tokens, e.g. {"z": ["x", "AND", "y"]}."""
+    circuit = {}
     for v in data:
-        value.append(v.split(" "))
-    wires = {}
-
-    # Loop until all instructions are resolved
-    # Note: This checks if we have a signal for every unique wire found in "-> target"
-    while True:
-        progress_made = False  # Detect infinite loops
-
-        for val in value:
-            target_wire = val[-1]
-
-            # If we already know this wire, skip it
-            if target_wire in wires:
-                continue
-
-            # 1. Handle Simple Assignment: "123 -> x" or "lx -> x"
-            # Structure: [Source, "->", Target] (Length 3)
-            if len(val) == 3:
-                v = get_val(val[0], wires)
-                if v is not None:
-                    wires[target_wire] = v
-                    progress_made = True
-
-            # 2. Handle NOT: "NOT x -> y"
-            # Structure: ["NOT", Source, "->", Target] (Length 4)
-            elif len(val) == 4:
-                v = get_val(val[1], wires)
-                if v is not None:
-                    wires[target_wire] = ~v & 65535
-                    progress_made = True
-
-            # 3. Handle Gates: "x AND y -> z", "x LSHIFT 2 -> z"
-            # Structure: [Left, Op, Right, "->", Target] (Length 5)
-            elif len(val) == 5:
-                left = get_val(val[0], wires)
-                right = get_val(val[2], wires)
-                op = val[1]
-
-                # CHECK FOR NONE, NOT FALSE (Fixes the "0" bug)
-                if left is not None and right is not None:
-                    res = 0
-                    if op == 'AND':
-                        res = left & right
-                    elif op == 'OR':
-                        res = left | right
-                    elif op == 'LSHIFT':
-                        res = left << right
-                    elif op == 'RSHIFT':
-                        res = left >> right
-
-                    wires[target_wire] = res & 65535  # Ensure 16-bit safety
-                    progress_made = True
-
-        # Break if we solve everything (or get stuck)
-        # Checking if 'a' is found is usually enough for AoC
-        if 'a' in wires:
-            break
-
-   # print(wires.get('a'))
-
-
+        val = v.split(" ")
+        circuit[val[-1]] = val[:-2]
+    return circuit
+
+def evaluation_order(circuit):
+    """
+    Order the wires so every wire comes after the wires feeding it.
+
+    Replaces re-scanning every instruction until nothing changes with one
+    topological sort of the wire dependency graph.
+    """
+    graph = Graph()
+    for target, tokens in circuit.items():
+        graph.node(target)
+        for token in tokens:
+            if token in circuit:
+                graph.add_edge(token, target)
+    return [graph.names[node] for node in graph.topological_order()]
+
+def simulate(circuit, wires=None):
+    """Evaluate every wire once in dependency order; preset wires are kept."""
+    wires = dict(wires or {})
+    for target_wire in evaluation_order(circuit):
+        # If we already know this wire, skip it
+        if target_wire in wires:
+            continue
+        val = circuit[target_wire]
+
+        # 1. Handle Simple Assignment: "123 -> x" or "lx -> x"
+        if len(val) == 1:
+            wires[target_wire] = get_val(val[0], wires)
+
+        # 2. Handle NOT: "NOT x -> y"
+        elif len(val) == 2:
+            wires[target_wire] = ~get_val(val[1], wires) & 65535
+
+        # 3. Handle Gates: "x AND y -> z", "x LSHIFT 2 -> z"
+        else:
+            left = get_val(val[0], wires)
+            right = get_val(val[2], wires)
+            op = val[1]
+            res = 0
+            if op == 'AND':
+                res = left & right
+            elif op == 'OR':
+                res = left | right
+            elif op == 'LSHIFT':
+                res = left << right
+            elif op == 'RSHIFT':
+                res = left >> right
+
+            wires[target_wire] = res & 65535  # Ensure 16-bit safety
+    return wires
 
-
-
-    # TODO: Implement star 1 solution
+def star1() -> int:
+    data = read_input()
+    wires = simulate(parse_circuit(data))
     return wires.get('a')
 
 
-def star2(part_a) -> int:
+def star2(part_a=None) -> int:
+    # The runner calls stars without arguments, so work out star 1 if needed
+    if part_a is None:
+        part_a = star1()
     data = read_input()
-    value = []
-    digit = lambda x: int(x) if x.isdigit() else wires[x]
-    for v in data:
-        value.append(v.split(" "))
-    wires = {'b': part_a}
-    while True:
-        progress_made = False  # Detect infinite loops
-
-        for val in value:
-            target_wire = val[-1]
-
-            # If we already know this wire, skip it
-            if target_wire in wires:
-                continue
-
-            # 1. Handle Simple Assignment: "123 -> x" or "lx -> x"
-            # Structure: [Source, "->", Target] (Length 3)
-            if len(val) == 3:
-                v = get_val(val[0], wires)
-                if v is not None:
-                    wires[target_wire] = v
-                    progress_made = True
-
-            # 2. Handle NOT: "NOT x -> y"
-            # Structure: ["NOT", Source, "->", Target] (Length 4)
-            elif len(val) == 4:
-                v = get_val(val[1], wires)
-                if v is not None:
-                    wires[target_wire] = ~v & 65535
-                    progress_made = True
-
-            # 3. Handle Gates: "x AND y -> z", "x LSHIFT 2 -> z"
-            # Structure: [Left, Op, Right, "->", Target] (Length 5)
-            elif len(val) == 5:
-                left = get_val(val[0], wires)
-                right = get_val(val[2], wires)
-                op = val[1]
-
-                # CHECK FOR NONE, NOT FALSE (Fixes the "0" bug)
-                if left is not None and right is not None:
-                    res = 0
-                    if op == 'AND':
-                        res = left & right
-                    elif op == 'OR':
-                        res = left | right
-                    elif op == 'LSHIFT':
-                        res = left << right
-                    elif op == 'RSHIFT':
-                        res = left >> right
-
-                    wires[target_wire] = res & 65535  # Ensure 16-bit safety
-                    progress_made = True
-
-        # Break if we solve everything (or get stuck)
-        # Checking if 'a' is found is usually enough for AoC
-        if 'a' in wires:
-            break
+    wires = simulate(parse_circuit(data), {'b': part_a})
     return wires.get('a')
 
 
@@ -0,0 +1,49 @@
+"""Synthetic input generator for 2015 day 7: a 16-bit wire circuit."""
+import random
+
+
+def _wire_name(i: int) -> str:
+    # Two or more letters, so the single-letter wires "a" and "b" stay free
+    name = ""
+    i += 26
+    while i:
+        i, rem = divmod(i, 26)
+        name = chr(ord("a") + rem) + name
+    return name
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generate an acyclic circuit of about 340 * scale wires.
+
+    Every gate only reads wires defined before it, so the circuit always
+    resolves; wire "b" is a constant (star2 overrides it) and wire "a"
+    depends on the last gates. Lines are shuffled like the real input.
+    """
+    rng = random.Random(seed)
+    count = 340 * scale
+    wires = ["b"]
+    lines = [f"{rng.randrange(65536)} -> b"]
+
+    for i in range(count):
+        target = _wire_name(i)
+        if len(wires) < 2 or rng.random() < 0.05:
+            lines.append(f"{rng.randrange(65536)} -> {target}")
+        else:
+            # Prefer recent wires so the dependency chains stay deep
+            left = wires[max(0, len(wires) - 1 - int(rng.expovariate(0.1)))]
+            right = rng.choice(wires)
+            op = rng.choice(("AND", "OR", "LSHIFT", "RSHIFT", "NOT", "COPY"))
+            if op in ("AND", "OR"):
+                lines.append(f"{left} {op} {right} -> {target}")
+            elif op in ("LSHIFT", "RSHIFT"):
+                lines.append(f"{left} {op} {rng.randint(1, 15)} -> {target}")
+            elif op == "NOT":
+                lines.append(f"NOT {left} -> {target}")
+            else:
+                lines.append(f"{left} -> {target}")
+        wires.append(target)
+
+    lines.append(f"{wires[-1]} OR {wires[-2]} -> a")
+    rng.shuffle(lines)
+    return "\n".join(lines)
@@ -0,0 +1,23 @@
+"""Synthetic input generator for 2015 day 8: escaped string literals."""
+import random
+import string
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    r"""Generate 300 * scale quoted strings mixing letters, \\, \" and \x escapes."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(300 * scale):
+        parts = []
+        for _ in range(rng.randint(0, 30)):
+            kind = rng.random()
+            if kind < 0.05:
+                parts.append("\\\\")
+            elif kind < 0.1:
+                parts.append('\\"')
+            elif kind < 0.15:
+                parts.append(f"\\x{rng.randrange(256):02x}")
+            else:
+                parts.append(rng.choice(string.ascii_lowercase))
+        lines.append('"' + "".join(parts) + '"')
+    return "\n".join(lines)
@@ -1,76 +1,40 @@
-import math
+from itertools import permutations
 
+from aoc2015.utils.graph import Graph
 from aoc2015.utils.utils import read_input
-from itertools import permutations
 
-def star1() -> int:
-    data = read_input()
-    distance_log = {}
-    distance = {}
-    places_combo = set()
+
+def build_graph(data):
+    """Parse "A to B = 12" lines into an undirected weighted graph."""
+    edges = []
     for s in data:
         left, dist = s.split(" = ")
         src, dst = left.split(" to ")
-        distance_log[src,dst] = int(dist)
-        distance_log[dst,src] = int(dist)
-        places_combo.add(src)
-        places_combo.add(dst)
-    places = tuple(places_combo)
-    for (s,d),dist in distance_log.items():
-        distance[(s,d)] = dist
-    shortest = float("inf")
-    def find_distance(route):
-        total_distance = 0
-        for i in range(len(route)-1):
-            edge = (route[i],route[i+1])
-            if edge not in distance:
-                return math.inf
-            total_distance+= distance[edge]
-        return total_distance
-
-    for routes in permutations(places):
-        d = find_distance(routes)
-        if d != math.inf:
-            if d < shortest:
-                shortest = d
+        edges.append((src, dst, int(dist)))
+    return Graph.from_edges(edges, undirected=True)
 
 
-    return shortest
+def route_lengths(graph):
+    """Yield the length of every route that visits each place once."""
+    distance = [dict(graph.edges(node)) for node in range(len(graph))]
+    for route in permutations(range(len(graph))):
+        total = 0
+        for src, dst in zip(route, route[1:]):
+            if dst not in distance[src]:
+                break
+            total += distance[src][dst]
+        else:
+            yield total
 
 
-def star2() -> int:
+def star1() -> int:
     data = read_input()
-    distance_log = {}
-    distance = {}
-    places_combo = set()
-    for s in data:
-        left, dist = s.split(" = ")
-        src, dst = left.split(" to ")
-        distance_log[src, dst] = int(dist)
-        distance_log[dst, src] = int(dist)
-        places_combo.add(src)
-        places_combo.add(dst)
-    places = tuple(places_combo)
-    for (s, d), dist in distance_log.items():
-        distance[(s, d)] = dist
-    longest = 0
+    return min(route_lengths(build_graph(data)))
 
-    def find_distance(route):
-        total_distance = 0
-        for i in range(len(route) - 1):
-            edge = (route[i], route[i + 1])
-            if edge not in distance:
-                return math.inf
-            total_distance += distance[edge]
-        return total_distance
 
-    for routes in permutations(places):
-        d = find_distance(routes)
-        if d != math.inf:
-            if d > longest:
-                longest = d
-
-    return longest
+def star2() -> int:
+    data = read_input()
+    return max(route_lengths(build_graph(data)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,19 @@
+"""Synthetic input generator for 2015 day 9: distances between locations."""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generate a complete distance table over 8 locations, plus one more each
+    time scale doubles (11 at 10x, 14 at 100x).
+
+    The current solution tries every permutation of locations, so even
+    this slow growth makes its running time explode.
+    """
+    rng = random.Random(seed)
+    places = [f"Place{i}" for i in range(7 + scale.bit_length())]
+    return "\n".join(
+        f"{src} to {dst} = {rng.randint(10, 150)}"
+        for i, src in enumerate(places)
+        for dst in places[i + 1:]
+    )
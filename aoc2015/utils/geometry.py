@@ -0,0 +1,3 @@
+"""Array-based geometry for Advent of Code 2015, see aoc_utils.geometry"""
+
+from aoc_utils.geometry import *  # noqa: F403
@@ -1,4 +1,4 @@
-from aoc2025.utils.utils import read_input
+from aoc2025.utils.utils import iter_input
 
 def count_zero_hits(commands, start=50, N=100):
     """
@@ -41,13 +41,10 @@ def count_zero_hits(commands, start=50, N=100):
     return total
 
 def star1() -> int:
-    data = []
-    input_data = read_input()
-    for d in input_data:
-        data.append(d.split('\n')[0])
-    move_data = [[item[0], int(item[1:])] for item in data]
     pointer,password,safe_length = 50,0,100
-    for moves in move_data:
+    # Stream the rotations; only the dial position carries over between lines
+    for item in iter_input():
+        moves = [item[0], int(item[1:])]
         move_value = moves[1]%safe_length
         if moves[0]=='L':
             move_value = move_value*-1
@@ -62,13 +59,9 @@ def star1() -> int:
 
 
 def star2() -> int:
-    data = []
-    input_data = read_input()
-    for d in input_data:
-        data.append(d.split('\n')[0])
     safe_length = 100
     pointer = 50
-    password = count_zero_hits(data,pointer,safe_length)
+    password = count_zero_hits(iter_input(),pointer,safe_length)
     return password
 
 
@@ -0,0 +1,10 @@
+"""Synthetic input generator for 2025 day 1: dial rotations."""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """Generate 4000 * scale rotations such as "L68" or "R412"."""
+    rng = random.Random(seed)
+    return "\n".join(
+        f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(4000 * scale)
+    )
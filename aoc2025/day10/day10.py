@@ -1,8 +1,9 @@
-from aoc2025.utils.utils import read_input
+from aoc2025.utils.utils import ints, read_input, lazy_import, parallel_map_reduce
 import re
 import itertools
 from collections import deque
-from z3 import Int, Optimize, Sum, sat
+# z3 is only needed by star2; load it on first use
+z3 = lazy_import("z3")
 def parse_line(line: str):
     """
     Parse one line of your actual input into:
@@ -10,16 +11,13 @@ def parse_line(line: str):
       target:  list[int]
     """
     # Buttons: sequences inside parentheses (...)
-    buttons = [
-        [int(x.strip()) for x in item.split(',')]
-        for item in re.findall(r'\(([^)]+)\)', line)
-    ]
+    buttons = [ints(item) for item in re.findall(r'\(([^)]+)\)', line)]
 
     # Joltage target: single block inside {...}
     joltage_strs = re.findall(r'\{([^}]+)\}', line)
     if len(joltage_strs) != 1:
         raise ValueError(f"Expected exactly one joltage block in line: {line}")
-    target = [int(x.strip()) for x in joltage_strs[0].split(',')]
+    target = ints(joltage_strs[0])
 
     return buttons, target
 
@@ -51,10 +49,10 @@ def min_presses_z3(buttons, target):
     k = len(target)   # number of counters
     n = len(buttons)  # number of buttons
 
-    opt = Optimize()
+    opt = z3.Optimize()
 
     # Variables: x_j = how many times to press button j
-    x = [Int(f"x_{j}") for j in range(n)]
+    x = [z3.Int(f"x_{j}") for j in range(n)]
 
     for j, btn in enumerate(buttons):
         # x_j >= 0
@@ -72,15 +70,15 @@ def min_presses_z3(buttons, target):
     # Constraints: for each counter i, sum of contributions == target[i]
     for i in range(k):
         opt.add(
-            Sum(
+            z3.Sum(
                 x[j] for j, btn in enumerate(buttons) if i in btn
             ) == target[i]
         )
 
-    total_presses = Sum(x)
+    total_presses = z3.Sum(x)
     opt.minimize(total_presses)
 
-    if opt.check() != sat:
+    if opt.check() != z3.sat:
         return None
 
     model = opt.model()
@@ -122,7 +120,7 @@ def star1() -> int:
         #list_b_clean = [[int(x.strip()) for x in item.split(',')] for item in re.findall(r'\(([^)]+)\)', d)]
         #list_c_raw = re.findall(r'\{([^{]+)\}', d)
         result_pattern.append(["".join([checkEven(y) for x in re.findall(r'\[([^\]]+)\]', d) for y in x])])
-        switch_order.append([[int(x.strip()) for x in item.split(',')] for item in re.findall(r'\(([^)]+)\)', d)])
+        switch_order.append([ints(item) for item in re.findall(r'\(([^)]+)\)', d)])
         joltage.append(re.findall(r'\{([^{]+)\}', d))
 
     finalswitch_count = 0
@@ -137,16 +135,23 @@ def star1() -> int:
     return 0
 
 
+def machine_presses(line):
+    """Fewest presses to reach one machine's joltage target (0 for blank lines)."""
+    line = line.strip()
+    if not line:
+        return 0
+    buttons, target = parse_line(line)
+    presses = min_presses_z3(buttons, target)
+    if presses is None:
+        raise RuntimeError(f"No solution for machine with target {target}")
+    return presses
+
+
 def star2() -> int:
     lines = read_input(test=False)  # or your own file loader
-    all_buttons, all_targets = parse_input(lines)
-
-    total = 0
-    for buttons, target in zip(all_buttons, all_targets):
-        presses = min_presses_z3(buttons, target)
-        if presses is None:
-            raise RuntimeError(f"No solution for machine with target {target}")
-        total += presses
+
+    # Every machine is its own small ILP, worth a process even for few lines
+    total = parallel_map_reduce(machine_presses, lines, initial=0, min_lines=2)
 
     return total
 
@@ -0,0 +1,38 @@
+"""Synthetic input generator for 2025 day 10: machine manuals."""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generate 150 * scale solvable machine lines.
+
+    Each machine has 4-10 lights and 3-12 buttons toggling random subsets
+    of them. The light diagram and joltage targets are produced by pressing
+    random buttons, so both stars always have a solution.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(150 * scale):
+        lights = rng.randint(4, 10)
+        buttons = [sorted(rng.sample(range(lights), rng.randint(1, min(5, lights))))
+                   for _ in range(rng.randint(3, 12))]
+        # Every counter must be reachable by at least one button
+        for light in range(lights):
+            if not any(light in button for button in buttons):
+                rng.choice(buttons).append(light)
+                buttons = [sorted(button) for button in buttons]
+
+        pattern = [0] * lights
+        for button in rng.sample(buttons, rng.randint(1, len(buttons))):
+            for light in button:
+                pattern[light] ^= 1
+        joltage = [0] * lights
+        for button in buttons:
+            presses = rng.randint(0, 20)
+            for light in button:
+                joltage[light] += presses
+
+        diagram = "".join("#" if on else "." for on in pattern)
+        wiring = " ".join("(" + ",".join(map(str, button)) + ")" for button in buttons)
+        lines.append(f"[{diagram}] {wiring} {{{','.join(map(str, joltage))}}}")
+    return "\n".join(lines)
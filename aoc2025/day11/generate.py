@@ -0,0 +1,48 @@
+"""Synthetic input generator for 2025 day 11: the server rack graph."""
+import random
+
+
+def _device_name(i: int, length: int) -> str:
+    name = ""
+    for _ in range(length):
+        i, rem = divmod(i, 26)
+        name = chr(ord("a") + rem) + name
+    return name
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generate a layered DAG of about 600 * scale devices.
+
+    Devices sit in 20 layers that widen with scale, and each one feeds 1-3
+    devices in the next layer. "svr" starts the first layer, "dac" and
+    "fft" sit in the middle, "you" is four layers before "out" so that
+    enumerating its paths stays cheap, and the last layer feeds "out". One
+    chain of devices links svr to dac to fft so star 2 always has paths.
+    """
+    rng = random.Random(seed)
+    layers_count, width = 20, max(3, 600 * scale // 20)
+    reserved = {"svr", "dac", "fft", "you", "out"}
+
+    # Three letters like the real input, four once there are too many devices
+    length = 3 if layers_count * width < 17_000 else 4
+    names = iter(n for n in (_device_name(i, length) for i in range(26 ** length))
+                 if n not in reserved)
+    layers = [[next(names) for _ in range(width)] for _ in range(layers_count)]
+    layers[0][0] = "svr"
+    layers[7][rng.randrange(width)] = "dac"
+    layers[12][rng.randrange(width)] = "fft"
+    layers[-4][rng.randrange(width)] = "you"
+    chain = [next((d for d in layer if d in reserved), rng.choice(layer))
+             for layer in layers]
+
+    lines = []
+    for layer, following, next_link in zip(layers, layers[1:], chain[1:]):
+        for device in layer:
+            outputs = rng.sample(following, rng.randint(1, min(3, width)))
+            if device in chain and next_link not in outputs:
+                outputs[0] = next_link
+            lines.append(f"{device}: {' '.join(outputs)}")
+    lines.extend(f"{device}: out" for device in layers[-1])
+    rng.shuffle(lines)
+    return "\n".join(lines)
@@ -1,40 +1,40 @@
-from aoc2025.utils.utils import read_input
+from aoc2025.utils.utils import parallel_map_reduce, read_input
 import re
 
 # The 6 shapes provided in the input and their calculated areas (# counts)
 SHAPE_AREAS = [5, 6, 7, 7, 7, 7]
 
 
-def solve_christmas_packing(data):
-    lines = data
-    fit_count = 0
+def region_fits(line):
+    """1 if the presents listed for a region fit its area, else 0."""
+    # Extract width, height, and the 6 quantities
+    # Example format: 50x45: 40 43 39 39 40 39
+    match = re.match(r"(\d+)x(\d+):" + r"\s+(\d+)" * 6, line)
+    if not match:
+        return 0
 
-    for line in lines:
-        # Extract width, height, and the 6 quantities
-        # Example format: 50x45: 40 43 39 39 40 39
-        match = re.match(r"(\d+)x(\d+):\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)", line)
+    width = int(match.group(1))
+    height = int(match.group(2))
+    quantities = [int(match.group(i)) for i in range(3, 9)]
 
-        if match:
-            width = int(match.group(1))
-            height = int(match.group(2))
-            quantities = [int(match.group(i)) for i in range(3, 9)]
+    # Calculate total available area
+    grid_area = width * height
 
-            # Calculate total available area
-            grid_area = width * height
+    # Calculate total required area for the presents
+    presents_area = sum(q * a for q, a in zip(quantities, SHAPE_AREAS))
 
-            # Calculate total required area for the presents
-            presents_area = sum(q * a for q, a in zip(quantities, SHAPE_AREAS))
+    # Check if it fits
+    return int(presents_area <= grid_area)
 
-            # Check if it fits
-            if presents_area <= grid_area:
-                fit_count += 1
 
-    return fit_count
+def solve_christmas_packing(data):
+    # Regions are independent, so shard them across processes
+    return parallel_map_reduce(region_fits, data, initial=0)
 
 
 def star1() -> int:
     data = read_input(test = False)
-
+    return solve_christmas_packing(data)
 
 
 def star2() -> int:
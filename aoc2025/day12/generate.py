@@ -0,0 +1,31 @@
+"""Synthetic input generator for 2025 day 12: present shapes and tree regions."""
+import random
+
+# Six 3x3 shapes with 5, 6, 7, 7, 7 and 7 cells, matching SHAPE_AREAS in day12
+SHAPES = [
+    ["###", "#..", "#.."],
+    ["###", "##.", "#.."],
+    ["###", "##.", "##."],
+    ["###", "#.#", "##."],
+    [".##", "###", "##."],
+    ["#.#", "###", "#.#"],
+]
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generate the six present shapes followed by 1000 * scale regions.
+
+    Each region line reads "WxH: q0 q1 q2 q3 q4 q5"; present counts are
+    chosen around the region's area so that roughly half of them fit.
+    """
+    rng = random.Random(seed)
+    blocks = [f"{i}:\n" + "\n".join(shape) for i, shape in enumerate(SHAPES)]
+
+    regions = []
+    for _ in range(1000 * scale):
+        width, height = rng.randint(35, 50), rng.randint(35, 50)
+        budget = width * height * rng.uniform(0.8, 1.2) / 6.5
+        counts = [max(0, round(budget / 6 * rng.uniform(0.7, 1.3))) for _ in SHAPES]
+        regions.append(f"{width}x{height}: {' '.join(map(str, counts))}")
+    return "\n\n".join(blocks) + "\n\n" + "\n".join(regions)
@@ -1,11 +1,9 @@
-from aoc2025.utils.utils import read_input
+from aoc2025.utils.utils import int_matrix, read_input
 import re
 
 
 def star1() -> int:
-    data = read_input()
-    data = data[0].split(',')
-    range_data  = [list(map(int, item.split('-'))) for item in data]
+    range_data = int_matrix(read_input(split=False), 2, negative=False).tolist()
     invalid_value = 0
     pattern = re.compile(r'^(\d+)\1$')
     for value in range_data:
@@ -18,9 +16,7 @@ def star1() -> int:
     return invalid_value
 
 def star2() -> int:
-    data = read_input()
-    data = data[0].split(',')
-    range_data = [list(map(int, item.split('-'))) for item in data]
+    range_data = int_matrix(read_input(split=False), 2, negative=False).tolist()
     invalid_value = 0
     pattern = re.compile(r'^(\d+)\1+$')
     for value in range_data:
@@ -0,0 +1,18 @@
+"""Synthetic input generator for 2025 day 2: product ID ranges."""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generate 35 * scale comma-separated ID ranges.
+
+    Ranges are up to 100,000 IDs wide and spread over 1 to 10 digit IDs,
+    so the brute-force scan does as much work per range as on real data.
+    """
+    rng = random.Random(seed)
+    ranges = []
+    for _ in range(35 * scale):
+        digits = rng.randint(1, 10)
+        start = rng.randint(10 ** (digits - 1), 10 ** digits - 1)
+        ranges.append(f"{start}-{start + rng.randint(0, 100_000)}")
+    return ",".join(ranges)
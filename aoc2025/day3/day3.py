@@ -1,4 +1,6 @@
-from aoc2025.utils.utils import read_input
+from functools import partial
+
+from aoc2025.utils.utils import parallel_map_reduce, read_input_bytes
 
 
 def get_max_subsequence_value(s, k=12):
@@ -45,31 +47,34 @@ def calculate_total_max_sum(string_list):
 
     return total_sum
 
+def max_two_digit_joltage(jolts):
+    max_value = 0
+    position=0
+    length = len(jolts)
+    for j in range(0,length-1):
+        if int(jolts[j]) > max_value:
+            max_value = int(jolts[j])
+            position = j
+    second_max=0
+    for i in range(position+1,length):
+        if int(jolts[i]) > second_max:
+            second_max = int(jolts[i])
+    return int(str(max_value)+str(second_max))
+
+
 def star1() -> int:
-    data = read_input()
     #joltage = [int(x) for x in data]
-    max_joltage=0
-    for jolts in data:
-        max_value = 0
-        position=0
-        length = len(jolts)
-        for j in range(0,length-1):
-            if int(jolts[j]) > max_value:
-                max_value = int(jolts[j])
-                position = j
-        second_max=0
-        for i in range(position+1,length):
-            if int(jolts[i]) > second_max:
-                second_max = int(jolts[i])
-        max_joltage += int(str(max_value)+str(second_max))
+    # Banks are independent, so shard them across processes
+    max_joltage = parallel_map_reduce(max_two_digit_joltage, read_input_bytes(),
+                                      initial=0)
     # TODO: Implement star 1 solution
     return max_joltage
 
 
 def star2() -> int:
-    data = read_input()
     target_length =12
-    result = int(calculate_total_max_sum(data))
+    result = parallel_map_reduce(partial(get_max_subsequence_value, k=target_length),
+                                 read_input_bytes(), initial=0)
     # TODO: Implement star 2 solution
     return result
 
@@ -0,0 +1,10 @@
+"""Synthetic input generator for 2025 day 3: battery banks of digits."""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """Generate 200 * scale banks of 100 digits from 1 to 9."""
+    rng = random.Random(seed)
+    return "\n".join(
+        "".join(rng.choices("123456789", k=100)) for _ in range(200 * scale)
+    )
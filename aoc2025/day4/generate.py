@@ -0,0 +1,12 @@
+"""Synthetic input generator for 2025 day 4: a grid of paper rolls."""
+import math
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """Generate a square grid of about 137 * 137 * scale cells, ~60% "@"."""
+    rng = random.Random(seed)
+    side = round(137 * math.sqrt(scale))
+    return "\n".join(
+        "".join(rng.choices("@.", weights=(6, 4), k=side)) for _ in range(side)
+    )
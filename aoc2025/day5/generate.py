@@ -0,0 +1,17 @@
+"""Synthetic input generator for 2025 day 5: fresh ID ranges and ingredients."""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generate 180 * scale overlapping fresh ranges, a blank line and
+    1000 * scale ingredient IDs.
+    """
+    rng = random.Random(seed)
+    top = 10 ** 15
+    ranges = []
+    for _ in range(180 * scale):
+        start = rng.randrange(top)
+        ranges.append(f"{start}-{start + rng.randrange(top // 50)}")
+    ingredients = [str(rng.randrange(top)) for _ in range(1000 * scale)]
+    return "\n".join(ranges) + "\n\n" + "\n".join(ingredients)
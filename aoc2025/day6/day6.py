@@ -2,8 +2,13 @@ from aoc2025.utils.utils import read_input
 from itertools import zip_longest,groupby
 
 
-def star1() -> int:
-    lines = read_input
+def parse(raw):
+    """Split the worksheet into rows once; both stars read it column-wise."""
+    return raw.split("\n")
+
+
+def star1(parsed) -> int:
+    lines = parsed
     columns = list(zip_longest(*lines, fillvalue=' '))
     problems = []
     current_problem_chars = []
@@ -46,8 +51,8 @@ def star1() -> int:
     return final_result
 
 
-def star2() -> int:
-    data,operators = read_input()[:-1], read_input()[-1]
+def star2(parsed) -> int:
+    data,operators = parsed[:-1], parsed[-1]
     data = list(zip_longest(*data, fillvalue=' '))
     ceph_operator = [list(g) for is_sep, g in groupby(operators, key=lambda x: all(c == ' ' for c in x)) if not is_sep]
     ceph_operator = [x[0] for x in reversed(ceph_operator)]
@@ -76,5 +81,6 @@ def star2() -> int:
 
 
 if __name__ == "__main__":
-    print(f"Star 1: {star1()}")
-    print(f"Star 2: {star2()}")
+    parsed = parse(read_input(split=False))
+    print(f"Star 1: {star1(parsed)}")
+    print(f"Star 2: {star2(parsed)}")
@@ -0,0 +1,25 @@
+"""Synthetic input generator for 2025 day 6: a cephalopod math worksheet."""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generate 1000 * scale problems of four numbers with + or * beneath.
+
+    Each problem is a block of columns as wide as its longest number, with
+    its numbers all left- or all right-aligned, and blocks separated by a
+    column of spaces. Numbers are ordered by length so every column reads
+    as one unbroken run of digits. The first problem's widest number comes
+    first so no leading spaces get stripped.
+    """
+    rng = random.Random(seed)
+    rows = [[] for _ in range(5)]
+    for i in range(1000 * scale):
+        numbers = sorted((str(rng.randint(1, 9999)) for _ in range(4)), key=len,
+                         reverse=i == 0 or rng.random() < 0.5)
+        width = len(max(numbers, key=len))
+        left = rng.random() < 0.5
+        for row, number in zip(rows, numbers):
+            row.append(number.ljust(width) if left else number.rjust(width))
+        rows[4].append(rng.choice("+*").ljust(width))
+    return "\n".join(" ".join(row) for row in rows)
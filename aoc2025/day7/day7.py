@@ -1,4 +1,5 @@
-from aoc2025.utils.utils import read_input
+from aoc2025.utils.utils import BitGrid, Grid, lazy_import, read_input
+np = lazy_import("numpy")
 tachyon_splitter = '^'
 
 
@@ -6,6 +7,9 @@ def solve_tachyon_manifold(manifold_diagram):
     """
     Simulates the tachyon beam paths and counts the total number of splits.
 
+    Beams are tracked as one int bitmask over the columns (see
+    utils.BitGrid) and advanced one row at a time with bit operations.
+
     Args:
         manifold_diagram: A list of strings representing the grid (puzzle input).
 
@@ -15,69 +19,25 @@ def solve_tachyon_manifold(manifold_diagram):
     if not manifold_diagram:
         return 0
 
-    # 1. Initialization and Setup
-
-    # R is the number of rows, C is the number of columns
-    R = len(manifold_diagram)
-    C = len(manifold_diagram[0])
-
-    # Find the starting column (S is guaranteed to be in the first row, R=0)
-    try:
-        start_col = manifold_diagram[0].index('S')
-    except ValueError:
-        # Handle case where 'S' is not found (though unlikely for puzzle input)
+    # S is guaranteed to be in the first row
+    start = manifold_diagram[0].find('S')
+    if start == -1:
         return 0
 
-    # Use a set to track the columns of beams active in the *current* row.
-    # This automatically handles merging beams.
-    active_beam_cols = {start_col}
+    empty = BitGrid.from_lines(manifold_diagram, '.')
+    splitters = BitGrid.from_lines(manifold_diagram, tachyon_splitter)
+    full = (1 << empty.width) - 1
+    beams = 1 << start
     total_splits = 0
 
-    # 2. Simulation (Row-by-Row)
-
-    # Start from the second row (index 1), as the beam enters from row 0
-    # and immediately affects row 1, and proceed to the last row (R-1).
-    for r in range(1, R):
-
-        # This set holds the column indices for beams that will be active
-        # in the *next* row (r + 1).
-        next_beam_cols = set()
-
-        # Check all beams that made it to the current row (r)
-        for c in active_beam_cols:
-
-            # The current cell content
-            cell = manifold_diagram[r][c]
-
-            if cell == '.':
-                # Case 1: Empty space ('.'). Beam passes through.
-                # It continues straight down to the next row at column c.
-                next_beam_cols.add(c)
-
-            elif cell == '^':
-                # Case 2: Splitter ('^').
-
-                # The beam is split! Increment the counter.
-                total_splits += 1
+    # The beam enters from row 0 and is first affected by row 1
+    for r in range(1, empty.height):
+        hit = beams & splitters.row(r)
+        total_splits += hit.bit_count()
 
-                # Check for the left-emerging beam (c - 1)
-                left_col = c - 1
-                if left_col >= 0:
-                    # If the column is within bounds, add it to the next row's beams
-                    next_beam_cols.add(left_col)
-
-                # Check for the right-emerging beam (c + 1)
-                right_col = c + 1
-                if right_col < C:
-                    # If the column is within bounds, add it to the next row's beams
-                    next_beam_cols.add(right_col)
-
-            # Note: Any beams hitting the boundaries of the manifold
-            # (either c-1 < 0 or c+1 >= C for a split) simply stop.
-            # Any beams hitting the bottom (r == R-1) also stop naturally.
-
-        # Update the active beams for the next iteration (row r+1)
-        active_beam_cols = next_beam_cols
+        # Beams pass through empty cells; a split emits left and right, and
+        # beams leaving the sides simply stop. Overlapping beams merge.
+        beams = (beams & empty.row(r)) | (hit >> 1) | ((hit << 1) & full)
 
     return total_splits
 
@@ -86,6 +46,9 @@ def solve_quantum_manifold(manifold_diagram):
     """
     Calculates the total number of unique timelines by tracking all possible paths.
 
+    Timeline counts per column are kept in one vector that is propagated a
+    row at a time, so only the current row is ever stored.
+
     Args:
         manifold_diagram: A list of strings representing the grid (puzzle input).
 
@@ -95,65 +58,32 @@ def solve_quantum_manifold(manifold_diagram):
     if not manifold_diagram:
         return 0
 
-    R = len(manifold_diagram)
-    C = len(manifold_diagram[0])
-
-    # 1. Find Start Column and Initialize DP Table
-    try:
-        start_col = manifold_diagram[0].index('S')
-    except ValueError:
+    grid = Grid.from_lines(manifold_diagram)
+    start = grid.find('S')
+    if start is None or start[1] != 0:
         return 0
-
-    # Initialize Timelines grid: Timelines[r][c] stores the count of timelines
-    # that reach column 'c' in row 'r'.
-    # We only need to track the current row (r) and the next row (r+1)
-    # for memory efficiency, but a full grid is often easier to debug.
-    timelines = [[0] * C for _ in range(R)]
-
-    # Base Case: The single particle timeline starts from S and reaches
-    # the first processing row (r=1) at the start column.
-    if R > 1:
-        timelines[1][start_col] = 1
-    elif R == 1:
+    if grid.height == 1:
         # If the manifold is only one row, the particle is already at the end.
         return 1
 
-        # 2. Iteration and Propagation (Dynamic Programming)
-    # Start from row 1 and proceed up to the second-to-last row (R-2),
-    # as propagation from R-2 affects the final row R-1.
-    for r in range(1, R - 1):
-        for c in range(C):
-
-            # Only process if timelines actually reach this cell
-            if timelines[r][c] == 0:
-                continue
-
-            num_timelines_here = timelines[r][c]
-            cell = manifold_diagram[r][c]
-
-            if cell == '.':
-                # Empty space: Timelines propagate straight down
-                timelines[r + 1][c] += num_timelines_here
-
-            elif cell == '^':
-                # Splitter: Timelines split to left and right
+    empty, splitters = grid.mask('.'), grid.mask(tachyon_splitter)
+    # Each row of splitters can at most double the count; beyond 62 of them
+    # int64 could overflow, so fall back to Python ints
+    dtype = np.int64 if int(splitters.any(axis=1).sum()) < 62 else object
 
-                # Propagate to Left (c - 1)
-                left_col = c - 1
-                if left_col >= 0:
-                    timelines[r + 1][left_col] += num_timelines_here
+    # The single timeline starts at S and reaches row 1 at the start column
+    timelines = np.zeros(grid.width, dtype=dtype)
+    timelines[start[0]] = 1
+    for r in range(1, grid.height - 1):
+        split = np.where(splitters[r], timelines, 0)
+        next_timelines = np.where(empty[r], timelines, 0)
+        next_timelines[:-1] += split[1:]
+        next_timelines[1:] += split[:-1]
+        timelines = next_timelines
 
-                # Propagate to Right (c + 1)
-                right_col = c + 1
-                if right_col < C:
-                    timelines[r + 1][right_col] += num_timelines_here
+    return int(timelines.sum())
 
-    # 3. Final Answer
-    # The total number of timelines is the sum of all timeline counts
-    # in the last row (R-1).
-    total_timelines = sum(timelines[R - 1])
 
-    return total_timelines
 def star1() -> int:
     data = read_input()
     result = solve_tachyon_manifold(data)
@@ -0,0 +1,22 @@
+"""Synthetic input generator for 2025 day 7: a tachyon manifold diagram."""
+import math
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generate a manifold of about 142 * 141 * scale cells.
+
+    "S" sits in the middle of the top row, and every other row holds
+    splitters ("^") with a density of about one in five cells.
+    """
+    rng = random.Random(seed)
+    factor = math.sqrt(scale)
+    height, width = round(142 * factor), round(141 * factor) | 1
+    lines = ["." * (width // 2) + "S" + "." * (width // 2)]
+    for r in range(1, height):
+        if r % 2:
+            lines.append("." * width)
+        else:
+            lines.append("".join(rng.choices("^.", weights=(1, 4), k=width)))
+    return "\n".join(lines)
@@ -0,0 +1,11 @@
+"""Synthetic input generator for 2025 day 8: junction box coordinates."""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """Generate 1000 * scale distinct "x,y,z" points in [0, 100000)^3."""
+    rng = random.Random(seed)
+    points = set()
+    while len(points) < 1000 * scale:
+        points.add(tuple(rng.randrange(100_000) for _ in range(3)))
+    return "\n".join(f"{x},{y},{z}" for x, y, z in points)
@@ -0,0 +1,37 @@
+"""Synthetic input generator for 2025 day 9: a rectilinear loop of red tiles."""
+import random
+
+
+def _profile(rng: random.Random, count: int, low: int, high: int):
+    """Random heights where neighbours always differ."""
+    heights = [rng.randint(low, high)]
+    while len(heights) < count:
+        height = rng.randint(low, high)
+        if height != heights[-1]:
+            heights.append(height)
+    return heights
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    """
+    Generate a simple rectilinear polygon of about 500 * scale vertices.
+
+    The polygon is x-monotone: a random top profile is traced left to right
+    and a random bottom profile right to left, so consecutive vertices
+    always share an x or a y coordinate and the loop never crosses itself.
+    """
+    rng = random.Random(seed)
+    columns = max(2, 500 * scale // 4)
+    xs = sorted(rng.sample(range(1, 100_000 * scale), columns + 1))
+    top = _profile(rng, columns, 50_001, 99_999)
+    bottom = _profile(rng, columns, 1, 49_999)
+
+    points = [(xs[0], top[0])]
+    for i in range(columns):
+        points.append((xs[i + 1], top[i]))
+        if i + 1 < columns:
+            points.append((xs[i + 1], top[i + 1]))
+    for i in reversed(range(columns)):
+        points.append((xs[i + 1], bottom[i]))
+        points.append((xs[i], bottom[i]))
+    return "\n".join(f"{x},{y}" for x, y in points)
@@ -0,0 +1,3 @@
+"""Compact graphs and union-find for Advent of Code 2025, see aoc_utils.graph"""
+
+from aoc_utils.graph import *  # noqa: F403
@@ -0,0 +1 @@
+"""Utilities shared by every year's aocYYYY.utils package"""
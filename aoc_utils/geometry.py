@@ -0,0 +1,167 @@
+"""
+Array-based geometry for Advent of Code
+
+Coordinate compression maps huge, sparse integer coordinates onto a small
+grid, optionally keeping a gap cell wherever coordinates skip values so
+the compressed shape keeps the real geometry. Rectilinear polygons are
+rasterized into boolean NumPy arrays with difference arrays and a parity
+scan, and connected components are labeled with the array-backed
+DisjointSet, so nothing walks the grid cell by cell in Python.
+"""
+
+from typing import Sequence, Tuple
+
+from .graph import DisjointSet
+from .utils import lazy_import
+
+np = lazy_import("numpy")
+
+
+def compress(values: Sequence[int],
+             gaps: bool = False) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Map integer coordinates onto consecutive cell indices.
+
+    Args:
+        values: Coordinates along one axis, e.g. every vertex's x
+        gaps: Insert one cell for each run of skipped values between two
+            coordinates, so shapes that don't touch in the original space
+            don't touch when compressed (default: False)
+
+    Returns:
+        Tuple of (cells, index): cells[i] is the first original coordinate
+        cell i covers, index[k] is the cell of values[k]
+    """
+    values = np.asarray(values)
+    unique = np.unique(values)
+    positions = np.arange(len(unique))
+    if gaps and len(unique) > 1:
+        skipped = np.diff(unique) > 1
+        positions[1:] += np.cumsum(skipped)
+        cells = np.empty(positions[-1] + 1, dtype=unique.dtype)
+        cells[positions[:-1][skipped] + 1] = unique[:-1][skipped] + 1
+    else:
+        cells = np.empty(len(unique), dtype=unique.dtype)
+    cells[positions] = unique
+    return cells, positions[np.searchsorted(unique, values)]
+
+
+def rasterize_polygon(xs: Sequence[int], ys: Sequence[int], width: int,
+                      height: int) -> "np.ndarray":
+    """
+    Fill a rectilinear polygon, boundary included, into a boolean grid.
+
+    Edges are drawn with difference arrays and the interior is found by
+    the crossing parity of a ray from the left, counted with cumulative
+    sums, so the cost is a handful of array passes over the grid.
+
+    Args:
+        xs: Vertex columns, in order around the polygon (it is closed
+            from the last vertex back to the first)
+        ys: Vertex rows, in the same order
+        width: Grid width
+        height: Grid height
+
+    Returns:
+        Boolean array of shape (height, width), True on and inside the
+        polygon
+
+    Raises:
+        ValueError: If two consecutive vertices are not in one row or column
+    """
+    x1, y1 = np.asarray(xs), np.asarray(ys)
+    x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+    vertical, horizontal = x1 == x2, y1 == y2
+    if not (vertical | horizontal).all():
+        i = int(np.flatnonzero(~(vertical | horizontal))[0])
+        raise ValueError("Non-axis-aligned segment between points: "
+                         f"{(int(x1[i]), int(y1[i]))} -> {(int(x2[i]), int(y2[i]))}")
+
+    top, bottom = np.minimum(y1, y2)[vertical], np.maximum(y1, y2)[vertical]
+    column = x1[vertical]
+    left, right = np.minimum(x1, x2)[horizontal], np.maximum(x1, x2)[horizontal]
+    row = y1[horizontal]
+
+    # Boundary: +1 where a segment starts, -1 just past where it ends. Any
+    # cell is covered by at most a few edges, so int8 counts are plenty
+    down = np.zeros((height + 1, width), dtype=np.int8)
+    np.add.at(down, (top, column), 1)
+    np.add.at(down, (bottom + 1, column), -1)
+    filled = down.cumsum(axis=0, dtype=np.int8)[:height] > 0
+    del down
+    across = np.zeros((height, width + 1), dtype=np.int8)
+    np.add.at(across, (row, left), 1)
+    np.add.at(across, (row, right + 1), -1)
+    filled |= across.cumsum(axis=1, dtype=np.int8)[:, :width] > 0
+    del across
+
+    # A row crosses the vertical edges spanning [top, bottom), so a ray
+    # through a vertex counts it once; a cell with an odd number of
+    # crossings to its left is inside. Only parity matters, so the sums
+    # may wrap around in uint8
+    spans = np.zeros((height + 1, width), dtype=np.uint8)
+    np.add.at(spans, (top, column), 1)
+    np.add.at(spans, (bottom, column), 255)
+    crossings = spans.cumsum(axis=0, dtype=np.uint8)[:height]
+    del spans
+    parity = crossings.cumsum(axis=1, dtype=np.uint8)
+    parity -= crossings
+    parity &= 1
+    filled |= parity.view(bool)
+    return filled
+
+
+def label_components(mask: "np.ndarray",
+                     diagonal: bool = False) -> Tuple["np.ndarray", int]:
+    """
+    Label the connected regions of True cells.
+
+    Every pair of neighboring True cells becomes an edge of one batch
+    DisjointSet.union_many call, so there is no recursion and no per-cell
+    Python loop.
+
+    Args:
+        mask: 2-D boolean array
+        diagonal: Connect diagonal neighbors too (default: False)
+
+    Returns:
+        Tuple of (labels, count): an int32 array of mask's shape with 0 for
+        False cells and 1..count for the regions
+    """
+    mask = np.asarray(mask, dtype=bool)
+    h, w = mask.shape
+    ids = np.arange(h * w, dtype=np.int32).reshape(h, w)
+    offsets = [(0, 1), (1, 0)] + ([(1, 1), (1, -1)] if diagonal else [])
+
+    edges = []
+    for dy, dx in offsets:
+        lo, hi = max(0, -dx), w - max(0, dx)
+        joined = mask[:h - dy, lo:hi] & mask[dy:, lo + dx:hi + dx]
+        edges.append(np.stack([ids[:h - dy, lo:hi][joined],
+                               ids[dy:, lo + dx:hi + dx][joined]], axis=1))
+
+    dsu = DisjointSet(h * w)
+    dsu.union_many(np.concatenate(edges))
+    roots = dsu.labels().reshape(h, w)
+
+    labels = np.zeros((h, w), dtype=np.int32)
+    unique, inverse = np.unique(roots[mask], return_inverse=True)
+    labels[mask] = inverse + 1
+    return labels, len(unique)
+
+
+def fill_outside(walls: "np.ndarray", diagonal: bool = False) -> "np.ndarray":
+    """
+    Find the open cells connected to the grid border.
+
+    Args:
+        walls: 2-D boolean array, True where movement is blocked
+        diagonal: Also move diagonally (default: False)
+
+    Returns:
+        Boolean array that is True on every open cell reachable from outside
+    """
+    open_cells = ~np.asarray(walls, dtype=bool)
+    labels, _ = label_components(open_cells, diagonal)
+    border = np.concatenate([labels[0], labels[-1], labels[:, 0], labels[:, -1]])
+    return np.isin(labels, border[border > 0])
@@ -0,0 +1,403 @@
+"""
+Compact directed graphs for Advent of Code
+
+Node names are interned to consecutive ints and adjacency is stored in CSR
+form: one flat array of edge targets plus an offsets array, so a node's
+successors are targets[offsets[n]:offsets[n + 1]]. With 4-byte ints a graph
+with millions of edges takes a few megabytes instead of a dict of lists.
+Every traversal is iterative, so deep graphs need no recursion-limit hacks.
+DisjointSet keeps union-find forests in the same flat int arrays.
+"""
+
+from array import array
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from .utils import lazy_import
+
+np = lazy_import("numpy")
+
+
+class Graph:
+    """
+    Directed graph with interned node names, optional edge weights and
+    CSR adjacency that is built on first use after edges are added.
+    """
+
+    def __init__(self) -> None:
+        self.names: List[Hashable] = []
+        self.ids: Dict[Hashable, int] = {}
+        self._sources = array("i")
+        self._targets = array("i")
+        self._weights = array("q")
+        self._csr: Optional[Tuple[array, array, array]] = None
+
+    @classmethod
+    def from_adjacency(cls, adjacency: Dict[Hashable, Iterable[Hashable]]) -> "Graph":
+        """
+        Build a graph from a mapping of node to successors.
+
+        Args:
+            adjacency: e.g. {"svr": ["aaa", "bbb"], ...}
+
+        Returns:
+            Graph with an edge of weight 1 per listed successor
+        """
+        graph = cls()
+        for source, targets in adjacency.items():
+            for target in targets:
+                graph.add_edge(source, target)
+        return graph
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Sequence], undirected: bool = False) -> "Graph":
+        """
+        Build a graph from (source, target) or (source, target, weight) tuples.
+
+        Args:
+            edges: Edge tuples
+            undirected: Also add every edge in the reverse direction
+                (default: False)
+
+        Returns:
+            The graph
+        """
+        graph = cls()
+        for edge in edges:
+            weight = edge[2] if len(edge) > 2 else 1
+            graph.add_edge(edge[0], edge[1], weight)
+            if undirected:
+                graph.add_edge(edge[1], edge[0], weight)
+        return graph
+
+    def node(self, name: Hashable) -> int:
+        """Return the int id of a node name, interning it if it's new."""
+        node_id = self.ids.get(name)
+        if node_id is None:
+            node_id = self.ids[name] = len(self.names)
+            self.names.append(name)
+            self._csr = None
+        return node_id
+
+    def add_edge(self, source: Hashable, target: Hashable, weight: int = 1) -> None:
+        """Add a directed edge between two node names."""
+        self._sources.append(self.node(source))
+        self._targets.append(self.node(target))
+        self._weights.append(weight)
+        self._csr = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _build(self) -> Tuple[array, array, array]:
+        """Counting-sort the edge list by source into CSR arrays."""
+        if self._csr is None:
+            n = len(self.names)
+            offsets = array("i", [0]) * (n + 1)
+            for source in self._sources:
+                offsets[source + 1] += 1
+            for i in range(n):
+                offsets[i + 1] += offsets[i]
+
+            fill = offsets[:-1]
+            targets = array("i", [0]) * len(self._targets)
+            weights = array("q", [0]) * len(self._weights)
+            edges = zip(self._sources, self._targets, self._weights)
+            for source, target, weight in edges:
+                slot = fill[source]
+                targets[slot], weights[slot] = target, weight
+                fill[source] = slot + 1
+            self._csr = (offsets, targets, weights)
+        return self._csr
+
+    def successors(self, node_id: int) -> array:
+        """Ids of the nodes a node has edges to."""
+        offsets, targets, _ = self._build()
+        return targets[offsets[node_id]:offsets[node_id + 1]]
+
+    def edges(self, node_id: int) -> List[Tuple[int, int]]:
+        """(target id, weight) of each edge leaving a node."""
+        offsets, targets, weights = self._build()
+        start, stop = offsets[node_id], offsets[node_id + 1]
+        return list(zip(targets[start:stop], weights[start:stop]))
+
+    def reachable(self, source: int) -> List[bool]:
+        """Flags marking every node reachable from source (including it)."""
+        offsets, targets, _ = self._build()
+        seen = [False] * len(self.names)
+        seen[source] = True
+        stack = [source]
+        while stack:
+            node = stack.pop()
+            for i in range(offsets[node], offsets[node + 1]):
+                target = targets[i]
+                if not seen[target]:
+                    seen[target] = True
+                    stack.append(target)
+        return seen
+
+    def topological_order(self, source: Optional[int] = None) -> List[int]:
+        """
+        Order the nodes so every edge points forward (Kahn's algorithm).
+
+        Args:
+            source: Only order the nodes reachable from this one
+                (default: the whole graph)
+
+        Returns:
+            Node ids in topological order
+
+        Raises:
+            ValueError: If the (reachable) graph has a cycle
+        """
+        offsets, targets, _ = self._build()
+        n = len(self.names)
+        included = self.reachable(source) if source is not None else [True] * n
+
+        indegree = [0] * n
+        for node in range(n):
+            if included[node]:
+                for i in range(offsets[node], offsets[node + 1]):
+                    indegree[targets[i]] += 1
+
+        queue = deque(node for node in range(n)
+                      if included[node] and indegree[node] == 0)
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for i in range(offsets[node], offsets[node + 1]):
+                target = targets[i]
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    queue.append(target)
+
+        if len(order) != sum(included):
+            raise ValueError("Graph has a cycle, no topological order exists")
+        return order
+
+    def strongly_connected_components(self) -> List[List[int]]:
+        """
+        Find the strongly connected components with an iterative Tarjan.
+
+        Returns:
+            Components as lists of node ids, in reverse topological order of
+            the condensed graph (sinks first)
+        """
+        offsets, targets, _ = self._build()
+        n = len(self.names)
+        index = [-1] * n
+        low = [0] * n
+        on_stack = [False] * n
+        stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            # Each frame is (node, position of the next edge to explore)
+            work = [(root, offsets[root])]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+
+            while work:
+                node, edge = work[-1]
+                if edge < offsets[node + 1]:
+                    work[-1] = (node, edge + 1)
+                    target = targets[edge]
+                    if index[target] == -1:
+                        index[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack[target] = True
+                        work.append((target, offsets[target]))
+                    elif on_stack[target]:
+                        low[node] = min(low[node], index[target])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+        return components
+
+    def count_paths(self, source: Hashable, target: Hashable,
+                    through: Iterable[Hashable] = ()) -> int:
+        """
+        Count the distinct paths from source to target with a DAG DP.
+
+        Runs in O((V + E) * 2^k) for k required nodes instead of enumerating
+        paths, so counts far beyond what could be listed are fine.
+
+        Args:
+            source: Start node name
+            target: End node name
+            through: Node names every counted path must visit (default: none)
+
+        Returns:
+            Number of paths, 0 if either end is unknown or a cycle is
+            reachable from source (as day11's recursive search did)
+        """
+        if source not in self.ids or target not in self.ids:
+            return 0
+        through = list(dict.fromkeys(through))
+        if any(name not in self.ids for name in through):
+            return 0
+        required = {self.ids[name]: 1 << bit for bit, name in enumerate(through)}
+
+        offsets, targets, _ = self._build()
+        start, end = self.ids[source], self.ids[target]
+        full = (1 << len(required)) - 1
+        # ways[node][mask]: paths from source to node that saw exactly `mask`
+        ways: Dict[int, List[int]] = {start: [0] * (full + 1)}
+        ways[start][required.get(start, 0)] = 1
+
+        try:
+            order = self.topological_order(start)
+        except ValueError:
+            return 0
+        for node in order:
+            counts = ways.pop(node, None)
+            if counts is None:
+                continue
+            if node == end:
+                return counts[full]
+            for i in range(offsets[node], offsets[node + 1]):
+                succ = targets[i]
+                bit = required.get(succ, 0)
+                succ_counts = ways.get(succ)
+                if succ_counts is None:
+                    succ_counts = ways[succ] = [0] * (full + 1)
+                for mask, count in enumerate(counts):
+                    if count:
+                        succ_counts[mask | bit] += count
+        return 0
+
+
+class DisjointSet:
+    """
+    Union-find over the ints 0..n-1 with path halving and union by size.
+
+    Parents and sizes live in array('i') buffers, which NumPy can view
+    without copying, so batch unions and label export are vectorized.
+    """
+
+    def __init__(self, n: int) -> None:
+        self.parent = array("i", range(n))
+        self.size = array("i", [1]) * n
+        self.components = n
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, i: int) -> int:
+        """Return the root of i's set, halving the path on the way."""
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = i = parent[parent[i]]
+        return i
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Merge the sets of a and b, hanging the smaller tree under the larger.
+
+        Returns:
+            True if they were in different sets, False if already joined
+        """
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        self.components -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        """Return True if a and b are in the same set."""
+        return self.find(a) == self.find(b)
+
+    def size_of(self, i: int) -> int:
+        """Number of elements in i's set."""
+        return self.size[self.find(i)]
+
+    def component_sizes(self) -> List[int]:
+        """Sizes of every set, read off the roots without touching members."""
+        return [size for i, (parent, size) in enumerate(zip(self.parent, self.size))
+                if parent == i]
+
+    def _flatten(self):
+        """Point every element straight at its root; returns a NumPy view of parent."""
+        parent = np.frombuffer(self.parent, dtype=np.int32)
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                return parent
+            parent[:] = grandparent
+
+    def union_many(self, edges) -> int:
+        """
+        Merge the sets joined by a batch of edges at once.
+
+        Instead of one find per endpoint, every root is hooked under the
+        smallest root it is joined to, then pointer jumping flattens the
+        forest; this repeats until no edge crosses two sets. The result is
+        the same partition as calling union() edge by edge.
+
+        Args:
+            edges: (m, 2) array-like of element pairs
+
+        Returns:
+            Number of merges, i.e. how many fewer sets there are
+        """
+        edges = np.asarray(edges, dtype=np.int32).reshape(-1, 2)
+        if len(edges) == 0:
+            return 0
+        parent = self._flatten()
+        left, right = edges[:, 0], edges[:, 1]
+        while True:
+            a, b = parent[left], parent[right]
+            crossing = a != b
+            if not crossing.any():
+                break
+            a, b = a[crossing], b[crossing]
+            # Roots only ever point at smaller roots, so no cycles can form
+            np.minimum.at(parent, np.maximum(a, b), np.minimum(a, b))
+            parent = self._flatten()
+            left, right = left[crossing], right[crossing]
+
+        # Every element now hangs directly off its root, so sizes are a count
+        sizes = np.bincount(parent, minlength=len(parent))
+        np.frombuffer(self.size, dtype=np.int32)[:] = sizes
+        before = self.components
+        self.components = int(np.count_nonzero(parent == np.arange(len(parent))))
+        return before - self.components
+
+    def labels(self, dense: bool = False):
+        """
+        Export the set of every element as a NumPy array.
+
+        Args:
+            dense: Number the sets 0..k-1 instead of labelling by root id
+                (default: False)
+
+        Returns:
+            int array of length n
+        """
+        parent = self._flatten().copy()
+        if dense:
+            return np.unique(parent, return_inverse=True)[1]
+        return parent
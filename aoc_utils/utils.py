@@ -0,0 +1,1321 @@
+"""
+Utility functions for Advent of Code
+
+Shared by every year: aocYYYY/utils/utils.py re-exports this module, so
+days keep importing from their own year's package.
+"""
+
+import functools
+import importlib.util
+import inspect
+import mmap
+import multiprocessing
+import operator
+import os
+import re
+import sys
+from multiprocessing import shared_memory
+from pathlib import Path
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+
+class _MissingModule(ModuleType):
+    """Placeholder for an uninstalled lazy import; fails only when used."""
+
+    def __getattr__(self, attr: str) -> Any:
+        raise ModuleNotFoundError(f"No module named '{self.__name__}'",
+                                  name=self.__name__)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module lazily, deferring its load until first attribute access.
+
+    Lets a day import a heavy dependency (numpy, z3) at module level without
+    paying for it when only the star that doesn't need it runs.
+
+    Args:
+        name: Fully qualified module name
+
+    Returns:
+        The module, already loaded or loading on first use
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        return _MissingModule(name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# Only the Grid helpers need numpy, so don't pay for importing it otherwise
+np = lazy_import("numpy")
+
+
+# Reads (year, day, variant) from wherever the runner keeps inputs that
+# aren't loose files; raises FileNotFoundError if it has none
+StoredInputReader = Callable[[int, int, str], Union[bytes, memoryview]]
+_stored_input_reader: Optional[StoredInputReader] = None
+
+
+def set_stored_input_reader(reader: Optional[StoredInputReader]) -> None:
+    """
+    Let the input readers fall back to an input store.
+
+    When a day's input file doesn't exist, read_input and friends ask this
+    reader for it instead; the runner installs one backed by its store.
+
+    Args:
+        reader: Function (year, day, variant) -> bytes or memoryview,
+            raising FileNotFoundError for unknown inputs; None to disable
+    """
+    global _stored_input_reader
+    _stored_input_reader = reader
+
+
+def _read_stored_bytes(day_dir: Path,
+                       filename: str) -> Optional[Union[bytes, memoryview]]:
+    """Fetch aocYYYY/dayN/<filename> from the installed input store reader."""
+    year_name, day_name = day_dir.parent.name, day_dir.name
+    if _stored_input_reader is None or not (
+            year_name[3:].isdigit() and year_name.startswith("aoc")
+            and day_name[3:].isdigit() and day_name.startswith("day")):
+        return None
+    try:
+        return _stored_input_reader(int(year_name[3:]), int(day_name[3:]),
+                                    Path(filename).stem)
+    except FileNotFoundError:
+        return None
+
+
+def _read_stored_input(day_dir: Path, filename: str) -> Optional[str]:
+    """Fetch aocYYYY/dayN/<filename> from the shared input store, if stored there."""
+    data = _read_stored_bytes(day_dir, filename)
+    return None if data is None else bytes(data).decode()
+
+
+def _input_path(filename: str, test: bool) -> Path:
+    """
+    Resolve an input file relative to the script calling the public reader.
+
+    Args:
+        filename: Name of the file to read
+        test: If True, read test.txt instead
+
+    Returns:
+        Path inside the caller's day folder (it may not exist)
+    """
+    # Two frames up: past the public reader to the day script itself
+    frame = inspect.currentframe()
+    if frame is None or frame.f_back is None or frame.f_back.f_back is None:
+        raise RuntimeError("Unable to determine caller's file path")
+
+    caller_file = frame.f_back.f_back.f_globals.get("__file__")
+    if caller_file is None:
+        raise RuntimeError("Unable to determine caller's file path")
+
+    # If test=True, override filename to test.txt
+    if test:
+        filename = "test.txt"
+    elif filename == "input.txt" and os.getenv("AOC_INPUT_VARIANT"):
+        # The runner can swap in another input, e.g. a generated one
+        filename = f"{os.getenv('AOC_INPUT_VARIANT')}.txt"
+
+    return Path(caller_file).parent / filename
+
+
+def _map_file(path: Path) -> memoryview:
+    """Memory-map a file read-only; the mapping is freed with the view."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(b"")
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def _buffer_lines(buffer: Union[bytes, mmap.mmap]) -> Iterator[bytes]:
+    """Yield the lines of a bytes object or mmap, copying one line at a time."""
+    start, end = 0, len(buffer)
+    while start < end:
+        stop = buffer.find(b"\n", start)
+        if stop == -1:
+            stop = end
+        yield buffer[start:stop + 1]
+        start = stop + 1
+
+
+def _file_lines(path: Path, use_mmap: bool) -> Iterator[bytes]:
+    if use_mmap:
+        yield from _buffer_lines(_map_file(path).obj)
+    else:
+        with open(path, "rb") as f:
+            yield from f
+
+
+def _trimmed_lines(lines: Iterable[bytes],
+                   as_bytes: bool) -> Iterator[Union[str, bytes]]:
+    """Drop line endings and leading/trailing blank lines, like read_input's strip()."""
+    started, blank_run = False, 0
+    for line in lines:
+        line = line.rstrip(b"\r\n")
+        if not line.strip():
+            # Only emit blank lines once a non-blank line follows them
+            blank_run += started
+            continue
+        for _ in range(blank_run):
+            yield b"" if as_bytes else ""
+        started, blank_run = True, 0
+        yield line if as_bytes else line.decode()
+
+
+def iter_input(filename: str = "input.txt", as_bytes: bool = False,
+               use_mmap: bool = False,
+               test: bool = False) -> Iterator[Union[str, bytes]]:
+    """
+    Lazily yield the lines of an input file relative to the calling script.
+
+    Unlike read_input, only one line is held in memory at a time, so days
+    that process lines independently run in constant memory on any input
+    size. Falls back to the shared input store like read_input.
+
+    Args:
+        filename: Name of the file to read (default: input.txt)
+        as_bytes: Yield bytes instead of decoded strings (default: False)
+        use_mmap: Scan a memory-mapped file instead of a buffered one
+            (default: False)
+        test: If True, read test.txt instead (default: False)
+
+    Returns:
+        Iterator over the lines, without line endings or leading/trailing
+        blank lines
+    """
+    file_path = _input_path(filename, test)
+    if file_path.exists():
+        lines = _file_lines(file_path, use_mmap)
+    else:
+        data = _read_stored_bytes(file_path.parent, file_path.name)
+        if data is None:
+            raise FileNotFoundError(f"Input file not found: {file_path}")
+        # Store reads of uncompressed blobs are memoryviews over an mmap
+        lines = _buffer_lines(data.obj if isinstance(data, memoryview) else data)
+    return _trimmed_lines(lines, as_bytes)
+
+
+def read_input_bytes(filename: str = "input.txt", test: bool = False) -> memoryview:
+    """
+    Read an input file relative to the calling script without copying it.
+
+    The file is memory-mapped, so the view costs no memory up front and
+    pages are loaded on demand. Unlike read_input, nothing is stripped.
+
+    Args:
+        filename: Name of the file to read (default: input.txt)
+        test: If True, read test.txt instead (default: False)
+
+    Returns:
+        Read-only memoryview over the file contents
+    """
+    file_path = _input_path(filename, test)
+    if file_path.exists():
+        return _map_file(file_path)
+    data = _read_stored_bytes(file_path.parent, file_path.name)
+    if data is None:
+        raise FileNotFoundError(f"Input file not found: {file_path}")
+    return data if isinstance(data, memoryview) else memoryview(data)
+
+
+def read_input(filename: str = "input.txt", split: bool = True, split_by: str = "\n",
+               test: bool = False) -> Union[str, List[str]]:
+    """
+    Read input file relative to the calling script.
+
+    Falls back to the shared input store (see input_store.py) when the file
+    is not in the day folder. For large inputs see iter_input and
+    read_input_bytes, which avoid holding several copies in memory.
+
+    Args:
+        filename: Name of the file to read (default: input.txt)
+        split: Whether to split by newlines (default: True)
+        test: If True, read test.txt instead (default: False)
+
+    Returns:
+        String or list of strings depending on split parameter
+    """
+    file_path = _input_path(filename, test)
+
+    if file_path.exists():
+        content = file_path.read_text().strip()
+    else:
+        content = _read_stored_input(file_path.parent, file_path.name)
+        if content is None:
+            raise FileNotFoundError(f"Input file not found: {file_path}")
+        content = content.strip()
+
+    if split:
+        return content.split(split_by)
+    return content
+
+
+# Below this many lines, starting worker processes costs more than it saves
+PARALLEL_MIN_LINES = 2000
+# Set by the pool initializer in each worker: (func, reducer, shared memory)
+_WORKER_STATE: Optional[Tuple[Callable, Callable, shared_memory.SharedMemory]] = None
+
+
+def _init_worker(func: Callable, reducer: Callable, shm_name: str) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = (func, reducer, shared_memory.SharedMemory(name=shm_name))
+
+
+def _reduce_chunk(span: Tuple[int, int]) -> Any:
+    """Map and reduce the lines in one byte range of the shared input."""
+    func, reducer, shm = _WORKER_STATE
+    start, stop = span
+    lines = bytes(shm.buf[start:stop]).decode().split("\n")
+    return functools.reduce(reducer, map(func, (line.rstrip("\r") for line in lines)))
+
+
+def _content_span(buffer: Union[bytes, mmap.mmap]) -> Tuple[int, int]:
+    """Byte range of buffer without its leading and trailing blank lines."""
+    start, end = 0, len(buffer)
+    while start < end:
+        stop = buffer.find(b"\n", start, end)
+        stop = end if stop == -1 else stop
+        if buffer[start:stop].strip():
+            break
+        start = stop + 1
+    while end > start:
+        line_start = buffer.rfind(b"\n", start, end) + 1
+        if buffer[line_start:end].strip():
+            break
+        end = max(line_start - 1, start)
+    return start, end
+
+
+def _has_lines(buffer: Union[bytes, mmap.mmap], start: int, end: int,
+               count: int) -> bool:
+    """Whether buffer[start:end] holds at least `count` lines, without counting all."""
+    if start >= end:
+        return False
+    pos = start
+    for _ in range(count - 1):
+        pos = buffer.find(b"\n", pos, end) + 1
+        if pos == 0:
+            return False
+    return True
+
+
+def _line_spans(buffer: Union[bytes, mmap.mmap], start: int, end: int,
+                chunks: int) -> List[Tuple[int, int]]:
+    """
+    Split buffer[start:end] into about `chunks` ranges, each ending at a line
+    break, as offsets from start.
+    """
+    spans = []
+    size, pos = end - start, start
+    for k in range(1, chunks + 1):
+        stop = (end if k == chunks
+                else buffer.find(b"\n", max(pos, start + size * k // chunks), end))
+        if stop == -1:
+            stop = end
+        spans.append((pos - start, stop - start))
+        pos = stop + 1
+        if pos > end:
+            break
+    return spans
+
+
+def _usable_cpus() -> int:
+    """Number of CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def parallel_map_reduce(func: Callable[[str], Any],
+                        source: Union[Sequence[str], bytes, memoryview],
+                        reducer: Callable[[Any, Any], Any] = operator.add,
+                        initial: Any = None, workers: Optional[int] = None,
+                        chunks_per_worker: int = 4,
+                        min_lines: int = PARALLEL_MIN_LINES) -> Any:
+    """
+    Apply func to every line and fold the results, sharded across processes.
+
+    For days whose lines are independent (one box, bank or machine per
+    line). Pass the input as read_input_bytes() to keep it out of Python
+    memory: it is split into chunks by byte offsets, copied once into shared
+    memory and each worker decodes only its own chunk, or it is streamed
+    line by line when run in-process, like iter_input. A list of lines such
+    as read_input() works too. Only the per-chunk results are pickled, and
+    chunks are folded in input order, so the reducer only needs to be
+    associative. Small or empty inputs, a single worker, or a daemonic
+    caller (which may not have children) run in-process.
+
+    Workers are forked where possible and inherit func, so lambdas and
+    functions of modules loaded from a file path work. Where only spawn is
+    available func and reducer must be picklable.
+
+    Args:
+        func: Function of one line (without its line break)
+        source: Input buffer, e.g. read_input_bytes() (leading and trailing
+            blank lines are skipped), or a sequence of lines
+        reducer: Associative function combining two results (default: +)
+        initial: Value to start folding from, returned for empty input
+            (default: None, fold from the first result)
+        workers: Number of processes (default: the usable CPU count)
+        chunks_per_worker: Chunks per process, so uneven lines balance out
+            (default: 4)
+        min_lines: Run in-process below this many lines; lower it when
+            each line is expensive (default: PARALLEL_MIN_LINES)
+
+    Returns:
+        reducer folded over func of every line
+
+    Raises:
+        TypeError: If source is neither a buffer nor a sequence, e.g. an
+            iterator such as iter_input()
+    """
+    if workers is None:
+        workers = _usable_cpus()
+    # Daemonic processes, such as pool workers, can't start children
+    can_fork = workers > 1 and not multiprocessing.current_process().daemon
+
+    buffer: Union[bytes, mmap.mmap]
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        # A full view over an mmap or bytes can be searched without copying
+        whole = isinstance(source, memoryview) and len(source) == len(source.obj)
+        buffer = source.obj if whole else bytes(source)
+        start, end = _content_span(buffer)
+        parallel = can_fork and _has_lines(buffer, start, end, min_lines)
+        lines: Iterable[str] = _trimmed_lines(_buffer_lines(buffer), as_bytes=False)
+    elif isinstance(source, Sequence):
+        parallel = (can_fork and len(source) >= min_lines
+                    and not any("\n" in line for line in source))
+        lines = source
+        if parallel:
+            buffer = "\n".join(source).encode()
+            start, end = 0, len(buffer)
+    else:
+        raise TypeError("parallel_map_reduce needs an input buffer such as"
+                        " read_input_bytes() or a sequence of lines,"
+                        f" not {type(source).__name__}")
+
+    if not parallel:
+        results = map(func, lines)
+    else:
+        spans = _line_spans(buffer, start, end, workers * chunks_per_worker)
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        shm = shared_memory.SharedMemory(create=True, size=end - start)
+        try:
+            with memoryview(buffer) as view:
+                shm.buf[:end - start] = view[start:end]
+            with context.Pool(min(workers, len(spans)), _init_worker,
+                              (func, reducer, shm.name)) as pool:
+                results = pool.map(_reduce_chunk, spans)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    if initial is None:
+        return functools.reduce(reducer, results)
+    return functools.reduce(reducer, results, initial)
+
+
+# Byte translation tables keeping digits (and optionally '-'), blanking the rest
+_DIGITS_ONLY = bytes(c if chr(c).isdigit() and c < 128 else 32 for c in range(256))
+_DIGITS_AND_MINUS = bytes(c if c == 45 else _DIGITS_ONLY[c] for c in range(256))
+# A '-' is a sign only when it starts a number and doesn't follow one ("11-22")
+_NON_SIGN_MINUS = re.compile(rb"(?<=\d)-|-(?!\d)")
+# Integers of 19+ digits may not fit in int64
+_LONG_TOKEN = re.compile(rb"\d{19}")
+
+
+def _int_tokens(text: Union[str, bytes, memoryview], negative: bool) -> bytes:
+    """Reduce text to whitespace-separated integer tokens in one translate pass."""
+    data = text.encode() if isinstance(text, str) else bytes(text)
+    data = data.translate(_DIGITS_AND_MINUS if negative else _DIGITS_ONLY)
+    if negative and b"-" in data:
+        data = _NON_SIGN_MINUS.sub(b" ", data)
+    return data
+
+
+def ints(text: Union[str, bytes, memoryview], negative: bool = True) -> List[int]:
+    """
+    Extract every integer from text in one pass, ignoring everything else.
+
+    "x=-3, y=12" gives [-3, 12]; a '-' between digits is a separator, so
+    the range "11-22" gives [11, 22].
+
+    Args:
+        text: Raw input, e.g. read_input(split=False) or read_input_bytes()
+        negative: Treat a leading '-' as a sign (default: True)
+
+    Returns:
+        List of integers in order of appearance
+    """
+    return list(map(int, _int_tokens(text, negative).split()))
+
+
+def int_matrix(text: Union[str, bytes, memoryview], columns: Optional[int] = None,
+               negative: bool = True) -> "np.ndarray":
+    """
+    Extract every integer from text straight into a NumPy int64 array.
+
+    The text is scanned in C (a byte translate plus np.fromstring), so a
+    million-line coordinate file parses in milliseconds. If any value
+    doesn't fit in int64, the result holds Python ints instead (dtype
+    object) rather than silently saturating.
+
+    Args:
+        text: Raw input, e.g. read_input(split=False) or read_input_bytes()
+        columns: Reshape to (rows, columns); if None, use the number of
+            integers on the first line
+        negative: Treat a leading '-' as a sign (default: True)
+
+    Returns:
+        2-D int64 (or object) array with one row per `columns` integers
+
+    Raises:
+        ValueError: If the integer count isn't a multiple of columns
+    """
+    data = _int_tokens(text, negative)
+    if columns is None:
+        raw = text if isinstance(text, str) else bytes(text)
+        first_line = raw.split("\n" if isinstance(raw, str) else b"\n", 1)[0]
+        columns = max(len(_int_tokens(first_line, negative).split()), 1)
+    if not data.strip():
+        return np.zeros((0, columns), dtype=np.int64)
+
+    if _LONG_TOKEN.search(data):
+        # np.fromstring clamps to the int64 range, so check long tokens in Python
+        tokens = [int(token) for token in data.split()]
+        try:
+            values = np.array(tokens, dtype=np.int64)
+        except OverflowError:
+            values = np.array(tokens, dtype=object)
+    else:
+        values = np.fromstring(data, dtype=np.int64, sep=" ")
+    if values.size % columns:
+        raise ValueError(f"Found {values.size} integers,"
+                         f" not a multiple of {columns} columns")
+    return values.reshape(-1, columns)
+
+
+def to_grid(data: Union[str, List[str]],
+            to_int: bool = False) -> List[List[Union[str, int]]]:
+    """
+    Convert string or list of strings to a 2D grid.
+
+    Args:
+        data: String or list of strings to convert
+        to_int: If True, convert each character to int (default: False)
+
+    Returns:
+        2D list representing the grid
+    """
+    if isinstance(data, str):
+        lines = data.split("\n")
+    else:
+        lines = data
+
+    if to_int:
+        return [[int(char) for char in line] for line in lines]
+    return [list(line) for line in lines]
+
+
+def grid_rotate(grid: List[List[Any]], times: int = 1) -> List[List[Any]]:
+    """
+    Rotate grid 90 degrees clockwise.
+
+    Copies the grid; GridView(grid).rotate(times) rotates without copying.
+
+    Args:
+        grid: 2D list to rotate
+        times: Number of times to rotate (default: 1)
+
+    Returns:
+        Rotated grid
+    """
+    times = times % 4  # Only need to rotate 0-3 times
+    result = [row[:] for row in grid]  # Copy grid
+
+    for _ in range(times):
+        result = [list(row) for row in zip(*reversed(result))]
+
+    return result
+
+
+def grid_get(grid: List[List[Any]], x: int, y: int, default: Any = ".") -> Any:
+    """
+    Safely get a value from the grid with boundary checking.
+
+    Args:
+        grid: 2D list to access
+        x: Column index
+        y: Row index
+        default: Value to return if out of bounds (default: ".")
+
+    Returns:
+        Value at grid[y][x] or default if out of bounds
+    """
+    if 0 <= y < len(grid) and 0 <= x < len(grid[y]):
+        return grid[y][x]
+    return default
+
+
+def grid_find(grid: List[List[Any]], target: Any) -> Optional[tuple[int, int]]:
+    """
+    Find the first occurrence of target in grid.
+
+    Args:
+        grid: 2D list to search
+        target: Value to find
+
+    Returns:
+        Tuple of (x, y) or None if not found
+    """
+    for y, row in enumerate(grid):
+        for x, cell in enumerate(row):
+            if cell == target:
+                return (x, y)
+    return None
+
+
+def grid_find_all(grid: List[List[Any]], target: Any) -> List[tuple[int, int]]:
+    """
+    Find all occurrences of target in grid.
+
+    Args:
+        grid: 2D list to search
+        target: Value to find
+
+    Returns:
+        List of (x, y) tuples
+    """
+    results = []
+    for y, row in enumerate(grid):
+        for x, cell in enumerate(row):
+            if cell == target:
+                results.append((x, y))
+    return results
+
+
+def grid_print(grid: List[List[Any]]) -> None:
+    """
+    Print a formatted grid to stdout.
+
+    Args:
+        grid: 2D list to print
+    """
+    for row in grid:
+        print("".join(str(cell) for cell in row))
+
+
+def _cell_code(value: Union[str, int]) -> int:
+    """Byte value a Grid stores for a one-character string (or an int as is)."""
+    return ord(value) if isinstance(value, str) else value
+
+
+class Grid:
+    """
+    Character grid backed by a 2-D uint8 NumPy array of byte values.
+
+    Coordinates follow the list-of-lists helpers above: (x, y) with x the
+    column. Rotations, flips and transposes return views, so they don't
+    copy the cells, and searches and neighbor counts are vectorized.
+    """
+
+    def __init__(self, cells: "np.ndarray"):
+        """
+        Wrap an existing array without copying it.
+
+        Args:
+            cells: 2-D array of byte values, e.g. from np.frombuffer
+        """
+        self.cells = np.asarray(cells, dtype=np.uint8)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], fill: str = " ") -> "Grid":
+        """
+        Build a grid from rows of text, padding ragged rows with fill.
+
+        Args:
+            lines: Rows of the grid, e.g. read_input()
+            fill: Character padding short rows (default: space)
+
+        Returns:
+            A new, writable grid
+        """
+        lines = list(lines)
+        width = max((len(line) for line in lines), default=0)
+        data = "".join(line.ljust(width, fill) for line in lines).encode("latin-1")
+        cells = np.frombuffer(data, dtype=np.uint8).reshape(len(lines), width)
+        return cls(cells.copy())
+
+    @classmethod
+    def from_text(cls, text: str, fill: str = " ") -> "Grid":
+        """Build a grid from newline-separated text, see from_lines."""
+        return cls.from_lines(text.split("\n"), fill)
+
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1]
+
+    def get(self, x: int, y: int, default: Any = ".") -> Any:
+        """Return the character at (x, y), or default if out of bounds."""
+        if 0 <= y < self.height and 0 <= x < self.width:
+            return chr(self.cells[y, x])
+        return default
+
+    def set(self, x: int, y: int, value: Union[str, int]) -> None:
+        """Set the cell at (x, y)."""
+        self.cells[y, x] = _cell_code(value)
+
+    def mask(self, target: Union[str, int]) -> "np.ndarray":
+        """Boolean array that is True where the cell equals target."""
+        return self.cells == _cell_code(target)
+
+    def count(self, target: Union[str, int]) -> int:
+        """Number of cells equal to target."""
+        return int(np.count_nonzero(self.mask(target)))
+
+    def find(self, target: Union[str, int]) -> Optional[tuple[int, int]]:
+        """
+        Find the first occurrence of target in row-major order.
+
+        Args:
+            target: Character (or byte value) to find
+
+        Returns:
+            Tuple of (x, y) or None if not found
+        """
+        hits = np.flatnonzero(self.mask(target))
+        if hits.size == 0:
+            return None
+        y, x = divmod(int(hits[0]), self.width)
+        return (x, y)
+
+    def find_all(self, target: Union[str, int]) -> List[tuple[int, int]]:
+        """
+        Find all occurrences of target in row-major order.
+
+        Args:
+            target: Character (or byte value) to find
+
+        Returns:
+            List of (x, y) tuples
+        """
+        ys, xs = np.nonzero(self.mask(target))
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def rotate(self, times: int = 1) -> "Grid":
+        """Rotate 90 degrees clockwise `times` times, as a view."""
+        return Grid(np.rot90(self.cells, -times))
+
+    def transpose(self) -> "Grid":
+        """Swap rows and columns, as a view."""
+        return Grid(self.cells.T)
+
+    def flip(self, horizontal: bool = True) -> "Grid":
+        """Mirror left-right (or top-bottom if not horizontal), as a view."""
+        return Grid(self.cells[:, ::-1] if horizontal else self.cells[::-1, :])
+
+    def neighbor_counts(self, target: Union[str, int],
+                        diagonal: bool = True) -> "np.ndarray":
+        """
+        Count each cell's neighbors equal to target by summing shifted masks.
+
+        Args:
+            target: Character (or byte value) to count
+            diagonal: Count all 8 neighbors instead of the 4 orthogonal ones
+                (default: True)
+
+        Returns:
+            Integer array of the grid's shape
+        """
+        padded = np.pad(self.mask(target).astype(np.uint8), 1)
+        h, w = self.cells.shape
+        offsets = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        if diagonal:
+            offsets += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+        counts = np.zeros((h, w), dtype=np.uint8)
+        for dy, dx in offsets:
+            counts += padded[1 + dy:1 + dy + h, 1 + dx:1 + dx + w]
+        return counts
+
+    def fill(self, mask: "np.ndarray", value: Union[str, int]) -> None:
+        """Set every cell where mask is True to value, in place."""
+        self.cells[mask] = _cell_code(value)
+
+    def copy(self) -> "Grid":
+        """Return an independent, contiguous copy."""
+        return Grid(self.cells.copy())
+
+    def to_lines(self) -> List[str]:
+        """Return the rows as strings."""
+        return [row.tobytes().decode("latin-1") for row in self.cells]
+
+    def __str__(self) -> str:
+        return "\n".join(self.to_lines())
+
+
+class FlatGrid:
+    """
+    Character grid stored row-major in one bytearray with a sentinel border.
+
+    Every cell is addressed by a single int index, i = (y + 1) * stride +
+    (x + 1) with stride = width + 2, and its neighbors are i + offset for
+    the precomputed `offsets4` / `offsets8`. The one-cell border holds a
+    sentinel byte that never equals a real cell, so BFS, flood fill and
+    neighbor counting need no bounds checks and allocate no tuples.
+    """
+
+    SENTINEL = 0
+
+    def __init__(self, width: int, height: int, fill: Union[str, int] = "."):
+        """
+        Create a width x height grid filled with `fill`.
+
+        Args:
+            width: Number of columns
+            height: Number of rows
+            fill: Initial cell value (default: ".")
+        """
+        self.width, self.height = width, height
+        self.stride = width + 2
+        self.cells = bytearray([self.SENTINEL]) * (self.stride * (height + 2))
+        row = bytes([_cell_code(fill)]) * width
+        for y in range(height):
+            start = self.index(0, y)
+            self.cells[start:start + width] = row
+
+        s = self.stride
+        self.offsets4 = (-s, 1, s, -1)
+        self.offsets8 = (-s - 1, -s, -s + 1, 1, s + 1, s, s - 1, -1)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], fill: str = " ") -> "FlatGrid":
+        """Build a grid from rows of text, padding ragged rows with fill."""
+        lines = list(lines)
+        grid = cls(max((len(line) for line in lines), default=0), len(lines), fill)
+        for y, line in enumerate(lines):
+            start = grid.index(0, y)
+            grid.cells[start:start + len(line)] = line.encode("latin-1")
+        return grid
+
+    def index(self, x: int, y: int) -> int:
+        """Flat index of the cell at (x, y)."""
+        return (y + 1) * self.stride + x + 1
+
+    def coords(self, index: int) -> tuple[int, int]:
+        """(x, y) of a flat index."""
+        y, x = divmod(index, self.stride)
+        return (x - 1, y - 1)
+
+    def get(self, x: int, y: int, default: Any = ".") -> Any:
+        """Return the character at (x, y), or default if out of bounds."""
+        if 0 <= y < self.height and 0 <= x < self.width:
+            return chr(self.cells[self.index(x, y)])
+        return default
+
+    def find_all(self, target: Union[str, int]) -> List[int]:
+        """
+        Find the flat indices of every cell equal to target.
+
+        Args:
+            target: Character (or byte value) to find
+
+        Returns:
+            Indices in row-major order
+        """
+        code = _cell_code(target)
+        cells, found = self.cells, []
+        i = cells.find(code)
+        while i != -1:
+            found.append(i)
+            i = cells.find(code, i + 1)
+        return found
+
+    def border_indices(self) -> List[int]:
+        """Flat indices of the outermost real cells, each once."""
+        w, h = self.width, self.height
+        if w == 0 or h == 0:
+            return []
+        edge = {self.index(x, y) for x in range(w) for y in (0, h - 1)}
+        edge.update(self.index(x, y) for y in range(h) for x in (0, w - 1))
+        return sorted(edge)
+
+    def count_neighbors(self, index: int, target: Union[str, int],
+                        diagonal: bool = True) -> int:
+        """
+        Count the neighbors of a cell equal to target.
+
+        Args:
+            index: Flat index of the cell
+            target: Character (or byte value) to count
+            diagonal: Count all 8 neighbors instead of the 4 orthogonal ones
+                (default: True)
+
+        Returns:
+            Number of matching neighbors
+        """
+        code, cells = _cell_code(target), self.cells
+        total = 0
+        for offset in (self.offsets8 if diagonal else self.offsets4):
+            if cells[index + offset] == code:
+                total += 1
+        return total
+
+    def flood_fill(self, starts: Iterable[int], passable: Union[str, int],
+                   mark: Union[str, int], diagonal: bool = False) -> int:
+        """
+        Overwrite the region of passable cells reachable from starts with mark.
+
+        Cells are marked as they are queued, so the grid itself is the
+        visited set. Start cells that aren't passable are ignored.
+
+        Args:
+            starts: Flat indices to fill from
+            passable: Character (or byte value) the fill may spread over
+            mark: Character (or byte value) written to filled cells; must
+                differ from passable
+            diagonal: Also spread diagonally (default: False)
+
+        Returns:
+            Number of cells filled
+        """
+        open_code, mark_code, cells = _cell_code(passable), _cell_code(mark), self.cells
+        offsets = self.offsets8 if diagonal else self.offsets4
+        stack = []
+        for i in starts:
+            if cells[i] == open_code:
+                cells[i] = mark_code
+                stack.append(i)
+
+        filled = len(stack)
+        while stack:
+            i = stack.pop()
+            for offset in offsets:
+                j = i + offset
+                if cells[j] == open_code:
+                    cells[j] = mark_code
+                    stack.append(j)
+                    filled += 1
+        return filled
+
+    def to_lines(self) -> List[str]:
+        """Return the rows (without the border) as strings."""
+        return [self.cells[self.index(0, y):self.index(self.width, y)].decode("latin-1")
+                for y in range(self.height)]
+
+    def __str__(self) -> str:
+        return "\n".join(self.to_lines())
+
+
+class GridView:
+    """
+    Lazily transformed, read-only view of a list-of-lists grid.
+
+    A view keeps the base grid plus one composed affine index transform,
+    so rotate, flip, transpose and window are O(1) and never copy cells;
+    reads go through the transform. Call materialize() for a real grid.
+    Coordinates are (x, y) with x the column, like the helpers above.
+    """
+
+    def __init__(self, grid: Sequence[Sequence[Any]], width: Optional[int] = None,
+                 height: Optional[int] = None,
+                 transform: tuple[int, int, int, int, int, int] = (0, 0, 1, 0, 0, 1)):
+        """
+        Wrap a grid (a list of lists or a list of strings) without copying it.
+
+        Args:
+            grid: Base grid, indexed grid[y][x]
+            width: View width (default: width of the base grid)
+            height: View height (default: height of the base grid)
+            transform: (ox, oy, axx, axy, ayx, ayy) mapping view (x, y) to
+                base (ox + axx*x + axy*y, oy + ayx*x + ayy*y)
+                (default: identity)
+        """
+        self.grid = grid
+        self.height = len(grid) if height is None else height
+        self.width = (len(grid[0]) if grid else 0) if width is None else width
+        self.transform = transform
+
+    def _compose(self, cx: int, cy: int, m00: int, m01: int, m10: int, m11: int,
+                 width: int, height: int) -> "GridView":
+        """
+        New view whose (x, y) is this view's (cx + m00*x + m01*y, cy + m10*x + m11*y).
+        """
+        ox, oy, axx, axy, ayx, ayy = self.transform
+        transform = (ox + axx * cx + axy * cy, oy + ayx * cx + ayy * cy,
+                     axx * m00 + axy * m10, axx * m01 + axy * m11,
+                     ayx * m00 + ayy * m10, ayx * m01 + ayy * m11)
+        return GridView(self.grid, width, height, transform)
+
+    def rotate(self, times: int = 1) -> "GridView":
+        """Rotate 90 degrees clockwise `times` times."""
+        view = self
+        for _ in range(times % 4):
+            view = view._compose(0, view.height - 1, 0, 1, -1, 0,
+                                 view.height, view.width)
+        return view
+
+    def transpose(self) -> "GridView":
+        """Swap rows and columns."""
+        return self._compose(0, 0, 0, 1, 1, 0, self.height, self.width)
+
+    def flip(self, horizontal: bool = True) -> "GridView":
+        """Mirror left-right (or top-bottom if not horizontal)."""
+        if horizontal:
+            return self._compose(self.width - 1, 0, -1, 0, 0, 1,
+                                 self.width, self.height)
+        return self._compose(0, self.height - 1, 1, 0, 0, -1,
+                             self.width, self.height)
+
+    def window(self, x: int, y: int, width: int, height: int) -> "GridView":
+        """
+        View the sub-rectangle with top-left corner (x, y).
+
+        Raises:
+            ValueError: If the rectangle doesn't fit inside this view
+        """
+        if x < 0 or y < 0 or width < 0 or height < 0 or x + width > self.width \
+                or y + height > self.height:
+            raise ValueError(f"Window {width}x{height} at ({x}, {y}) is outside"
+                             f" the {self.width}x{self.height} view")
+        return self._compose(x, y, 1, 0, 0, 1, width, height)
+
+    def orientations(self) -> List["GridView"]:
+        """All 8 rotations and reflections of this view."""
+        flipped = self.flip()
+        return ([self.rotate(t) for t in range(4)]
+                + [flipped.rotate(t) for t in range(4)])
+
+    def get(self, x: int, y: int, default: Any = ".") -> Any:
+        """Return the value at view (x, y), or default if out of bounds."""
+        if 0 <= y < self.height and 0 <= x < self.width:
+            ox, oy, axx, axy, ayx, ayy = self.transform
+            return self.grid[oy + ayx * x + ayy * y][ox + axx * x + axy * y]
+        return default
+
+    def row(self, y: int) -> List[Any]:
+        """Return view row y as a list."""
+        ox, oy, axx, axy, ayx, ayy = self.transform
+        grid = self.grid
+        bx, by = ox + axy * y, oy + ayy * y
+        return [grid[by + ayx * x][bx + axx * x] for x in range(self.width)]
+
+    def find_all(self, target: Any) -> List[tuple[int, int]]:
+        """Find all occurrences of target, as view (x, y) in row-major order."""
+        return [(x, y) for y in range(self.height)
+                for x, cell in enumerate(self.row(y)) if cell == target]
+
+    def materialize(self) -> List[List[Any]]:
+        """Copy the view into a new list-of-lists grid."""
+        return [self.row(y) for y in range(self.height)]
+
+    def __str__(self) -> str:
+        return "\n".join("".join(str(cell) for cell in self.row(y))
+                         for y in range(self.height))
+
+
+class SummedAreaTable:
+    """
+    Summed-area table (2-D prefix sums) of a grid of numbers.
+
+    Built with one cumsum per axis; afterwards the sum over any rectangle
+    takes four lookups, for one rectangle or a whole array of them at once.
+    Coordinates are (x, y) with x the column, like Grid.
+    """
+
+    def __init__(self, values: "np.ndarray"):
+        """
+        Build the table.
+
+        Sums are kept in int64 when the largest possible total fits, and in
+        Python ints (object dtype) otherwise, so they never overflow.
+
+        Args:
+            values: 2-D array-like of ints or bools, e.g. Grid.mask("#")
+        """
+        values = np.asarray(values)
+        if values.ndim != 2:
+            raise ValueError(f"Expected a 2-D grid, got {values.ndim} dimensions")
+        if values.dtype == object:
+            bound = max((abs(int(v)) for v in values.flat), default=0)
+        else:
+            bound = int(np.abs(values).max(initial=0))
+        dtype = np.int64 if bound * max(values.size, 1) < 2 ** 63 else object
+
+        h, w = values.shape
+        # A zero row and column in front make every query branch-free
+        self.table = np.zeros((h + 1, w + 1), dtype=dtype)
+        self.table[1:, 1:] = values.astype(dtype).cumsum(axis=0).cumsum(axis=1)
+
+    @property
+    def height(self) -> int:
+        return self.table.shape[0] - 1
+
+    @property
+    def width(self) -> int:
+        return self.table.shape[1] - 1
+
+    def rect_sum(self, x1, y1, x2, y2):
+        """
+        Sum of the rectangle with inclusive corners (x1, y1) and (x2, y2).
+
+        Every argument can also be an array, which sums one rectangle per
+        element in a single vectorized lookup.
+
+        Args:
+            x1, y1: Top-left corner, x1 <= x2 and y1 <= y2
+            x2, y2: Bottom-right corner
+
+        Returns:
+            The sum as an int, or an array of sums for array arguments
+        """
+        t = self.table
+        x2 = np.add(x2, 1)
+        y2 = np.add(y2, 1)
+        total = t[y2, x2] - t[y1, x2] - t[y2, x1] + t[y1, x1]
+        return total if isinstance(total, np.ndarray) else int(total)
+
+    def rect_full(self, x1, y1, x2, y2):
+        """
+        Whether every cell of a 0/1 grid's rectangle(s) is 1, see rect_sum.
+
+        Returns:
+            bool, or a boolean array for array arguments
+        """
+        cells = (np.subtract(x2, x1) + 1) * (np.subtract(y2, y1) + 1)
+        full = self.rect_sum(x1, y1, x2, y2) == cells
+        return full if isinstance(full, np.ndarray) else bool(full)
+
+
+class BitGrid:
+    """
+    Set of grid cells packed into one Python int, one bit per cell.
+
+    Cell (x, y) is bit y * stride + x, where stride = width + 1 leaves an
+    always-clear guard bit after each row so horizontal shifts can't carry
+    into the next row. Shifts, masks and popcounts then act on every cell
+    at once as big-int bit operations, and neighbor counts are summed with
+    a bit-sliced adder, all without NumPy.
+
+    Grids compare and hash by their cells and size, so they can be kept in
+    a set (e.g. to spot a repeating state); don't set() cells of a grid
+    while it is in one.
+    """
+
+    def __init__(self, bits: int, width: int, height: int):
+        """
+        Wrap a packed bit pattern.
+
+        Args:
+            bits: Cells as bits, see the class docstring
+            width: Grid width
+            height: Grid height
+        """
+        self.width = width
+        self.height = height
+        self.stride = width + 1
+        # Repeating a row pattern: multiply by 1 + 2^stride + 2^(2 stride) + ...
+        self._repeat = ((1 << (self.stride * height)) - 1) // ((1 << self.stride) - 1)
+        self.valid = ((1 << width) - 1) * self._repeat
+        # Column masks by (start, stop), shared by grids derived from this one
+        self._columns: Dict[tuple[int, int], int] = {}
+        self.bits = bits & self.valid
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], target: str = "#") -> "BitGrid":
+        """
+        Build the set of cells equal to target from rows of text.
+
+        Args:
+            lines: Rows of the grid, e.g. read_input(); short rows are padded
+            target: Character of the cells to set (default: #)
+
+        Returns:
+            A new BitGrid
+        """
+        lines = list(lines)
+        width = max((len(line) for line in lines), default=0)
+        to_bits = {ord(c): "0" for c in set("".join(lines)) | {"\0"}}
+        to_bits[ord(target)] = "1"
+        # Most significant bit first: last row first, each row reversed
+        # and led by its guard bit
+        text = "".join("0" + line.ljust(width, "\0").translate(to_bits)[::-1]
+                       for line in reversed(lines))
+        return cls(int(text or "0", 2), width, len(lines))
+
+    def _like(self, bits: int) -> "BitGrid":
+        """Grid of the same shape; bits must already be within self.valid."""
+        grid = object.__new__(BitGrid)
+        grid.__dict__.update(self.__dict__)
+        grid.bits = bits
+        return grid
+
+    def columns(self, start: int, stop: int) -> int:
+        """Bit mask of the columns start..stop-1 in every row."""
+        start, stop = max(start, 0), min(stop, self.width)
+        if start >= stop:
+            return 0
+        mask = self._columns.get((start, stop))
+        if mask is None:
+            mask = ((1 << stop) - (1 << start)) * self._repeat
+            self._columns[start, stop] = mask
+        return mask
+
+    def get(self, x: int, y: int) -> bool:
+        """Return True if (x, y) is set; out of bounds is never set."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return bool(self.bits >> (y * self.stride + x) & 1)
+        return False
+
+    def set(self, x: int, y: int, value: bool = True) -> None:
+        """
+        Set or clear the cell at (x, y) in place.
+
+        Raises:
+            IndexError: If (x, y) is outside the grid
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Cell {(x, y)} is outside the"
+                             f" {self.width}x{self.height} grid")
+        bit = 1 << (y * self.stride + x)
+        self.bits = self.bits | bit if value else self.bits & ~bit
+
+    def row(self, y: int) -> int:
+        """Row y as a width-bit int, bit x being cell (x, y)."""
+        return (self.bits >> (y * self.stride)) & ((1 << self.width) - 1)
+
+    def count(self) -> int:
+        """Number of set cells."""
+        return self.bits.bit_count()
+
+    def shift(self, dx: int, dy: int) -> "BitGrid":
+        """
+        Move every cell by (dx, dy); cells moved off the grid are dropped.
+
+        Returns:
+            A new BitGrid where (x + dx, y + dy) is set if (x, y) was
+        """
+        bits = self.bits & self.columns(-dx, self.width - dx)
+        offset = dy * self.stride + dx
+        if offset < 0:
+            return self._like(bits >> -offset)
+        return self._like((bits << offset) & self.valid)
+
+    def neighbors_at_least(self, k: int, diagonal: bool = True) -> "BitGrid":
+        """
+        Cells with at least k set neighbors, counted for all cells at once.
+
+        The neighbor count of every cell is kept as binary digit planes
+        (ones, twos, fours, ...); each shifted copy of the grid is added
+        with bitwise half adders, then the planes are compared against k.
+
+        Args:
+            k: Minimum number of set neighbors
+            diagonal: Count all 8 neighbors instead of the 4 orthogonal ones
+                (default: True)
+
+        Returns:
+            A new BitGrid of the cells (set or not) with >= k set neighbors
+        """
+        offsets = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        if diagonal:
+            offsets += [(-1, -1), (1, -1), (-1, 1), (1, 1)]
+        if k <= 0:
+            return self._like(self.valid)
+        if k > len(offsets):
+            return self._like(0)
+
+        planes = [0] * len(offsets).bit_length()
+        for dx, dy in offsets:
+            carry = self.shift(dx, dy).bits
+            for i, plane in enumerate(planes):
+                if not carry:
+                    break
+                planes[i], carry = plane ^ carry, plane & carry
+
+        # Compare the count with k from the most significant digit down
+        greater, equal = 0, self.valid
+        for i in reversed(range(len(planes))):
+            if k >> i & 1:
+                equal &= planes[i]
+            else:
+                greater |= equal & planes[i]
+                equal &= ~planes[i]
+        return self._like(greater | equal)
+
+    def __and__(self, other: "BitGrid") -> "BitGrid":
+        return self._like(self.bits & other.bits)
+
+    def __or__(self, other: "BitGrid") -> "BitGrid":
+        return self._like(self.bits | other.bits)
+
+    def __xor__(self, other: "BitGrid") -> "BitGrid":
+        return self._like(self.bits ^ other.bits)
+
+    def __sub__(self, other: "BitGrid") -> "BitGrid":
+        return self._like(self.bits & ~other.bits)
+
+    def __invert__(self) -> "BitGrid":
+        return self._like(self.valid & ~self.bits)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitGrid):
+            return NotImplemented
+        return ((self.bits, self.width, self.height)
+                == (other.bits, other.width, other.height))
+
+    def __hash__(self) -> int:
+        return hash((self.bits, self.width, self.height))
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def find_all(self) -> List[tuple[int, int]]:
+        """All set cells as (x, y) tuples, in row-major order."""
+        cells = []
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            y, x = divmod(low.bit_length() - 1, self.stride)
+            cells.append((x, y))
+            bits ^= low
+        return cells
+
+    def to_lines(self, on: str = "#", off: str = ".") -> List[str]:
+        """Return the rows as strings."""
+        lines = []
+        for y in range(self.height):
+            row = format(self.row(y), f"0{self.width}b")[::-1] if self.width else ""
+            lines.append(row.replace("1", on).replace("0", off))
+        return lines
+
+    def __str__(self) -> str:
+        return "\n".join(self.to_lines())
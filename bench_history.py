@@ -0,0 +1,168 @@
+"""
+Benchmark history for the solution runner.
+
+Every `main.py bench` run is appended to a local SQLite database together
+with what it ran on: the git commit (and whether the tree had uncommitted
+changes), the Python version, the CPU model and the SHA-256 of the input.
+Runs of another commit on the same input can then be looked up to report
+speedups and slowdowns star by star.
+"""
+
+import hashlib
+import os
+import platform
+import sqlite3
+import subprocess
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import input_store
+
+HISTORY_DB = Path(os.getenv("AOC_BENCH_DB",
+                            Path(__file__).parent / ".aoc_bench.sqlite"))
+ROOT = Path(__file__).parent
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created_at REAL NOT NULL,
+    git_commit TEXT,
+    git_dirty INTEGER NOT NULL,
+    python_version TEXT NOT NULL,
+    cpu_model TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    star TEXT NOT NULL,
+    input_variant TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    runs INTEGER NOT NULL,
+    min_ns INTEGER NOT NULL,
+    median_ns REAL NOT NULL,
+    p95_ns INTEGER NOT NULL,
+    stddev_ns REAL NOT NULL,
+    peak_bytes INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_by_commit ON runs (git_commit, year, day, input_hash);
+"""
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        proc = subprocess.run(["git", *args], capture_output=True, text=True, cwd=ROOT)
+    except OSError:
+        return None
+    return proc.stdout.strip() if proc.returncode == 0 else None
+
+
+def git_commit(ref: str = "HEAD") -> Optional[str]:
+    """Resolve a git revision such as HEAD~1 to a full commit hash, if possible."""
+    return _git("rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}")
+
+
+def git_dirty() -> bool:
+    """Return True if tracked files have uncommitted changes."""
+    return bool(_git("status", "--porcelain", "--untracked-files=no"))
+
+
+def cpu_model() -> str:
+    """Return the CPU model name, falling back to the machine architecture."""
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine() or "unknown"
+
+
+def environment() -> Dict[str, Any]:
+    """Describe what a benchmark runs on: commit, Python version and CPU."""
+    return {
+        "git_commit": git_commit(),
+        "git_dirty": git_dirty(),
+        "python_version": platform.python_version(),
+        "cpu_model": cpu_model(),
+    }
+
+
+def input_hash(year: int, day: int, variant: str = "input") -> str:
+    """SHA-256 of an input's bytes, see input_store.read_bytes."""
+    data = input_store.read_bytes(year, day, variant, use_mmap=True)
+    return hashlib.sha256(data).hexdigest()
+
+
+def connect(db_path: Path = HISTORY_DB) -> sqlite3.Connection:
+    """Open the history database, creating it if needed."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def record(report: Dict[str, Any], db_path: Path = HISTORY_DB) -> int:
+    """
+    Append a bench report's statistics to the history.
+
+    Args:
+        report: Report from main.bench_day, with "env" and "input_hash" set
+        db_path: Database file (default: .aoc_bench.sqlite)
+
+    Returns:
+        Number of rows written (failed stars are skipped)
+    """
+    entries = [(str(star), stats) for star, stats in report["stars"].items()]
+    if "parse" in report:
+        entries.append(("parse", report["parse"]))
+
+    env = report["env"]
+    rows = [
+        (time.time(), env["git_commit"], int(env["git_dirty"]), env["python_version"],
+         env["cpu_model"], report["year"], report["day"], star, report["input"],
+         report["input_hash"], stats["runs"], stats["min_ns"], stats["median_ns"],
+         stats["p95_ns"], stats["stddev_ns"], stats.get("peak_bytes"))
+        for star, stats in entries if "error" not in stats
+    ]
+    with connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO runs (created_at, git_commit, git_dirty, python_version,"
+            " cpu_model, year, day, star, input_variant, input_hash, runs, min_ns,"
+            " median_ns, p95_ns, stddev_ns, peak_bytes)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows)
+    conn.close()
+    return len(rows)
+
+
+def latest(commit: str, year: int, day: int, digest: str,
+           db_path: Path = HISTORY_DB) -> Dict[str, Dict[str, Any]]:
+    """
+    Find the most recent recorded statistics of a commit on one input.
+
+    Runs with uncommitted changes on top of the commit are ignored, since
+    they don't measure the commit itself.
+
+    Args:
+        commit: Full commit hash, see git_commit()
+        year: Year
+        day: Day number (1-25)
+        digest: Input SHA-256, see input_hash()
+        db_path: Database file (default: .aoc_bench.sqlite)
+
+    Returns:
+        Dict mapping star ("1", "2" or "parse") to its row as a dict
+    """
+    if not db_path.exists():
+        return {}
+    conn = connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT * FROM runs WHERE git_commit = ? AND git_dirty = 0 AND year = ?"
+            " AND day = ? AND input_hash = ? ORDER BY created_at",
+            (commit, year, day, digest)).fetchall()
+    finally:
+        conn.close()
+    # Later rows overwrite earlier ones, leaving the newest per star
+    return {row["star"]: dict(row) for row in rows}
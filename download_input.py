@@ -1,22 +1,36 @@
 #!/usr/bin/env python3
 """
-Download Advent of Code input for a specific day.
+Download Advent of Code input for a specific day, or many days at once.
 
 Requires AOC_SESSION environment variable or .aoc_session file.
 Usage:
-    python download_input.py 1      # Download day 1 input for current year
-    python download_input.py 5 2024 # Download day 5 input for 2024
+    python download_input.py 1                       # Day 1 input for current year
+    python download_input.py 5 2024                  # Day 5 input for 2024
+    python download_input.py --year 2015 --days 1-25 # A whole year, concurrently
+
+Bulk downloads share a small pool of keep-alive connections and a global
+rate limit. AOC_BASE_URL (or --base-url) points them at another server,
+e.g. a local stand-in for testing.
 """
 
 import sys
 import os
-import urllib.request
-import urllib.error
+import http.client
+import queue
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import argparse
 
+import input_store
+
+BASE_URL = os.getenv("AOC_BASE_URL", "https://adventofcode.com")
+USER_AGENT = "aoc-client (https://github.com/user/Advent-of-Code-2025)"
+
 
 def get_current_year() -> int:
     """Get the current year."""
@@ -51,13 +65,150 @@ def get_session_cookie() -> Optional[str]:
     return None
 
 
-def download_input(day: int, year: Optional[int] = None) -> Optional[str]:
+def validate_day(day: int) -> bool:
+    """Validate that day is between 1 and 25."""
+    return 1 <= day <= 25
+
+
+def parse_days(spec: str) -> List[int]:
+    """
+    Parse a day specification such as "5", "1-12" or "1,3,7-9".
+
+    Args:
+        spec: Comma separated days and inclusive ranges
+
+    Returns:
+        Sorted list of unique day numbers
+
+    Raises:
+        ValueError: If the spec is malformed or a day is out of range
+    """
+    days = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = (int(x) for x in part.split("-", 1))
+            days.update(range(start, end + 1))
+        else:
+            days.add(int(part))
+
+    invalid = [d for d in days if not validate_day(d)]
+    if invalid:
+        raise ValueError(f"Day must be between 1 and 25, got {min(invalid)}")
+    return sorted(days)
+
+
+class RateLimiter:
+    """Spaces out calls across all threads to at most `rate` per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+
+    def wait(self) -> None:
+        """Block until the caller may make its next request."""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class ConnectionPool:
+    """
+    A fixed-size pool of keep-alive HTTP(S) connections to one host.
+
+    Connections are created lazily, handed to one thread at a time and
+    reused for later requests unless the server asked to close them.
+    """
+
+    def __init__(self, base_url: str = BASE_URL, size: int = 4, timeout: float = 10):
+        parsed = urllib.parse.urlsplit(base_url)
+        if parsed.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {base_url}")
+        self.scheme = parsed.scheme
+        self.host = parsed.netloc
+        self.prefix = parsed.path.rstrip("/")
+        self.timeout = timeout
+        self.idle: "queue.LifoQueue[Optional[http.client.HTTPConnection]]" = (
+            queue.LifoQueue())
+        for _ in range(size):
+            self.idle.put(None)  # Placeholder slots, connected on first use
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, timeout=self.timeout)
+
+    def _request(self, conn: http.client.HTTPConnection, path: str,
+                 headers: Dict[str, str]) -> Tuple[http.client.HTTPResponse, bytes]:
+        conn.request("GET", self.prefix + path, headers=headers)
+        response = conn.getresponse()
+        # The body must be fully read before the connection can be reused
+        return response, response.read()
+
+    def get(self, path: str, headers: Dict[str, str]) -> Tuple[int, str, bytes]:
+        """
+        Perform a GET on a pooled connection.
+
+        Args:
+            path: Request path below the base URL, e.g. "/2015/day/1/input"
+            headers: Request headers
+
+        Returns:
+            Tuple of (status code, reason, body)
+        """
+        conn = self.idle.get()
+        try:
+            reused = conn is not None
+            if conn is None:
+                conn = self._connect()
+            try:
+                response, body = self._request(conn, path, headers)
+            except (http.client.HTTPException, ConnectionError):
+                if not reused:
+                    raise
+                # The server may have dropped an idle keep-alive connection
+                conn.close()
+                conn = self._connect()
+                response, body = self._request(conn, path, headers)
+
+            if response.will_close:
+                conn.close()
+                conn = None
+            return response.status, response.reason, body
+        except BaseException:
+            if conn is not None:
+                conn.close()
+            conn = None
+            raise
+        finally:
+            self.idle.put(conn)
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        while not self.idle.empty():
+            conn = self.idle.get()
+            if conn is not None:
+                conn.close()
+
+
+def download_input(day: int, year: Optional[int] = None, silent: bool = False,
+                   base_url: str = BASE_URL,
+                   pool: Optional[ConnectionPool] = None) -> Optional[str]:
     """
     Download AoC input for a specific day.
 
     Args:
         day: Day number (1-25)
         year: Year (default: current year)
+        silent: If True, don't print error messages (default: False)
+        base_url: Server to download from (default: AOC_BASE_URL or adventofcode.com)
+        pool: Connection pool to reuse (default: a one-off connection)
 
     Returns:
         Input data as string, or None if download fails
@@ -65,45 +216,107 @@ def download_input(day: int, year: Optional[int] = None) -> Optional[str]:
     if year is None:
         year = get_current_year()
 
-    if not 1 <= day <= 25:
-        print(f"❌ Error: Day must be between 1 and 25, got {day}")
+    if not validate_day(day):
+        if not silent:
+            print(f"❌ Error: Day must be between 1 and 25, got {day}")
         return None
 
     session_cookie = get_session_cookie()
     if not session_cookie:
-        print("❌ Error: AOC session cookie not found!")
-        print("   Set AOC_SESSION environment variable or create .aoc_session file")
-        print("   See README.md for instructions on getting your session cookie")
+        if not silent:
+            print("❌ Error: AOC session cookie not found!")
+            print("   Set AOC_SESSION environment variable or create .aoc_session file")
+            print("   See README.md for instructions on getting your session cookie")
         return None
 
-    url = f"https://adventofcode.com/{year}/day/{day}/input"
+    headers = {
+        "User-Agent": USER_AGENT,
+        "Cookie": f"session={session_cookie}"
+    }
 
+    own_pool = pool is None
     try:
-        headers = {
-            "User-Agent": "aoc-client (https://github.com/user/Advent-of-Code-2025)",
-            "Cookie": f"session={session_cookie}"
-        }
+        if pool is None:
+            pool = ConnectionPool(base_url, size=1)
+        status, reason, body = pool.get(f"/{year}/day/{day}/input", headers)
+    except Exception as e:
+        if not silent:
+            print(f"❌ Error downloading input: {e}")
+        return None
+    finally:
+        if own_pool and pool is not None:
+            pool.close()
 
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=10) as response:
-            return response.read().decode("utf-8").strip()
+    if status == 200:
+        return body.decode("utf-8").strip()
 
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
+    if not silent:
+        if status == 404:
             print(f"❌ Error: Day {day} not found (advent not started yet?)")
-        elif e.code == 401:
+        elif status in (400, 401):
             print(f"❌ Error: Invalid session cookie")
         else:
-            print(f"❌ HTTP Error {e.code}: {e.reason}")
-        return None
-    except Exception as e:
-        print(f"❌ Error downloading input: {e}")
-        return None
+            print(f"❌ HTTP Error {status}: {reason}")
+    return None
+
+
+def download_many(days: List[int], year: Optional[int] = None, workers: int = 4,
+                  rate: float = 2.0, base_url: str = BASE_URL,
+                  force: bool = False) -> Dict[int, bool]:
+    """
+    Download and save many days concurrently.
+
+    Days whose input is already present, as a non-empty input.txt or in
+    the input store, are skipped unless force is set. Downloads run on
+    `workers` threads sharing as many keep-alive connections, and all of
+    them together stay under `rate` requests per second.
+
+    Args:
+        days: Day numbers to fetch
+        year: Year (default: current year)
+        workers: Concurrent downloads and pooled connections (default: 4)
+        rate: Maximum requests per second overall (default: 2)
+        base_url: Server to download from (default: AOC_BASE_URL or adventofcode.com)
+        force: Re-download inputs that already exist (default: False)
+
+    Returns:
+        Dict mapping each requested day to whether its input is now present
+    """
+    if year is None:
+        year = get_current_year()
+
+    results: Dict[int, bool] = {}
+    pending = []
+    for day in days:
+        if not force and input_store.has(year, day):
+            print(f"⏭️  Skipping {year} day {day}: input already present")
+            results[day] = True
+        else:
+            pending.append(day)
+
+    if not pending:
+        return results
+
+    limiter = RateLimiter(rate)
+    pool = ConnectionPool(base_url, size=workers)
+
+    def fetch(day: int) -> Tuple[int, Optional[str]]:
+        limiter.wait()
+        return day, download_input(day, year, silent=False, base_url=base_url,
+                                   pool=pool)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for day, content in executor.map(fetch, pending):
+                results[day] = content is not None and save_input(day, content, year)
+    finally:
+        pool.close()
+    return results
 
 
 def save_input(day: int, content: str, year: Optional[int] = None) -> bool:
     """
-    Save input to day folder.
+    Save input to the input store and, if it exists, the day folder.
 
     Args:
         day: Day number
@@ -119,14 +332,13 @@ def save_input(day: int, content: str, year: Optional[int] = None) -> bool:
     day_folder = Path(__file__).parent / f"aoc{year}" / f"day{day}"
     input_file = day_folder / "input.txt"
 
-    if not day_folder.exists():
-        print(f"❌ Error: day{day} folder not found")
-        print(f"   Create it first with: python main.py create {day} --year {year}")
-        return False
-
     try:
-        input_file.write_text(content)
+        input_store.put(year, day, content)
         print(f"✅ Downloaded input for {year} day {day}")
+        if not day_folder.exists():
+            print(f"   Saved to the input store only (no day{day} folder yet)")
+            return True
+        input_file.write_text(content)
         print(f"   Saved to: {input_file}")
         return True
     except Exception as e:
@@ -144,14 +356,29 @@ Examples:
   python download_input.py 5              # Download day 5 for current year
   python download_input.py 5 2024         # Download day 5 for 2024
   python download_input.py 5 -y 2024      # Download day 5 for 2024 (short form)
+  python download_input.py --year 2015 --days 1-25   # Download all of 2015
+  python download_input.py -y 2015 --days 1-25 -j 8  # ... over 8 connections
         """
     )
 
-    parser.add_argument("day", type=int, help="Day number (1-25)")
+    parser.add_argument("day", nargs="?", type=int, default=None,
+                       help="Day number (1-25)")
     parser.add_argument("year", nargs="?", type=int, default=None,
                        help="Year (default: current year)")
-    parser.add_argument("-y", "--year-flag", type=int, default=None, dest="year_flag",
+    parser.add_argument("-y", "--year-flag", "--year", type=int, default=None,
+                       dest="year_flag",
                        help="Year using -y flag (overrides positional year)")
+    parser.add_argument("--days", default=None,
+                       help="Download several days concurrently, e.g. 1-25 or 1,3,5-7")
+    parser.add_argument("-j", "--workers", type=int, default=4,
+                       help="Concurrent connections for --days (default: 4)")
+    parser.add_argument("--rate", type=float, default=2.0,
+                       help="Maximum requests per second for --days (default: 2)")
+    parser.add_argument("--base-url", default=BASE_URL,
+                       help="Server to download from"
+                            " (default: AOC_BASE_URL or adventofcode.com)")
+    parser.add_argument("--force", action="store_true",
+                       help="Re-download inputs that already exist")
 
     args = parser.parse_args()
 
@@ -160,8 +387,25 @@ Examples:
     if year is None:
         year = get_current_year()
 
+    if args.days is not None:
+        try:
+            days = parse_days(args.days)
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+        print(f"📥 Downloading {len(days)} day(s) for {year}...")
+        results = download_many(days, year, max(args.workers, 1), args.rate,
+                                args.base_url, args.force)
+        failed = [day for day, ok in results.items() if not ok]
+        if failed:
+            print(f"⚠️  Failed: day(s) {', '.join(map(str, failed))}")
+        sys.exit(1 if failed else 0)
+
+    if args.day is None:
+        parser.error("a day number or --days is required")
+
     print(f"📥 Downloading input for Day {args.day} ({year})...")
-    content = download_input(args.day, year)
+    content = download_input(args.day, year, base_url=args.base_url)
 
     if content is not None:
         if save_input(args.day, content, year):
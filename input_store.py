@@ -0,0 +1,226 @@
+"""
+Content-addressed store for puzzle inputs.
+
+Inputs are indexed by (year, day, variant), where the variant is the input's
+file stem: "input" for the real puzzle input, "test" for the example, or any
+other name such as "scale100" for generated data. The bytes themselves are
+kept once per distinct content under .aoc_store/blobs/, named by their
+SHA-256 and optionally compressed with gzip or zstd. Uncompressed blobs can
+be memory-mapped, so hot reads of big inputs don't copy the file.
+
+A loose aocYYYY/dayN/<variant>.txt file always wins over the store, so
+existing day folders keep working unchanged. Setting AOC_INPUT_VARIANT makes
+read_input and the runner use that variant in place of input.txt.
+"""
+
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+STORE_DIR = Path(os.getenv("AOC_STORE_DIR", Path(__file__).parent / ".aoc_store"))
+ROOT = Path(__file__).parent
+# Set by the runner (e.g. bench --scale) to point read_input at another variant
+VARIANT_ENV = "AOC_INPUT_VARIANT"
+CODECS = ("none", "gzip", "zstd")
+_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+
+@contextmanager
+def dir_lock(directory: Path) -> Iterator[None]:
+    """Hold an exclusive lock on a directory (the store or the answer cache)."""
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / "lock", "w") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "gzip":
+        # Fixed mtime keeps identical inputs byte-identical on disk
+        return gzip.compress(data, mtime=0)
+    if codec == "zstd":
+        if zstd is None:
+            raise RuntimeError("zstd compression needs Python 3.14+"
+                               " or the zstandard package")
+        return zstd.compress(data)
+    return data
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "gzip":
+        return gzip.decompress(data)
+    if codec == "zstd":
+        if zstd is None:
+            raise RuntimeError("zstd compression needs Python 3.14+"
+                               " or the zstandard package")
+        return zstd.decompress(data)
+    return data
+
+
+def _index_key(year: int, day: int, variant: str) -> str:
+    return f"{year}/{day}/{variant}"
+
+
+def _load_index(store_dir: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        return json.loads((store_dir / "index.json").read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as tmp:
+        tmp.write(data)
+    os.replace(tmp_name, path)
+
+
+def active_variant() -> str:
+    """Variant that stands in for input.txt: $AOC_INPUT_VARIANT, else "input"."""
+    return os.getenv(VARIANT_ENV) or "input"
+
+
+def day_file(year: int, day: int, variant: str = "input") -> Path:
+    """Path of the loose <variant>.txt file in a day folder."""
+    return ROOT / f"aoc{year}" / f"day{day}" / f"{variant}.txt"
+
+
+def put(year: int, day: int, data: Union[bytes, str], variant: str = "input",
+        codec: str = "none", store_dir: Path = STORE_DIR) -> str:
+    """
+    Store an input, reusing the blob if the same content is already stored.
+
+    Args:
+        year: Year
+        day: Day number (1-25)
+        data: Input contents
+        variant: Input name, e.g. "input", "test" or "scale100" (default: input)
+        codec: "none", "gzip" or "zstd" (default: none)
+        store_dir: Store root (default: .aoc_store)
+
+    Returns:
+        SHA-256 hex digest of the uncompressed content
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Unknown codec '{codec}',"
+                         f" expected one of {', '.join(CODECS)}")
+    if isinstance(data, str):
+        data = data.encode()
+
+    digest = hashlib.sha256(data).hexdigest()
+    blobs = store_dir / "blobs"
+    with dir_lock(store_dir):
+        blobs.mkdir(parents=True, exist_ok=True)
+        index = _load_index(store_dir)
+
+        existing = next((c for c in CODECS
+                         if (blobs / (digest + _SUFFIXES[c])).exists()), None)
+        if existing is None:
+            _write_atomic(blobs / (digest + _SUFFIXES[codec]), _compress(data, codec))
+            existing = codec
+
+        index[_index_key(year, day, variant)] = {
+            "sha256": digest, "codec": existing, "size": len(data)}
+        _write_atomic(store_dir / "index.json", json.dumps(index, indent=1).encode())
+    return digest
+
+
+def lookup(year: int, day: int, variant: str = "input",
+           store_dir: Path = STORE_DIR) -> Optional[Dict[str, Any]]:
+    """Return the index entry (sha256, codec, size) of a stored input, if any."""
+    return _load_index(store_dir).get(_index_key(year, day, variant))
+
+
+def has(year: int, day: int, variant: str = "input",
+        store_dir: Path = STORE_DIR) -> bool:
+    """Return True if the input exists as a loose file or in the store."""
+    path = day_file(year, day, variant)
+    if path.exists() and path.stat().st_size > 0:
+        return True
+    return lookup(year, day, variant, store_dir) is not None
+
+
+def read_bytes(year: int, day: int, variant: str = "input", use_mmap: bool = False,
+               store_dir: Path = STORE_DIR) -> Union[bytes, memoryview]:
+    """
+    Read an input's raw bytes, preferring the loose file in the day folder.
+
+    Args:
+        year: Year
+        day: Day number (1-25)
+        variant: Input name (default: input)
+        use_mmap: Memory-map the file instead of reading it, returning a
+            zero-copy read-only memoryview; ignored for compressed blobs
+        store_dir: Store root (default: .aoc_store)
+
+    Returns:
+        The input bytes, or a memoryview over a mapping of them
+
+    Raises:
+        FileNotFoundError: If the input is neither a loose file nor stored
+    """
+    path = day_file(year, day, variant)
+    codec = "none"
+    if not path.exists():
+        entry = lookup(year, day, variant, store_dir)
+        if entry is None:
+            raise FileNotFoundError(f"Input file not found: {path}")
+        codec = entry["codec"]
+        path = store_dir / "blobs" / (entry["sha256"] + _SUFFIXES[codec])
+
+    if codec != "none":
+        return _decompress(path.read_bytes(), codec)
+    if not use_mmap:
+        return path.read_bytes()
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(b"")
+        # The mapping outlives the file descriptor and is freed with the view
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def read_text(year: int, day: int, variant: str = "input",
+              store_dir: Path = STORE_DIR) -> str:
+    """Read an input as text, preferring the loose file in the day folder."""
+    return bytes(read_bytes(year, day, variant, store_dir=store_dir)).decode()
+
+
+def collect_garbage(store_dir: Path = STORE_DIR) -> int:
+    """Delete blobs no index entry refers to and return how many were removed."""
+    blobs = store_dir / "blobs"
+    if not blobs.exists():
+        return 0
+    with dir_lock(store_dir):
+        index = _load_index(store_dir)
+        live = {entry["sha256"] + _SUFFIXES[entry["codec"]] for entry in index.values()}
+        removed = 0
+        for blob in blobs.iterdir():
+            if blob.name not in live:
+                blob.unlink()
+                removed += 1
+    return removed
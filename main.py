@@ -4,111 +4,40 @@ Advent of Code Manager
 Handles creating new day folders and running solutions
 """
 
-import sys
-import os
-import urllib.request
-import urllib.error
+import argparse
+import hashlib
 import importlib.util
+import json
+import math
+import os
+import signal
+import statistics
+import sys
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
-import argparse
-from datetime import datetime
-
-
-def get_current_year() -> int:
-    """Get the current year."""
-    return datetime.now().year
-
-
-def get_current_day() -> int:
-    """Get the current day in December, or 25 if not December."""
-    today = datetime.now()
-    if today.month == 12:
-        return min(today.day, 25)
-    return 25
-
-
-def validate_day(day: int) -> bool:
-    """Validate that day is between 1 and 25."""
-    return 1 <= day <= 25
-
-
-def get_session_cookie() -> Optional[str]:
-    """
-    Get AOC session cookie from environment or .aoc_session file.
-
-    Returns:
-        Session cookie string or None
-    """
-    # Try environment variable first
-    session = os.getenv("AOC_SESSION")
-    if session:
-        return session
-
-    # Try .aoc_session file
-    session_file = Path(__file__).parent / ".aoc_session"
-    if session_file.exists():
-        return session_file.read_text().strip()
-
-    return None
-
-
-def download_input(day: int, year: Optional[int] = None, silent: bool = False) -> Optional[str]:
-    """
-    Download AoC input for a specific day.
-
-    Args:
-        day: Day number (1-25)
-        year: Year (default: current year)
-        silent: If True, don't print error messages (default: False)
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-    Returns:
-        Input data as string, or None if download fails
-    """
-    if year is None:
-        year = get_current_year()
-
-    if not validate_day(day):
-        if not silent:
-            print(f"❌ Error: Day must be between 1 and 25, got {day}")
-        return None
+from download_input import (
+    download_input,
+    get_current_day,
+    get_current_year,
+    get_session_cookie,
+    parse_days,
+    validate_day,
+)
 
-    session_cookie = get_session_cookie()
-    if not session_cookie:
-        if not silent:
-            print("⚠️  AOC session cookie not found - skipping input download")
-            print("   Set AOC_SESSION environment variable or create .aoc_session file")
-        return None
-
-    url = f"https://adventofcode.com/{year}/day/{day}/input"
-
-    try:
-        headers = {
-            "User-Agent": "aoc-client",
-            "Cookie": f"session={session_cookie}"
-        }
-
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=10) as response:
-            return response.read().decode("utf-8").strip()
-
-    except urllib.error.HTTPError as e:
-        if not silent:
-            if e.code == 404:
-                print(f"❌ Error: Day {day} not found (advent not started yet?)")
-            elif e.code == 401:
-                print(f"❌ Error: Invalid session cookie")
-            else:
-                print(f"❌ HTTP Error {e.code}: {e.reason}")
-        return None
-    except Exception as e:
-        if not silent:
-            print(f"❌ Error downloading input: {e}")
-        return None
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    resource = None
 
 
 def create_day(day: int, year: Optional[int] = None) -> None:
     """Create a new day folder with boilerplate files and auto-download input."""
+    import input_store
+
     if year is None:
         year = get_current_year()
 
@@ -144,60 +73,1192 @@ def create_day(day: int, year: Optional[int] = None) -> None:
 
     # Try to download input
     print(f"\n📥 Attempting to download input...")
-    input_content = download_input(day, year, silent=False)
+    input_content = None
+    if get_session_cookie():
+        input_content = download_input(day, year, silent=False)
+    else:
+        print("⚠️  AOC session cookie not found - skipping input download")
+        print("   Set AOC_SESSION environment variable or create .aoc_session file")
 
     input_file = day_folder / "input.txt"
     if input_content:
-        input_file.write_text(input_content)
-        print(f"✅ Downloaded and saved input.txt")
+        # The runner reads the store when there's no loose input.txt
+        input_store.put(year, day, input_content)
+        print("✅ Downloaded input to the input store")
     else:
         input_file.touch()
         print(f"⚠️  Created empty input.txt - add your puzzle input manually or set AOC_SESSION")
 
 
-def run_day(day: int, year: Optional[int] = None, test: bool = False) -> None:
-    """Run a specific day's solution."""
-    if year is None:
-        year = get_current_year()
-
-    if not validate_day(day):
-        print(f"❌ Error: Day must be between 1 and 25, got {day}")
+def existing_day_file(day: int, year: int) -> Path:
+    """Return the path of dayN.py, exiting with a hint if it doesn't exist."""
+    day_file = Path(__file__).parent / f"aoc{year}" / f"day{day}" / f"day{day}.py"
+    if not day_file.exists():
+        print(f"❌ Day {day} not found."
+              f" Create it first with: python main.py create {day}")
         sys.exit(1)
+    return day_file
 
-    day_folder = Path(__file__).parent / f"aoc{year}" / f"day{day}"
-    day_file = day_folder / f"day{day}.py"
 
+def _read_stored_input(year: int, day: int, variant: str) -> Union[bytes, memoryview]:
+    """Read an input from the input store, memory-mapped if possible."""
+    import input_store
+
+    return input_store.read_bytes(year, day, variant, use_mmap=True)
+
+
+def load_day_module(day: int, year: int) -> ModuleType:
+    """
+    Import a day's solution module from its file.
+
+    Args:
+        day: Day number (1-25)
+        year: Year
+
+    Returns:
+        The loaded module
+
+    Raises:
+        FileNotFoundError: If dayN.py does not exist
+        ImportError: If the module cannot be loaded
+        AttributeError: If the module lacks star1()/star2()
+    """
+    day_file = Path(__file__).parent / f"aoc{year}" / f"day{day}" / f"day{day}.py"
     if not day_file.exists():
-        print(f"❌ Day {day} not found. Create it first with: python main.py create {day}")
-        sys.exit(1)
+        raise FileNotFoundError(f"Day {day} not found at {day_file}")
 
-    # Load and run the module
     spec = importlib.util.spec_from_file_location(f"aoc{year}.day{day}", day_file)
     if spec is None or spec.loader is None:
-        print(f"❌ Failed to load day{day}")
-        sys.exit(1)
+        raise ImportError(f"Failed to load day{day}")
+
+    # Days' input readers fall back to the input store when there's no file
+    from aoc_utils import utils as shared_utils
+    shared_utils.set_stored_input_reader(_read_stored_input)
 
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
 
     if not hasattr(module, 'star1') or not hasattr(module, 'star2'):
-        print(f"❌ day{day}.py must contain star1() and star2() functions")
+        raise AttributeError(f"day{day}.py must contain star1() and star2() functions")
+    return module
+
+
+def parse_size(text: str) -> int:
+    """
+    Parse a byte size such as "512M", "2G" or "1048576".
+
+    Args:
+        text: Number with an optional K/M/G/T suffix (powers of 1024)
+
+    Returns:
+        Size in bytes
+
+    Raises:
+        ValueError: If the text is not a valid size
+    """
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+    text = text.strip().upper().removesuffix("B")
+    scale = units.get(text[-1:], 1)
+    if text[-1:] in units:
+        text = text[:-1]
+    return int(float(text) * scale)
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count with a readable binary unit."""
+    if abs(size) < 1024:
+        return f"{size:.0f} B"
+    for unit in ("KiB", "MiB"):
+        size /= 1024
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+    return f"{size / 1024:.1f} GiB"
+
+
+def print_usage(usage: Dict[str, Any]) -> None:
+    """Print the resource usage measured by profiling.measure_call."""
+    rss = ""
+    if usage["rss_before"] is not None and usage["rss_after"] is not None:
+        rss = (f" | rss {format_bytes(usage['rss_after'])}"
+               f" ({usage['rss_after'] - usage['rss_before']:+,} B)")
+    print(f"     wall {format_ns(usage['wall_ns'])} | cpu {usage['user_s']:.3f}s user"
+          f" + {usage['sys_s']:.3f}s sys"
+          f" | peak {format_bytes(usage['peak_bytes'])}{rss}")
+    if usage["sites"]:
+        print("     Top allocation sites near peak:")
+        for size, site in usage["sites"]:
+            print(f"       {format_bytes(size):>10}  {site}")
+
+
+def parse_duration(text: str) -> float:
+    """
+    Parse a duration such as "30s", "2m", "500ms" or "45".
+
+    Args:
+        text: Number with an optional ms/s/m/h suffix (default: seconds)
+
+    Returns:
+        Duration in seconds
+
+    Raises:
+        ValueError: If the text is not a valid duration
+    """
+    units = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    text = text.strip().lower()
+    for suffix in sorted(units, key=len, reverse=True):
+        if text.endswith(suffix):
+            return float(text[:-len(suffix)]) * units[suffix]
+    return float(text)
+
+
+def read_raw_input(day: int, year: int, filename: Optional[str] = None) -> str:
+    """
+    Read a day's input the same way utils.read_input does, unsplit.
+
+    Args:
+        day: Day number (1-25)
+        year: Year
+        filename: Input file inside the day folder, or the name of a stored
+            input variant (default: input.txt, or $AOC_INPUT_VARIANT)
+
+    Returns:
+        Stripped file contents
+    """
+    import input_store
+
+    variant = Path(filename).stem if filename else input_store.active_variant()
+    return input_store.read_text(year, day, variant).strip()
+
+
+def prepare_stars(module: ModuleType, day: int,
+                  year: int) -> Tuple[Dict[int, Callable[[], Any]], Optional[int]]:
+    """
+    Bind a day's stars to their input, honouring the optional parse hook.
+
+    A day may define parse(raw) taking the stripped input text. If it does,
+    parse runs once here and star1/star2 are called with its result;
+    otherwise the stars are called without arguments as before.
+
+    Args:
+        module: Loaded day module
+        day: Day number (1-25)
+        year: Year
+
+    Returns:
+        Tuple of ({star: zero-argument callable}, parse time in ns or None)
+
+    Raises:
+        Exception: Whatever reading the input or parse() raises
+    """
+    if not hasattr(module, "parse"):
+        return {1: module.star1, 2: module.star2}, None
+
+    raw = read_raw_input(day, year)
+    start = time.perf_counter_ns()
+    parsed = module.parse(raw)
+    parse_ns = time.perf_counter_ns() - start
+    return {1: lambda: module.star1(parsed), 2: lambda: module.star2(parsed)}, parse_ns
+
+
+def run_day(day: int, year: Optional[int] = None, test: bool = False,
+            use_cache: bool = True, profile_top: Optional[int] = None,
+            stars: Tuple[int, ...] = (1, 2), mem_threshold: Optional[int] = None,
+            timeout: Optional[float] = None, max_mem: Optional[int] = None) -> None:
+    """
+    Run a specific day's solution, reusing cached answers when nothing changed.
+
+    If profile_top is given, each star runs under cProfile (bypassing the
+    cache lookup): the top functions by cumulative time are printed and a
+    .prof plus a collapsed-stack file are written to .aoc_profiles/.
+    Only the given stars are run, so a day's lazy imports needed solely by
+    the other star are never loaded. If mem_threshold is given, wall/CPU
+    time, tracemalloc peak and RSS are reported per star (also bypassing
+    the cache), with the top allocation sites once the peak exceeds it.
+    If timeout or max_mem is given, each star runs isolated in a child
+    process instead (see run_isolated).
+    """
+    import answer_cache
+
+    if year is None:
+        year = get_current_year()
+
+    if not validate_day(day):
+        print(f"❌ Error: Day must be between 1 and 25, got {day}")
         sys.exit(1)
 
+    existing_day_file(day, year)
+
+    # --no-cache skips the lookup but still refreshes the stored answers
+    key = answer_cache.cache_key(day, year)
+    if profile_top is not None or mem_threshold is not None:
+        use_cache = False
+    cached = answer_cache.get_answers(key) if key is not None and use_cache else {}
+
+    if timeout is not None or max_mem is not None:
+        print(f"🎄 Running {year} Day {day} (isolated):")
+        for star in stars:
+            _, _, _, result, error = run_isolated(year, day, star, timeout, max_mem,
+                                                  use_cache)
+            if error is None:
+                print(f"  ⭐ Star {star}: {result}")
+            else:
+                print(f"  ❌ Star {star} failed: {error}")
+        return
+
+    module = None
+    if not all(str(star) in cached for star in stars):
+        try:
+            module = load_day_module(day, year)
+        except (ImportError, AttributeError) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+
+    if profile_top is not None or mem_threshold is not None:
+        import profiling
+
     print(f"🎄 Running {year} Day {day}:")
+    solvers: Dict[int, Callable[[], Any]] = {}
+    if module is not None:
+        try:
+            if mem_threshold is None:
+                solvers, parse_ns = prepare_stars(module, day, year)
+            else:
+                (solvers, parse_ns), usage = profiling.measure_call(
+                    lambda: prepare_stars(module, day, year), mem_threshold)
+        except Exception as e:
+            print(f"  ❌ Parse failed: {e}")
+            return
+        if parse_ns is not None:
+            print(f"  📖 Parsed input in {format_ns(parse_ns)}")
+            if mem_threshold is not None:
+                print_usage(usage)
+
+    for star in stars:
+        if str(star) in cached:
+            print(f"  ⭐ Star {star}: {cached[str(star)]} (cached)")
+            continue
+        try:
+            if profile_top is not None:
+                result, stats = profiling.profile_call(solvers[star])
+            elif mem_threshold is not None:
+                result, usage = profiling.measure_call(solvers[star], mem_threshold)
+            else:
+                result = solvers[star]()
+            print(f"  ⭐ Star {star}: {result}")
+        except Exception as e:
+            print(f"  ❌ Star {star} failed: {e}")
+            continue
+        if mem_threshold is not None:
+            print_usage(usage)
+        if profile_top is not None:
+            print(profiling.format_top(stats, profile_top))
+            prof_path, collapsed_path = profiling.write_profile(
+                stats, f"{year}_day{day}_star{star}")
+            print(f"  📝 Wrote {prof_path.name} and {collapsed_path.name}"
+                  f" to {prof_path.parent}")
+        if key is not None:
+            answer_cache.put_answer(key, star, result)
+
+
+def run_day_via_daemon(day: int, year: Optional[int] = None,
+                       socket_path: Optional[Path] = None,
+                       stars: Tuple[int, ...] = (1, 2)) -> None:
+    """Run a specific day's solution on a warm `main.py serve` daemon."""
+    import solver_daemon
+
+    if socket_path is None:
+        socket_path = solver_daemon.SOCKET_PATH
+
+    if year is None:
+        year = get_current_year()
+
+    if not validate_day(day):
+        print(f"❌ Error: Day must be between 1 and 25, got {day}")
+        sys.exit(1)
+
+    requests = [{"op": "solve", "year": year, "day": day, "star": star}
+                for star in stars]
+    print(f"🎄 Running {year} Day {day} (via daemon):")
     try:
-        result1 = module.star1()
-        print(f"  ⭐ Star 1: {result1}")
+        responses = solver_daemon.request_many(requests, socket_path)
+        for star, response in zip(stars, responses):
+            if response["ok"]:
+                print(f"  ⭐ Star {star}: {response['result']}")
+            else:
+                print(f"  ❌ Star {star} failed: {response['error']}")
+    except OSError as e:
+        print(f"❌ Could not reach daemon at {socket_path}: {e}")
+        print("   Start it first with: python main.py serve")
+        sys.exit(1)
+
+
+def report_import_time(day: int, year: Optional[int] = None, limit: int = 15) -> None:
+    """Print what importing a day's module costs on a cold interpreter."""
+    import profiling
+
+    if year is None:
+        year = get_current_year()
+
+    day_file = existing_day_file(day, year)
+
+    try:
+        total_us, imports = profiling.measure_import_time(day_file,
+                                                          f"aoc{year}.day{day}")
+    except RuntimeError as e:
+        print(f"❌ Importing day{day} failed: {e}")
+        sys.exit(1)
+
+    print(f"📦 Import time for {year} Day {day}: {format_ns(total_us * 1000)}")
+    for self_us, cumulative_us, name in sorted(imports, key=lambda x: -x[1])[:limit]:
+        print(f"  {format_ns(cumulative_us * 1000):>12} cumulative "
+              f"{format_ns(self_us * 1000):>12} self  {name}")
+
+
+def discover_years() -> List[int]:
+    """Return every year that has an aocYYYY folder next to this script."""
+    years = []
+    for folder in Path(__file__).parent.glob("aoc[0-9][0-9][0-9][0-9]"):
+        if folder.is_dir():
+            years.append(int(folder.name[3:]))
+    return sorted(years)
+
+
+def discover_days(year: int) -> List[int]:
+    """Return every day of a year that has a dayN/dayN.py solution file."""
+    year_folder = Path(__file__).parent / f"aoc{year}"
+    days = []
+    for day in range(1, 26):
+        if (year_folder / f"day{day}" / f"day{day}.py").exists():
+            days.append(day)
+    return days
+
+
+def run_star(year: int, day: int, star: int,
+             use_cache: bool = True) -> Tuple[int, int, int, Any, Optional[str]]:
+    """
+    Run a single star in the current process.
+
+    This is the unit of work handed to the process pool, so it never raises:
+    failures are returned as an error message instead.
+
+    Args:
+        year: Year
+        day: Day number (1-25)
+        star: 1 or 2
+        use_cache: Reuse cached answers; fresh answers are always stored (default: True)
+
+    Returns:
+        Tuple of (year, day, star, result, error)
+    """
+    import answer_cache
+
+    try:
+        key = answer_cache.cache_key(day, year)
+        if key is not None and use_cache:
+            cached = answer_cache.get_answers(key)
+            if str(star) in cached:
+                return year, day, star, cached[str(star)], None
+
+        module = load_day_module(day, year)
+        solvers, _ = prepare_stars(module, day, year)
+        result = solvers[star]()
+        if key is not None:
+            answer_cache.put_answer(key, star, result)
+        return year, day, star, result, None
     except Exception as e:
-        print(f"  ❌ Star 1 failed: {e}")
+        return year, day, star, None, f"{type(e).__name__}: {e}"
+
+
+def _isolated_child(conn: Any, year: int, day: int, star: int,
+                    max_mem: Optional[int], variant: str) -> None:
+    """Child process body for _run_child: cap memory, solve, send the outcome."""
+    import input_store
+    import profiling
+
+    # A forkserver child inherits the server's environment, not the caller's
+    os.environ[input_store.VARIANT_ENV] = variant
+    if hasattr(os, "setpgrp"):
+        # Lead a process group, so a timeout also kills any workers it starts
+        os.setpgrp()
+    if max_mem is not None and resource is not None:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (max_mem, hard))
 
     try:
-        result2 = module.star2()
-        print(f"  ⭐ Star 2: {result2}")
+        module = load_day_module(day, year)
+        solvers, _ = prepare_stars(module, day, year)
+        outcome: Tuple[str, Any, Optional[int]] = ("ok", solvers[star](), None)
+    except MemoryError:
+        outcome = ("oom", None, None)
     except Exception as e:
-        print(f"  ❌ Star 2 failed: {e}")
+        outcome = ("error", f"{type(e).__name__}: {e}", None)
+    outcome = (outcome[0], outcome[1], profiling.peak_rss())
 
+    try:
+        conn.send(outcome)
+    except MemoryError:
+        conn.send(("oom", None, outcome[2]))
+    except Exception:
+        # Unpicklable answers still get reported
+        conn.send(("ok", repr(outcome[1]), outcome[2]))
+    finally:
+        conn.close()
+
+
+def _kill_process_group(process: Any) -> None:
+    """SIGKILL an isolated child together with any processes it started."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        process.kill()
+
+
+def _run_child(year: int, day: int, star: int, timeout: Optional[float],
+               max_mem: Optional[int]) -> Tuple[Any, Optional[str], Optional[int]]:
+    """
+    Solve one star on the active input variant in a limited child process.
+
+    Returns:
+        Tuple of (result, error, peak RSS of the child in bytes); error is
+        None on success, peak RSS is None if the child didn't report it
+    """
+    import multiprocessing
 
+    import input_store
+
+    # run_many calls this from worker threads, and forking a multi-threaded
+    # process can deadlock on locks other threads hold; a forkserver forks
+    # from its own single-threaded process instead
+    methods = multiprocessing.get_all_start_methods()
+    method = "forkserver" if "forkserver" in methods else "spawn"
+    context = multiprocessing.get_context(method)
+    parent_conn, child_conn = context.Pipe(duplex=False)
+    # Not daemonic, so the star may start its own workers (parallel_map_reduce)
+    process = context.Process(target=_isolated_child,
+                              args=(child_conn, year, day, star, max_mem,
+                                    input_store.active_variant()))
+    process.start()
+    child_conn.close()
+
+    try:
+        if not parent_conn.poll(timeout):
+            _kill_process_group(process)
+            process.join()
+            return None, f"TIMEOUT after {timeout:g}s", None
+        status, value, peak = parent_conn.recv()
+    except EOFError:
+        # The child died without reporting, e.g. killed by the kernel
+        _kill_process_group(process)
+        process.join()
+        if process.exitcode == -signal.SIGKILL and max_mem is not None:
+            return None, f"OOM (limit {format_bytes(max_mem)})", None
+        return None, f"Crashed with exit code {process.exitcode}", None
+    finally:
+        parent_conn.close()
+
+    process.join()
+    if status == "oom":
+        return None, f"OOM (limit {format_bytes(max_mem or 0)})", peak
+    if status == "error":
+        return None, value, peak
+    return value, None, peak
+
+
+def run_isolated(year: int, day: int, star: int, timeout: Optional[float] = None,
+                 max_mem: Optional[int] = None,
+                 use_cache: bool = True) -> Tuple[int, int, int, Any, Optional[str]]:
+    """
+    Run a single star in a child process with a time and memory limit.
+
+    The child's address space is capped with setrlimit(RLIMIT_AS) and it is
+    killed outright once the timeout expires, so a runaway solution is
+    reported as TIMEOUT or OOM instead of hanging the runner.
+
+    Args:
+        year: Year
+        day: Day number (1-25)
+        star: 1 or 2
+        timeout: Wall-clock limit in seconds (default: none)
+        max_mem: Address-space limit in bytes (default: none)
+        use_cache: Reuse cached answers; fresh answers are always stored
+            (default: True)
+
+    Returns:
+        Tuple of (year, day, star, result, error), like run_star
+    """
+    import answer_cache
+
+    key = answer_cache.cache_key(day, year)
+    if key is not None and use_cache:
+        cached = answer_cache.get_answers(key)
+        if str(star) in cached:
+            return year, day, star, cached[str(star)], None
+
+    result, error, _ = _run_child(year, day, star, timeout, max_mem)
+    if error is None and key is not None:
+        answer_cache.put_answer(key, star, result)
+    return year, day, star, result, error
+
+
+def measure_rss(year: int, day: int, star: int, timeout: Optional[float] = None,
+                max_mem: Optional[int] = None) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Measure the peak RSS of one run of a star, parsing included.
+
+    The star runs in a fresh child (see run_isolated), so the number is the
+    real resident memory of a process solving it, not a tracemalloc count,
+    and a size that doesn't fit fails with OOM instead of taking the
+    runner down.
+
+    Args:
+        year: Year
+        day: Day number (1-25)
+        star: 1 or 2
+        timeout: Wall-clock limit in seconds (default: none)
+        max_mem: Address-space limit in bytes (default: none)
+
+    Returns:
+        Tuple of (peak RSS in bytes, error), error being None on success
+    """
+    _, error, peak = _run_child(year, day, star, timeout, max_mem)
+    if error is None and peak is None:
+        error = "peak RSS is not available on this platform"
+    return peak, error
+
+
+def run_many(days: List[Tuple[int, int]], workers: Optional[int] = None,
+             use_cache: bool = True, stars: Tuple[int, ...] = (1, 2),
+             timeout: Optional[float] = None, max_mem: Optional[int] = None) -> None:
+    """
+    Run every star of the given days in parallel over a process pool.
+
+    Results are printed in calendar order: each one is shown as soon as it
+    and every job before it have completed, so a sweep takes about as long
+    as its slowest star rather than the sum of all of them.
+
+    Args:
+        days: List of (year, day) pairs
+        workers: Number of worker processes (default: CPU count)
+        use_cache: Reuse cached answers (default: True)
+        stars: Which stars to run (default: both)
+        timeout: Per-star wall-clock limit in seconds (default: none)
+        max_mem: Per-star address-space limit in bytes (default: none)
+    """
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+    jobs = [(year, day, star) for year, day in days for star in stars]
+    if not jobs:
+        print("⚠️  No solutions found to run")
+        return
+
+    results: List[Optional[Tuple[int, int, int, Any, Optional[str]]]] = (
+        [None] * len(jobs))
+    next_to_print = 0
+    failures = 0
+
+    print(f"🎄 Running {len(days)} day(s) over {workers or os.cpu_count()} worker(s):")
+    if timeout is not None or max_mem is not None:
+        # Each isolated star already gets its own child; threads just wait on them
+        pool: Any = ThreadPoolExecutor(max_workers=workers or os.cpu_count())
+        task: Callable[..., Any] = run_isolated
+        extra: Tuple[Any, ...] = (timeout, max_mem, use_cache)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        task, extra = run_star, (use_cache,)
+
+    with pool:
+        futures = {pool.submit(task, *job, *extra): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+            while next_to_print < len(jobs) and results[next_to_print] is not None:
+                year, day, star, result, error = results[next_to_print]
+                if error is None:
+                    print(f"  ⭐ {year} Day {day:>2} Star {star}: {result}")
+                else:
+                    failures += 1
+                    print(f"  ❌ {year} Day {day:>2} Star {star} failed: {error}")
+                next_to_print += 1
+
+    if failures:
+        print(f"⚠️  {failures} of {len(jobs)} star(s) failed")
+
+
+def generate_input(day: int, year: int, scale: int = 1, seed: int = 0) -> str:
+    """
+    Generate a synthetic input with the day's generate.py and store it.
+
+    The variant name includes the scale, seed and a hash of the generator
+    source, so editing a generator never serves stale data.
+
+    Args:
+        day: Day number (1-25)
+        year: Year
+        scale: Size multiplier relative to a real input (default: 1)
+        seed: Random seed (default: 0)
+
+    Returns:
+        Input store variant holding the generated input
+
+    Raises:
+        FileNotFoundError: If the day has no generate.py
+    """
+    import input_store
+
+    gen_file = Path(__file__).parent / f"aoc{year}" / f"day{day}" / "generate.py"
+    if not gen_file.exists():
+        raise FileNotFoundError(f"No input generator at {gen_file}")
+
+    source_hash = hashlib.sha256(gen_file.read_bytes()).hexdigest()[:8]
+    variant = f"gen-x{scale}-seed{seed}-{source_hash}"
+    if input_store.lookup(year, day, variant) is None:
+        spec = importlib.util.spec_from_file_location(
+            f"aoc{year}.day{day}.generate", gen_file)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Failed to load {gen_file}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        input_store.put(year, day, module.generate(scale, seed), variant)
+    return variant
+
+
+@contextmanager
+def use_input_variant(variant: str) -> Iterator[None]:
+    """Make read_input and the runner read `variant` instead of input.txt."""
+    import input_store
+
+    previous = os.environ.get(input_store.VARIANT_ENV)
+    os.environ[input_store.VARIANT_ENV] = variant
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(input_store.VARIANT_ENV, None)
+        else:
+            os.environ[input_store.VARIANT_ENV] = previous
+
+
+def time_star(func: Callable[[], Any], repeats: int,
+              warmup: int = 0) -> Tuple[Any, List[int]]:
+    """
+    Time repeated calls of a star function in the current process.
+
+    Args:
+        func: Zero-argument star function
+        repeats: Number of timed calls
+        warmup: Number of untimed calls made first (default: 0)
+
+    Returns:
+        Tuple of (last result, list of wall times in nanoseconds)
+    """
+    result = None
+    for _ in range(warmup):
+        result = func()
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        result = func()
+        timings.append(time.perf_counter_ns() - start)
+    return result, timings
+
+
+def summarize_timings(timings: List[int]) -> Dict[str, float]:
+    """
+    Summarise wall times as min, median, p95 and standard deviation.
+
+    Args:
+        timings: Wall times in nanoseconds
+
+    Returns:
+        Dict of statistics in nanoseconds, plus the number of runs
+    """
+    ordered = sorted(timings)
+    # Nearest-rank percentile, so p95 is always an observed timing
+    p95 = ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+    return {
+        "runs": len(ordered),
+        "min_ns": ordered[0],
+        "median_ns": statistics.median(ordered),
+        "p95_ns": p95,
+        "stddev_ns": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+    }
+
+
+def format_ns(ns: float) -> str:
+    """Format a duration in nanoseconds with a readable unit."""
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.3f} {unit}"
+    return f"{ns:.0f} ns"
+
+
+def bench_day(day: int, year: Optional[int] = None, repeats: int = 10, warmup: int = 1,
+              stars: Tuple[int, ...] = (1, 2), json_path: Optional[str] = None,
+              scale: Optional[int] = None, seed: int = 0, measure_memory: bool = False,
+              record: bool = True) -> Dict[str, Any]:
+    """
+    Benchmark a day's solution with warm repeats in a single process.
+
+    The module is imported once; each star is then called `warmup` times
+    untimed and `repeats` times timed with perf_counter_ns. Days with a
+    parse hook are parsed once for the stars and parse is timed on its own.
+    Results are appended to the benchmark history (see bench_history).
+
+    Args:
+        day: Day number (1-25)
+        year: Year (default: current year)
+        repeats: Number of timed runs per star (default: 10)
+        warmup: Number of untimed runs per star (default: 1)
+        stars: Which stars to benchmark (default: both)
+        json_path: If given, write the report as JSON to this path
+        scale: If given, benchmark on a generated input this many times the
+            size of a real one instead of input.txt
+        seed: Random seed for the generated input (default: 0)
+        measure_memory: Also run each star once more in a child process to
+            record its peak RSS (default: False)
+        record: Store the results in the benchmark history (default: True)
+
+    Returns:
+        Report dict with per-star statistics
+    """
+    import input_store
+
+    if year is None:
+        year = get_current_year()
+
+    if not validate_day(day):
+        print(f"❌ Error: Day must be between 1 and 25, got {day}")
+        sys.exit(1)
+
+    try:
+        module = load_day_module(day, year)
+    except (FileNotFoundError, ImportError, AttributeError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    variant = input_store.active_variant()
+    if scale is not None:
+        try:
+            variant = generate_input(day, year, scale, seed)
+        except (FileNotFoundError, ImportError) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+    with use_input_variant(variant):
+        return _bench_module(module, day, year, repeats, warmup, stars, json_path,
+                             measure_memory, record)
+
+
+def _bench_module(module: ModuleType, day: int, year: int, repeats: int,
+                  warmup: int, stars: Tuple[int, ...], json_path: Optional[str],
+                  measure_memory: bool, record: bool) -> Dict[str, Any]:
+    """Benchmark a loaded day module on the active input variant."""
+    import bench_history
+    import input_store
+
+    variant = input_store.active_variant()
+    report: Dict[str, Any] = {"year": year, "day": day, "input": variant,
+                              "repeats": repeats, "warmup": warmup, "stars": {}}
+    try:
+        report["input_hash"] = bench_history.input_hash(year, day, variant)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    report["env"] = bench_history.environment()
+
+    on_input = "" if variant == "input" else f" on {variant}"
+    print(f"⏱️  Benchmarking {year} Day {day}{on_input}"
+          f" ({repeats} runs, {warmup} warmup):")
+    try:
+        solvers, parse_ns = prepare_stars(module, day, year)
+    except Exception as e:
+        print(f"  ❌ Parse failed: {e}")
+        sys.exit(1)
+
+    if parse_ns is not None:
+        raw = read_raw_input(day, year)
+        _, timings = time_star(lambda: module.parse(raw), repeats, warmup)
+        stats = summarize_timings(timings)
+        report["parse"] = {**stats, "timings_ns": timings}
+        print(f"  📖 Parse: min {format_ns(stats['min_ns'])}"
+              f" | median {format_ns(stats['median_ns'])}"
+              f" | p95 {format_ns(stats['p95_ns'])}"
+              f" | stddev {format_ns(stats['stddev_ns'])}")
+
+    for star in stars:
+        try:
+            result, timings = time_star(solvers[star], repeats, warmup)
+        except Exception as e:
+            print(f"  ❌ Star {star} failed: {e}")
+            report["stars"][str(star)] = {"error": f"{type(e).__name__}: {e}"}
+            continue
+
+        stats = summarize_timings(timings)
+        report["stars"][str(star)] = {"result": repr(result), **stats,
+                                      "timings_ns": timings}
+        print(f"  ⭐ Star {star}: {result}")
+        print(f"     min {format_ns(stats['min_ns'])}"
+              f" | median {format_ns(stats['median_ns'])}"
+              f" | p95 {format_ns(stats['p95_ns'])}"
+              f" | stddev {format_ns(stats['stddev_ns'])}")
+        if measure_memory:
+            # One extra run in a fresh child, so the peak is the whole
+            # process's RSS (NumPy buffers included) for this star alone
+            peak, error = measure_rss(year, day, star)
+            if error is not None:
+                print(f"     ❌ Peak RSS not measured: {error}")
+                report["stars"][str(star)]["peak_error"] = error
+                continue
+            report["stars"][str(star)]["peak_bytes"] = peak
+            print(f"     peak RSS {format_bytes(peak)}")
+
+    if record:
+        bench_history.record(report)
+
+    if json_path is not None:
+        Path(json_path).write_text(json.dumps(report, indent=2))
+        print(f"📝 Wrote results to {json_path}")
+
+    return report
+
+
+def fit_power_law(sizes: List[float],
+                  values: List[float]) -> Tuple[float, float, float]:
+    """
+    Fit values ≈ coefficient * size ** exponent by least squares in log-log space.
+
+    Args:
+        sizes: Input sizes, at least two distinct and all positive
+        values: Measurements at those sizes, all positive
+
+    Returns:
+        Tuple of (exponent, coefficient, r squared of the log-log fit)
+
+    Raises:
+        ValueError: If there are fewer than two distinct sizes
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(value, 1e-12)) for value in values]
+    mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    if len(set(sizes)) < 2 or sxx == 0:
+        raise ValueError("Need at least two distinct input sizes to fit")
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    exponent = sxy / sxx
+    intercept = mean_y - exponent * mean_x
+
+    ss_total = sum((y - mean_y) ** 2 for y in ys)
+    ss_resid = sum((y - intercept - exponent * x) ** 2 for x, y in zip(xs, ys))
+    r_squared = 1 - ss_resid / ss_total if ss_total else 1.0
+    return exponent, math.exp(intercept), r_squared
+
+
+def input_size(raw: str) -> Tuple[int, str]:
+    """Measure an input as its line count, or its length for one-line inputs."""
+    lines = raw.count("\n") + 1
+    return (lines, "lines") if lines > 1 else (len(raw), "characters")
+
+
+def _available_memory() -> Optional[int]:
+    """Free physical memory in bytes, if the platform reports it."""
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def scale_day(day: int, year: Optional[int] = None, star: int = 1,
+              scales: Tuple[int, ...] = (1, 2, 4, 8, 16), repeats: int = 3,
+              seed: int = 0, target: Optional[int] = None,
+              max_time: float = 10.0) -> Dict[str, Any]:
+    """
+    Run a star on generated inputs of growing size and fit its complexity.
+
+    Each size is first run once in a child process capped at the memory
+    that is free, recording its peak RSS (parsing included), then timed
+    `repeats` times in-process, keeping the fastest run. Time and memory
+    are fitted to a * n^k, where n is the number of input lines (characters
+    for one-line inputs). A size that fails stops the scan, and once two
+    sizes are in, the fit so far is used to skip sizes that would run too
+    long or exhaust the machine's memory.
+
+    Args:
+        day: Day number (1-25)
+        year: Year (default: current year)
+        star: Star to measure (default: 1)
+        scales: Generator scales to run, smallest first (default: 1-16x)
+        repeats: Timed runs per size (default: 3)
+        seed: Random seed for the generated inputs (default: 0)
+        target: Input size n to extrapolate runtime and memory to
+        max_time: Skip sizes predicted or measured to take longer than
+            this many seconds (default: 10)
+
+    Returns:
+        Report dict with the measured points and the fitted exponents
+    """
+    if year is None:
+        year = get_current_year()
+
+    if not validate_day(day):
+        print(f"❌ Error: Day must be between 1 and 25, got {day}")
+        sys.exit(1)
+
+    try:
+        module = load_day_module(day, year)
+    except (FileNotFoundError, ImportError, AttributeError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"📈 Scaling {year} Day {day} Star {star}"
+          f" (scales {', '.join(f'{s}x' for s in scales)}):")
+    points: List[Dict[str, Any]] = []
+    unit = "lines"
+
+    def solve() -> Any:
+        solvers, _ = prepare_stars(module, day, year)
+        return solvers[star]()
+
+    for scale in sorted(scales):
+        sizes = [point["n"] for point in points]
+        available = _available_memory()
+        if len(set(sizes)) >= 2:
+            # Guard against sizes that would hang or exhaust memory
+            time_k, time_a, _ = fit_power_law(
+                sizes, [point["time_ns"] for point in points])
+            mem_k, mem_a, _ = fit_power_law(
+                sizes, [point["peak_bytes"] for point in points])
+            next_n = points[-1]["n"] * scale / points[-1]["scale"]
+            predicted_ns = time_a * next_n ** time_k
+            predicted_bytes = mem_a * next_n ** mem_k
+            if (predicted_ns / 1e9 > max_time
+                    or (available and predicted_bytes > available / 2)):
+                print(f"  ⏭️  Stopping before {scale}x: predicted"
+                      f" ~{format_ns(predicted_ns)},"
+                      f" ~{format_bytes(predicted_bytes)} peak RSS")
+                break
+
+        try:
+            variant = generate_input(day, year, scale, seed)
+        except (FileNotFoundError, ImportError) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+
+        with use_input_variant(variant):
+            n, unit = input_size(read_raw_input(day, year))
+            # Probe memory first, in a child capped at what is free: a size
+            # that doesn't fit fails there instead of getting the runner
+            # OOM-killed, and RSS counts NumPy buffers tracemalloc misses
+            peak, error = measure_rss(year, day, star, timeout=2 * max_time,
+                                      max_mem=available or None)
+            if error is not None:
+                print(f"  ❌ {scale}x failed: {error}")
+                break
+            try:
+                _, timings = time_star(solve, repeats)
+            except Exception as e:
+                print(f"  ❌ {scale}x failed: {type(e).__name__}: {e}")
+                break
+
+        elapsed = min(timings)
+        points.append({"scale": scale, "n": n, "time_ns": elapsed,
+                       "peak_bytes": peak})
+        print(f"  {scale:>5}x  n = {n:<9} {format_ns(elapsed):>12}"
+              f"  peak RSS {format_bytes(peak)}")
+        if elapsed / 1e9 > max_time:
+            print(f"  ⏭️  Stopping: {scale}x took longer than {max_time:g}s")
+            break
+
+    report: Dict[str, Any] = {"year": year, "day": day, "star": star, "unit": unit,
+                              "points": points}
+    sizes = [point["n"] for point in points]
+    try:
+        time_fit = fit_power_law(sizes, [point["time_ns"] for point in points])
+        mem_fit = fit_power_law(sizes, [point["peak_bytes"] for point in points])
+    except ValueError as e:
+        print(f"❌ Error: {e} (does this day's generator honour scale?)")
+        sys.exit(1)
+
+    report["time_exponent"], report["memory_exponent"] = time_fit[0], mem_fit[0]
+    print(f"  ⏱️  Time:   O(n^{time_fit[0]:.2f})  (R² {time_fit[2]:.3f})")
+    print(f"  💾 Memory: O(n^{mem_fit[0]:.2f})  (R² {mem_fit[2]:.3f})")
+
+    if target is not None:
+        predicted_ns = time_fit[1] * target ** time_fit[0]
+        predicted_bytes = mem_fit[1] * target ** mem_fit[0]
+        report["target"] = {"n": target, "time_ns": predicted_ns,
+                            "peak_bytes": predicted_bytes}
+        print(f"  🔮 At n = {target} {unit}: ~{format_ns(predicted_ns)},"
+              f" ~{format_bytes(predicted_bytes)} peak RSS")
+    return report
+
+
+def compare_reports(reports: List[Dict[str, Any]], ref: str) -> bool:
+    """
+    Print each star's speedup or slowdown against the history of a commit.
+
+    Only runs of that exact commit on the same input bytes are compared;
+    differences within 5% are reported as unchanged.
+
+    Args:
+        reports: Reports from bench_day
+        ref: Git revision to compare with, e.g. HEAD~1
+
+    Returns:
+        False if the revision doesn't resolve to a commit, True otherwise
+    """
+    import bench_history
+
+    commit = bench_history.git_commit(ref)
+    if commit is None:
+        print(f"❌ Error: '{ref}' is not a known git commit")
+        return False
+
+    print(f"📊 Compared with {ref} ({commit[:10]}):")
+    for report in reports:
+        label = f"{report['year']} Day {report['day']}"
+        baseline = bench_history.latest(commit, report["year"], report["day"],
+                                        report["input_hash"])
+        if not baseline:
+            print(f"  ⚪ {label}: no clean runs of {ref} on this input recorded"
+                  f" (check it out and run bench there first)")
+            continue
+
+        entries = [(f"Star {star}", stats) for star, stats in report["stars"].items()]
+        if "parse" in report:
+            entries.insert(0, ("Parse", report["parse"]))
+        for name, stats in entries:
+            key = name.split()[-1].lower()
+            if "error" in stats or key not in baseline:
+                continue
+            old, new = baseline[key]["median_ns"], stats["median_ns"]
+            ratio = old / new if new else math.inf
+            if ratio >= 1.05:
+                verdict = f"🚀 {ratio:.2f}x faster"
+            elif ratio <= 1 / 1.05:
+                verdict = f"🐢 {1 / ratio:.2f}x slower"
+            else:
+                verdict = "≈ unchanged"
+            print(f"  {label} {name}: {format_ns(old)} → {format_ns(new)}  {verdict}")
+    return True
+
+
+def load_budgets(path: str) -> Dict[str, Any]:
+    """
+    Load a budgets TOML file.
+
+    A [default] table applies to every star; a table named "YEAR.DAY"
+    overrides it for one day, and a nested starN table for one star:
+
+        [default]
+        time = "1s"
+        memory = "256M"
+
+        ["2025.9"]
+        time = "200ms"
+
+        ["2025.9".star2]
+        time = "2s"
+
+    Times are compared with the median run, memory with the peak RSS of a
+    process solving the star on its own, parsing included.
+
+    Args:
+        path: Path to the TOML file
+
+    Returns:
+        Parsed budgets
+
+    Raises:
+        OSError: If the file can't be read
+        ValueError: If it isn't valid TOML or holds a bad time or size
+    """
+    import tomllib
+
+    with open(path, "rb") as f:
+        budgets = tomllib.load(f)
+
+    def validate(table: Dict[str, Any]) -> None:
+        for key, value in table.items():
+            if key == "time":
+                parse_duration(str(value))
+            elif key == "memory":
+                parse_size(str(value))
+            elif isinstance(value, dict):
+                validate(value)
+
+    validate(budgets)
+    return budgets
+
+
+def star_budget(budgets: Dict[str, Any], year: int, day: int,
+                star: int) -> Tuple[Optional[float], Optional[int]]:
+    """
+    Resolve one star's budget from the default, day and star tables.
+
+    Returns:
+        Tuple of (time limit in seconds, memory limit in bytes), either None
+    """
+    limits: Dict[str, Any] = {}
+    # ["2025.9"] is a key of its own, unquoted [2025.9] nests the day in the year
+    day_tables = [budgets.get(f"{year}.{day}", {}),
+                  budgets.get(str(year), {}).get(str(day), {})]
+    star_tables = [table.get(f"star{star}", {}) for table in day_tables]
+    for table in [budgets.get("default", {}), *day_tables, *star_tables]:
+        limits.update({key: table[key] for key in ("time", "memory") if key in table})
+    time_limit = parse_duration(str(limits["time"])) if "time" in limits else None
+    mem_limit = parse_size(str(limits["memory"])) if "memory" in limits else None
+    return time_limit, mem_limit
+
+
+def check_budgets(reports: List[Dict[str, Any]], budgets: Dict[str, Any]) -> List[str]:
+    """
+    List every star that failed or went over its time or memory budget.
+
+    Args:
+        reports: Reports from bench_day, with peak RSS if any star has a
+            memory budget
+        budgets: Budgets from load_budgets
+
+    Returns:
+        Human-readable descriptions of the violations (empty if all passed)
+    """
+    violations = []
+    for report in reports:
+        for star, stats in report["stars"].items():
+            label = f"{report['year']} Day {report['day']} Star {star}"
+            if "error" in stats:
+                violations.append(f"{label} failed: {stats['error']}")
+                continue
+            time_limit, mem_limit = star_budget(budgets, report["year"], report["day"],
+                                                int(star))
+            if time_limit is not None and stats["median_ns"] > time_limit * 1e9:
+                violations.append(f"{label} took {format_ns(stats['median_ns'])}"
+                                  f" (budget {format_ns(time_limit * 1e9)})")
+            peak = stats.get("peak_bytes")
+            if mem_limit is not None and "peak_error" in stats:
+                violations.append(f"{label} memory not measured: {stats['peak_error']}")
+            if mem_limit is not None and peak is not None and peak > mem_limit:
+                violations.append(f"{label} peaked at {format_bytes(peak)}"
+                                  f" (budget {format_bytes(mem_limit)})")
+    return violations
+
+
+def parse_limits(args: argparse.Namespace) -> Tuple[Optional[float], Optional[int]]:
+    """Parse the run command's --timeout/--max-mem options, exiting on bad input."""
+    try:
+        timeout = parse_duration(args.timeout) if args.timeout else None
+    except ValueError:
+        print(f"❌ Error: Invalid duration '{args.timeout}'")
+        sys.exit(1)
+    try:
+        max_mem = parse_size(args.max_mem) if args.max_mem else None
+    except ValueError:
+        print(f"❌ Error: Invalid size '{args.max_mem}'")
+        sys.exit(1)
+    return timeout, max_mem
 
 
 def main() -> None:
@@ -214,6 +1275,23 @@ Examples:
   python main.py run 3                   # Run day 3 of current year
   python main.py run 3 -y 2024           # Run day 3 of 2024 (short form)
   python main.py run 3 --year 2024       # Run day 3 of 2024
+  python main.py run --all               # Run every solved day of every year
+  python main.py run -y 2015 --days 1-12 # Run days 1-12 of 2015 in parallel
+  python main.py run --all -j 4          # Run everything on 4 worker processes
+  python main.py run 4 --no-cache        # Re-run day 4 even if nothing changed
+  python main.py run 10 --star 1         # Run only star 1 of day 10
+  python main.py run 10 --import-time    # Show what importing day 10 costs
+  python main.py run 8 --resources       # Show CPU time and memory per star
+  python main.py run 2 --timeout 30s --max-mem 2G  # Kill runaway stars
+  python main.py run 4 --profile         # Profile day 4 and write flamegraph stacks
+  python main.py serve                   # Start a warm solver daemon
+  python main.py run 10 --via-daemon     # Run day 10 on the warm daemon
+  python main.py bench 9 -n 20           # Benchmark day 9 with 20 timed runs
+  python main.py bench 8 --json out.json # Benchmark day 8 and save the stats
+  python main.py bench 8 --scale 10      # Benchmark day 8 on a 10x generated input
+  python main.py bench 9 --compare HEAD~1  # Show speedups/slowdowns since HEAD~1
+  python main.py bench --all -y 2025 --budget budgets.toml  # Fail on budget overruns
+  python main.py scale 8 --target 100000 # Fit day 8's complexity, predict 100k lines
         """
     )
 
@@ -231,6 +1309,102 @@ Examples:
                            help="Day number (1-25) (default: current day)")
     run_parser.add_argument("-y", "--year", type=int, default=None,
                            help="Year (default: current year)")
+    run_parser.add_argument("--all", action="store_true",
+                           help="Run every solved day (of --year, or of all years)")
+    run_parser.add_argument("--days", default=None,
+                           help="Days to run in parallel, e.g. 1-12 or 1,3,5-7")
+    run_parser.add_argument("-j", "--workers", type=int, default=None,
+                           help="Worker processes for --all/--days"
+                                " (default: CPU count)")
+    run_parser.add_argument("-s", "--star", type=int, choices=(1, 2), default=None,
+                           help="Only run this star (default: both)")
+    run_parser.add_argument("--import-time", action="store_true",
+                           help="Report the cold import cost of the day"
+                                " instead of running it")
+    run_parser.add_argument("--no-cache", action="store_true",
+                           help="Ignore cached answers and re-run every star")
+    run_parser.add_argument("--via-daemon", action="store_true",
+                           help="Send the run to a warm `main.py serve` daemon")
+    run_parser.add_argument("--socket", type=Path, default=None,
+                           help="Daemon socket path (default: .aoc_daemon.sock)")
+    run_parser.add_argument("--timeout", default=None, metavar="DURATION",
+                           help="Kill each star after this long, e.g. 30s or 2m")
+    run_parser.add_argument("--max-mem", default=None, metavar="SIZE",
+                           help="Cap each star's memory, e.g. 512M or 2G")
+    run_parser.add_argument("--resources", action="store_true",
+                           help="Report CPU time, peak memory and RSS per star"
+                                " (slower)")
+    run_parser.add_argument("--mem-threshold", default="64M", metavar="SIZE",
+                           help="Peak above which --resources lists allocation"
+                                " sites (default: 64M)")
+    run_parser.add_argument("--profile", action="store_true",
+                           help="Run each star under cProfile and write"
+                                " .prof/collapsed stacks")
+    run_parser.add_argument("--profile-top", type=int, default=15, metavar="N",
+                           help="Functions to show with --profile (default: 15)")
+
+    # Serve command
+    serve_parser = subparsers.add_parser("serve", help="Start a warm solver daemon")
+    serve_parser.add_argument("--socket", type=Path, default=None,
+                             help="Unix socket path (default: .aoc_daemon.sock)")
+
+    # Bench command
+    bench_parser = subparsers.add_parser("bench", help="Benchmark a day's solution")
+    bench_parser.add_argument("day", nargs="?", type=int, default=None,
+                             help="Day number (1-25) (default: current day)")
+    bench_parser.add_argument("-y", "--year", type=int, default=None,
+                             help="Year (default: current year)")
+    bench_parser.add_argument("--all", action="store_true",
+                             help="Benchmark every solved day"
+                                  " (of --year, or of all years)")
+    bench_parser.add_argument("--days", default=None,
+                             help="Days to benchmark, e.g. 1-12 or 1,3,5-7")
+    bench_parser.add_argument("-n", "--repeats", type=int, default=10,
+                             help="Timed runs per star (default: 10)")
+    bench_parser.add_argument("-w", "--warmup", type=int, default=1,
+                             help="Untimed warmup runs per star (default: 1)")
+    bench_parser.add_argument("-s", "--star", type=int, choices=(1, 2), default=None,
+                             help="Only benchmark this star (default: both)")
+    bench_parser.add_argument("--json", default=None, metavar="PATH",
+                             help="Write the results as JSON to PATH")
+    bench_parser.add_argument("--scale", type=int, default=None, metavar="N",
+                             help="Use a generated input N times the real size"
+                                  " (e.g. 1, 10, 100)")
+    bench_parser.add_argument("--seed", type=int, default=0,
+                             help="Random seed for --scale inputs (default: 0)")
+    bench_parser.add_argument("--compare", default=None, metavar="REF",
+                             help="Compare with recorded runs of a git commit,"
+                                  " e.g. HEAD~1")
+    bench_parser.add_argument("--budget", default=None, metavar="PATH",
+                             help="Exit non-zero if a star exceeds its budget"
+                                  " in this TOML file")
+    bench_parser.add_argument("--memory", action="store_true",
+                             help="Also record each star's peak RSS"
+                                  " (implied by --budget)")
+    bench_parser.add_argument("--no-history", action="store_true",
+                             help="Don't record the results in the benchmark history")
+
+    # Scale command
+    scale_parser = subparsers.add_parser(
+        "scale", help="Estimate how a star scales with input size")
+    scale_parser.add_argument("day", nargs="?", type=int, default=None,
+                             help="Day number (1-25) (default: current day)")
+    scale_parser.add_argument("-y", "--year", type=int, default=None,
+                             help="Year (default: current year)")
+    scale_parser.add_argument("-s", "--star", type=int, choices=(1, 2), default=1,
+                             help="Star to measure (default: 1)")
+    scale_parser.add_argument("--scales", default="1,2,4,8,16",
+                             help="Generator scales to run (default: 1,2,4,8,16)")
+    scale_parser.add_argument("-n", "--repeats", type=int, default=3,
+                             help="Timed runs per size, fastest kept (default: 3)")
+    scale_parser.add_argument("--seed", type=int, default=0,
+                             help="Random seed for the generated inputs (default: 0)")
+    scale_parser.add_argument("--target", type=float, default=None, metavar="N",
+                             help="Extrapolate runtime and memory to an input"
+                                  " of N lines")
+    scale_parser.add_argument("--max-time", default="10s", metavar="DURATION",
+                             help="Stop growing once a run takes longer than this"
+                                  " (default: 10s)")
 
     args = parser.parse_args()
 
@@ -243,11 +1417,126 @@ Examples:
 
     if args.command == "create":
         create_day(args.day, args.year)
+    elif args.command == "serve":
+        import solver_daemon
+
+        solver_daemon.serve(load_day_module, prepare_stars,
+                            args.socket or solver_daemon.SOCKET_PATH)
+    elif args.command == "scale":
+        try:
+            scales = tuple(int(scale) for scale in args.scales.split(","))
+            max_time = parse_duration(args.max_time)
+        except ValueError:
+            print(f"❌ Error: Invalid --scales '{args.scales}'"
+                  f" or --max-time '{args.max_time}'")
+            sys.exit(1)
+        if args.repeats < 1 or any(scale < 1 for scale in scales):
+            print("❌ Error: --repeats and every scale must be at least 1")
+            sys.exit(1)
+        day = args.day if args.day is not None else get_current_day()
+        target = int(args.target) if args.target is not None else None
+        scale_day(day, args.year, args.star, scales, args.repeats, args.seed, target,
+                  max_time)
+    elif args.command == "bench":
+        if args.repeats < 1:
+            print(f"❌ Error: --repeats must be at least 1, got {args.repeats}")
+            sys.exit(1)
+        stars = (args.star,) if args.star is not None else (1, 2)
+        budgets = None
+        if args.budget is not None:
+            try:
+                budgets = load_budgets(args.budget)
+            except (OSError, ValueError) as e:
+                print(f"❌ Error: Can't load budgets from {args.budget}: {e}")
+                sys.exit(1)
+
+        if args.all or args.days is not None:
+            years = [args.year] if args.year is not None else None
+            if years is None:
+                years = discover_years() if args.all else [get_current_year()]
+            try:
+                selected = parse_days(args.days) if args.days is not None else None
+            except ValueError as e:
+                print(f"❌ Error: {e}")
+                sys.exit(1)
+            days = [(year, day) for year in years for day in discover_days(year)
+                    if selected is None or day in selected]
+            if args.scale is None:
+                import input_store
+
+                missing = [(year, day) for year, day in days
+                           if not input_store.has(year, day)]
+                for year, day in missing:
+                    print(f"⚠️  Skipping {year} Day {day}: no input")
+                days = [entry for entry in days if entry not in missing]
+        else:
+            year = args.year if args.year is not None else get_current_year()
+            days = [(year, args.day if args.day is not None else get_current_day())]
+
+        reports = [
+            bench_day(day, year, args.repeats, max(args.warmup, 0), stars,
+                      args.json if len(days) == 1 else None, args.scale, args.seed,
+                      measure_memory=args.memory or budgets is not None,
+                      record=not args.no_history)
+            for year, day in days
+        ]
+        if args.json is not None and len(days) > 1:
+            Path(args.json).write_text(json.dumps(reports, indent=2))
+            print(f"📝 Wrote results to {args.json}")
+
+        if args.compare is not None and not compare_reports(reports, args.compare):
+            sys.exit(1)
+        if budgets is not None:
+            violations = check_budgets(reports, budgets)
+            for violation in violations:
+                print(f"❌ Over budget: {violation}")
+            if violations:
+                sys.exit(1)
+            print(f"✅ All stars within budget ({args.budget})")
+    elif args.command == "run" and (args.timeout or args.max_mem) and (
+            args.profile or args.resources or args.via_daemon):
+        print("❌ Error: --timeout/--max-mem can't be combined with"
+              " --profile, --resources or --via-daemon")
+        sys.exit(1)
+    elif args.command == "run" and (args.all or args.days is not None):
+        years = [args.year] if args.year is not None else None
+        if years is None:
+            years = discover_years() if args.all else [get_current_year()]
+        try:
+            selected = parse_days(args.days) if args.days is not None else None
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+        if args.profile or args.via_daemon or args.import_time or args.resources:
+            print("❌ Error: --profile, --resources, --via-daemon and --import-time"
+                  " only work with a single day")
+            sys.exit(1)
+        days = [(year, day) for year in years for day in discover_days(year)
+                if selected is None or day in selected]
+        stars = (args.star,) if args.star is not None else (1, 2)
+        timeout, max_mem = parse_limits(args)
+        run_many(days, args.workers, use_cache=not args.no_cache, stars=stars,
+                 timeout=timeout, max_mem=max_mem)
     elif args.command == "run":
         year = args.year if args.year is not None else get_current_year()
         day = args.day if args.day is not None else get_current_day()
+        stars = (args.star,) if args.star is not None else (1, 2)
+        try:
+            mem_threshold = parse_size(args.mem_threshold) if args.resources else None
+        except ValueError:
+            print(f"❌ Error: Invalid size '{args.mem_threshold}'")
+            sys.exit(1)
+        timeout, max_mem = parse_limits(args)
         try:
-            run_day(int(day), year)
+            if args.import_time:
+                report_import_time(int(day), year)
+            elif args.via_daemon:
+                run_day_via_daemon(int(day), year, args.socket, stars)
+            else:
+                run_day(int(day), year, use_cache=not args.no_cache,
+                        profile_top=args.profile_top if args.profile else None,
+                        stars=stars, mem_threshold=mem_threshold,
+                        timeout=timeout, max_mem=max_mem)
         except ValueError:
             print(f"❌ Error: Day must be a number, got '{args.day}'")
             sys.exit(1)
@@ -0,0 +1,323 @@
+"""
+Profiling helpers for the solution runner.
+
+Wraps a star in cProfile, prints the hottest functions and writes both a
+.prof file (for pstats, snakeviz, ...) and a collapsed-stack text file that
+flamegraph.pl, speedscope and inferno can read directly. Also measures
+cold import cost and per-star CPU time and memory use.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    resource = None
+
+PROFILE_DIR = Path(__file__).parent / ".aoc_profiles"
+
+# pstats function key: (filename, line number, function name)
+FuncKey = Tuple[str, int, str]
+
+
+def profile_call(func: Callable[[], Any]) -> Tuple[Any, pstats.Stats]:
+    """
+    Call a function under cProfile.
+
+    Args:
+        func: Zero-argument function to profile
+
+    Returns:
+        Tuple of (function result, collected stats)
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func)
+    return result, pstats.Stats(profiler)
+
+
+def format_top(stats: pstats.Stats, limit: int = 15) -> str:
+    """Return the pstats table of the top functions by cumulative time."""
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+    return stream.getvalue()
+
+
+def _frame_name(key: FuncKey) -> str:
+    filename, line, name = key
+    if filename == "~":
+        # Built-ins are reported as ('~', 0, '<built-in method ...>')
+        return name
+    # Semicolons separate frames in the collapsed format
+    return f"{name} ({Path(filename).name}:{line})".replace(";", ":")
+
+
+def collapsed_stacks(stats: pstats.Stats, max_depth: int = 64,
+                     max_stacks: int = 20000) -> Dict[str, int]:
+    """
+    Approximate collapsed call stacks from cProfile's caller graph.
+
+    cProfile only records caller -> callee edges, not full stacks, so each
+    edge's time is split between its callee's children in proportion to how
+    much of the callee's total time that caller accounts for. Recursive edges
+    are cut at the first repeat.
+
+    The number of paths grows exponentially on diamond-shaped call graphs,
+    so subtrees worth less than a microsecond are dropped, and the walk
+    stops at max_depth frames or after max_stacks frames in total, heaviest
+    callees first.
+
+    Args:
+        stats: Profile statistics
+        max_depth: Longest stack to follow (default: 64)
+        max_stacks: Most frames to visit overall (default: 20000)
+
+    Returns:
+        Dict mapping "root;child;...;leaf" to self time in microseconds
+    """
+    raw = stats.stats  # type: ignore[attr-defined]
+
+    callees: Dict[FuncKey, List[FuncKey]] = {}
+    for callee, (_, _, _, _, callers) in raw.items():
+        for caller in callers:
+            callees.setdefault(caller, []).append(callee)
+
+    # Heaviest callees first, so the budget is spent where the time is
+    for key, children in callees.items():
+        children.sort(key=lambda child: -raw[child][4][key][3])
+
+    stacks: Dict[str, int] = {}
+    roots = [key for key, value in raw.items() if not value[4]]
+    budget = [max_stacks]
+
+    def walk(key: FuncKey, path: List[str], on_path: set, self_time: float,
+             scale: float) -> None:
+        budget[0] -= 1
+        frames = path + [_frame_name(key)]
+        weight = int(self_time * 1e6)
+        if weight > 0:
+            name = ";".join(frames)
+            stacks[name] = stacks.get(name, 0) + weight
+        if len(frames) >= max_depth:
+            return
+
+        for child in callees.get(key, []):
+            if budget[0] <= 0:
+                return
+            if child in on_path:
+                continue
+            child_total = raw[child][3]
+            edge = raw[child][4][key]
+            # edge = (primitive calls, calls, self time, cumulative time)
+            if child_total <= 0 or edge[3] * scale < 1e-6:
+                continue
+            edge_scale = scale * edge[3] / child_total
+            walk(child, frames, on_path | {child}, edge[2] * scale, edge_scale)
+
+    for root in roots:
+        if budget[0] <= 0:
+            break
+        walk(root, [], {root}, raw[root][2], 1.0)
+    return stacks
+
+
+def write_profile(stats: pstats.Stats, stem: str,
+                  out_dir: Path = PROFILE_DIR) -> Tuple[Path, Path]:
+    """
+    Write a .prof dump and a collapsed-stack file.
+
+    Args:
+        stats: Profile statistics
+        stem: File name without extension, e.g. "2025_day9_star2"
+        out_dir: Output directory (default: .aoc_profiles)
+
+    Returns:
+        Tuple of (prof path, collapsed-stack path)
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    prof_path = out_dir / f"{stem}.prof"
+    collapsed_path = out_dir / f"{stem}.collapsed.txt"
+
+    stats.dump_stats(str(prof_path))
+    stacks = sorted(collapsed_stacks(stats).items())
+    lines = [f"{stack} {weight}" for stack, weight in stacks]
+    collapsed_path.write_text("\n".join(lines) + "\n")
+    return prof_path, collapsed_path
+
+
+_IMPORT_PROBE = """
+import importlib.util, sys, time
+sys.path.insert(0, {root!r})
+sys.stderr.write("--- day import ---\\n")
+sys.stderr.flush()
+start = time.perf_counter_ns()
+spec = importlib.util.spec_from_file_location({name!r}, {path!r})
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+print(time.perf_counter_ns() - start)
+"""
+
+
+def measure_import_time(day_file: Path,
+                        module_name: str) -> Tuple[int, List[Tuple[int, int, str]]]:
+    """
+    Measure what importing a day costs in a fresh interpreter.
+
+    Runs the import under `python -X importtime` in a subprocess so that
+    nothing is already cached, and keeps only imports triggered by the day.
+
+    Args:
+        day_file: Path to dayN.py
+        module_name: Module name to load it under, e.g. "aoc2025.day10"
+
+    Returns:
+        Tuple of (total import wall time in µs, list of
+        (self µs, cumulative µs, module name) for top-level imports)
+
+    Raises:
+        RuntimeError: If the import fails in the subprocess
+    """
+    root = str(Path(__file__).parent)
+    code = _IMPORT_PROBE.format(root=root, name=module_name, path=str(day_file))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True, cwd=root)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    _, _, day_part = proc.stderr.partition("--- day import ---\n")
+    imports = []
+    for line in day_part.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        # Nested imports are indented below their parent; keep direct ones
+        if not self_us.strip().isdigit() or name[1:].startswith(" "):
+            continue
+        imports.append((int(self_us), int(cumulative_us), name.strip()))
+
+    total_us = int(proc.stdout.strip().splitlines()[-1]) // 1000
+    return total_us, imports
+
+
+def _current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes, if the platform exposes it."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_rss() -> Optional[int]:
+    """
+    Highest resident set size of this process so far, in bytes.
+
+    Unlike the tracemalloc peak this counts everything the process maps,
+    NumPy buffers and interpreter overhead included. The peak of the
+    largest finished child (e.g. a pool worker) is added on top.
+    """
+    if resource is None:
+        return None
+    # ru_maxrss is in KiB on Linux but in bytes on macOS
+    unit = 1 if sys.platform == "darwin" else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return (own + children) * unit
+
+
+def _cpu_times() -> Tuple[float, float]:
+    """User and system CPU seconds used by this process so far."""
+    if resource is not None:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return usage.ru_utime, usage.ru_stime
+    times = os.times()
+    return times.user, times.system
+
+
+class _PeakSampler(threading.Thread):
+    """
+    Snapshot tracemalloc whenever traced memory reaches a new high.
+
+    A snapshot taken after the call only shows what survived it, so this
+    polls in the background and keeps the snapshot closest to the peak.
+    """
+
+    def __init__(self, threshold: int, interval: float = 0.05):
+        super().__init__(daemon=True)
+        self.threshold = threshold
+        self.interval = interval
+        self.best = 0
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            current, _ = tracemalloc.get_traced_memory()
+            # Only re-snapshot on meaningful growth, snapshots are not free
+            if current >= self.threshold and current > self.best * 1.1:
+                self.best = current
+                self.snapshot = tracemalloc.take_snapshot()
+
+
+def measure_call(func: Callable[[], Any], mem_threshold: int = 64 * 1024 * 1024,
+                 top_sites: int = 10) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Call a function while accounting for the time and memory it uses.
+
+    Args:
+        func: Zero-argument function to measure
+        mem_threshold: Peak traced bytes above which allocation sites are
+            collected (default: 64 MiB)
+        top_sites: Number of allocation sites to keep (default: 10)
+
+    Returns:
+        Tuple of (function result, usage dict with wall_ns, user_s, sys_s,
+        peak_bytes, rss_before, rss_after and sites, a list of
+        (size in bytes, "file:line") for the biggest allocation sites)
+    """
+    rss_before = _current_rss()
+    tracemalloc.start()
+    sampler = _PeakSampler(mem_threshold)
+    sampler.start()
+    usage_before = _cpu_times()
+    start = time.perf_counter_ns()
+    try:
+        result = func()
+    finally:
+        wall_ns = time.perf_counter_ns() - start
+        usage_after = _cpu_times()
+        sampler.stopped.set()
+        sampler.join()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    sites = []
+    if sampler.snapshot is not None:
+        # Hide the sampler's own bookkeeping
+        snapshot = sampler.snapshot.filter_traces([
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, threading.__file__),
+        ])
+        for stat in snapshot.statistics("lineno")[:top_sites]:
+            frame = stat.traceback[0]
+            sites.append((stat.size, f"{frame.filename}:{frame.lineno}"))
+
+    return result, {
+        "wall_ns": wall_ns,
+        "user_s": usage_after[0] - usage_before[0],
+        "sys_s": usage_after[1] - usage_before[1],
+        "peak_bytes": peak,
+        "rss_before": rss_before,
+        "rss_after": _current_rss(),
+        "sites": sites,
+    }
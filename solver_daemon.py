@@ -0,0 +1,276 @@
+"""
+Warm solver daemon.
+
+Keeps one interpreter alive with the heavy dependencies (numpy, z3)
+pre-imported and serves star requests over a Unix domain socket, so repeated
+runs skip interpreter startup and import cost. Day modules are cached and
+transparently reloaded when their source file or a utils module changes, and
+the input each day's parse hook produced is kept for as long as the module
+and the input bytes stay the same.
+
+Protocol: one JSON object per line in each direction.
+    -> {"op": "solve", "year": 2025, "day": 9, "star": 1}
+    <- {"ok": true, "result": 4763040296, "elapsed_ns": 123456, "parse_ns": null}
+    ("parse_ns" is null when the day has no parse hook or its result was reused)
+    <- {"ok": false, "error": "FileNotFoundError: ..."}
+Other ops: {"op": "ping"} and {"op": "shutdown"}.
+"""
+
+import graphlib
+import hashlib
+import importlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import input_store
+
+SOCKET_PATH = Path(__file__).parent / ".aoc_daemon.sock"
+PRELOAD_MODULES = ["numpy", "z3"]
+
+Loader = Callable[[int, int], ModuleType]
+Preparer = Callable[[ModuleType, int, int],
+                    Tuple[Dict[int, Callable[[], Any]], Optional[int]]]
+
+
+def preload(modules: List[str] = PRELOAD_MODULES) -> List[str]:
+    """
+    Import heavy optional dependencies up front.
+
+    Args:
+        modules: Module names to import
+
+    Returns:
+        Names of the modules that were imported successfully
+    """
+    loaded = []
+    for name in modules:
+        try:
+            importlib.import_module(name)
+            loaded.append(name)
+        except ImportError:
+            pass
+    return loaded
+
+
+def _mtime(path: Optional[str]) -> int:
+    if path is None:
+        return 0
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+class ModuleCache:
+    """Day modules keyed by (year, day), reloaded when their sources change."""
+
+    def __init__(self, loader: Loader):
+        self.loader = loader
+        self.modules: Dict[Tuple[int, int],
+                           Tuple[ModuleType, Tuple[int, Tuple[int, ...]]]] = {}
+
+    @staticmethod
+    def _utils_modules(year: int) -> List[ModuleType]:
+        """
+        Loaded modules of the year's utils package and of aoc_utils.
+
+        Ordered so every module comes after the modules it imports names
+        from, e.g. aoc_utils.utils before aoc_utils.graph before the year's
+        graph re-export; reloading in this order rebinds those names to the
+        fresh definitions.
+        """
+        prefixes = (f"aoc{year}.utils.", "aoc_utils.")
+        modules = {name: module for name, module in sys.modules.items()
+                   if name.startswith(prefixes) and module is not None}
+        base = "aoc_utils.utils"
+        order: graphlib.TopologicalSorter = graphlib.TopologicalSorter()
+        for name, module in sorted(modules.items()):
+            # Skip module values: touching a lazy module would import it
+            uses = {getattr(value, "__module__", None)
+                    for value in vars(module).values()
+                    if not isinstance(value, ModuleType)}
+            if name != base:
+                uses.add(base)  # The shared base, even if only modules came from it
+            order.add(name, *sorted(uses & modules.keys() - {name}))
+        return [modules[name] for name in order.static_order()]
+
+    def _signature(self, year: int, day: int,
+                   module: ModuleType) -> Tuple[int, Tuple[int, ...]]:
+        utils = sorted(self._utils_modules(year), key=lambda u: u.__name__)
+        return (_mtime(module.__file__),
+                tuple(_mtime(getattr(u, "__file__", None)) for u in utils))
+
+    def signature(self, year: int, day: int) -> Tuple[int, Tuple[int, ...]]:
+        """Source signature of the cached day module, as of its last load."""
+        return self.modules[(year, day)][1]
+
+    def get(self, year: int, day: int) -> ModuleType:
+        """Return the day module, reloading it if it or its utils changed."""
+        cached = self.modules.get((year, day))
+        if cached is not None:
+            module, signature = cached
+            current = self._signature(year, day, module)
+            if current == signature:
+                return module
+            if current[1] != signature[1]:
+                for utils in self._utils_modules(year):
+                    importlib.reload(utils)
+
+        module = self.loader(day, year)
+        self.modules[(year, day)] = (module, self._signature(year, day, module))
+        return module
+
+
+class SolverHandler(socketserver.StreamRequestHandler):
+    """Answers newline-delimited JSON requests on one connection."""
+
+    server: "SolverServer"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                request = {}
+                response: Dict[str, Any] = {"ok": False, "error": f"Bad request: {e}"}
+            else:
+                response = self.server.dispatch(request)
+
+            self.wfile.write(json.dumps(response, default=repr).encode() + b"\n")
+            self.wfile.flush()
+            if request.get("op") == "shutdown":
+                return
+
+
+class SolverServer(socketserver.UnixStreamServer):
+    """Single-threaded server, so solutions never run concurrently."""
+
+    def __init__(self, socket_path: Path, loader: Loader, prepare: Preparer):
+        self.cache = ModuleCache(loader)
+        self.prepare = prepare
+        # (year, day) -> (module signature, input variant, input hash, solvers)
+        self.prepared: Dict[Tuple[int, int], Tuple[Any, str, str,
+                                                   Dict[int, Callable[[], Any]]]] = {}
+        super().__init__(str(socket_path), SolverHandler)
+
+    def prepared_stars(self, year: int, day: int) -> Tuple[Dict[int, Callable[[], Any]],
+                                                            Optional[int]]:
+        """
+        Return the day's stars bound to its input, parsing only when needed.
+
+        The bound stars are reused until the day module or its utils are
+        reloaded, or the active input variant or its bytes change, so the
+        parse hook runs once per input rather than once per request.
+
+        Returns:
+            Tuple of ({star: zero-argument callable}, parse time in ns, or
+            None if nothing was parsed)
+        """
+        module = self.cache.get(year, day)
+        signature = self.cache.signature(year, day)
+        variant = input_store.active_variant()
+        digest = hashlib.sha256(
+            input_store.read_bytes(year, day, variant, use_mmap=True)).hexdigest()
+        cached = self.prepared.get((year, day))
+        if cached is not None and cached[:3] == (signature, variant, digest):
+            return cached[3], None
+
+        solvers, parse_ns = self.prepare(module, day, year)
+        self.prepared[(year, day)] = (signature, variant, digest, solvers)
+        return solvers, parse_ns
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get("op", "solve")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if op == "shutdown":
+            # shutdown() blocks until serve_forever returns, so call it off-thread
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True}
+        if op != "solve":
+            return {"ok": False, "error": f"Unknown op: {op}"}
+
+        try:
+            year, day = int(request["year"]), int(request["day"])
+            star = int(request["star"])
+            solvers, parse_ns = self.prepared_stars(year, day)
+            start = time.perf_counter_ns()
+            result = solvers[star]()
+            elapsed = time.perf_counter_ns() - start
+        except Exception as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        return {"ok": True, "result": result, "elapsed_ns": elapsed,
+                "parse_ns": parse_ns}
+
+
+def serve(loader: Loader, prepare: Preparer, socket_path: Path = SOCKET_PATH) -> None:
+    """
+    Run the daemon until interrupted or asked to shut down.
+
+    Args:
+        loader: Function (day, year) -> module, e.g. main.load_day_module
+        prepare: Function binding stars to input, e.g. main.prepare_stars
+        socket_path: Unix socket to listen on (default: .aoc_daemon.sock)
+    """
+    if socket_path.exists():
+        if ping(socket_path):
+            print(f"❌ A daemon is already listening on {socket_path}")
+            return
+        socket_path.unlink()  # Stale socket from a crashed daemon
+
+    loaded = preload()
+    print(f"🔥 Pre-imported: {', '.join(loaded) if loaded else 'nothing'}")
+
+    with SolverServer(socket_path, loader, prepare) as server:
+        print(f"👂 Listening on {socket_path} (pid {os.getpid()})")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+    print("👋 Daemon stopped")
+
+
+def request_many(requests: List[Dict[str, Any]], socket_path: Path = SOCKET_PATH,
+                 timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Send requests over one connection and yield responses in order.
+
+    Args:
+        requests: Request dicts (see module docstring)
+        socket_path: Daemon socket (default: .aoc_daemon.sock)
+        timeout: Socket timeout in seconds (default: none)
+
+    Raises:
+        OSError: If the daemon is not reachable
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        with sock.makefile("rwb") as stream:
+            for request in requests:
+                stream.write(json.dumps(request).encode() + b"\n")
+                stream.flush()
+                line = stream.readline()
+                if not line:
+                    raise ConnectionError("Daemon closed the connection")
+                yield json.loads(line)
+
+
+def ping(socket_path: Path = SOCKET_PATH) -> bool:
+    """Return True if a daemon answers on the socket."""
+    try:
+        return next(request_many([{"op": "ping"}], socket_path, timeout=2))["ok"]
+    except (OSError, ValueError, StopIteration):
+        return False
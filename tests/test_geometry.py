@@ -0,0 +1,66 @@
+"""Tests for the array-based geometry helpers in aoc_utils.geometry"""
+
+import numpy as np
+import pytest
+
+from aoc_utils.geometry import (
+    compress,
+    fill_outside,
+    label_components,
+    rasterize_polygon,
+)
+
+
+def test_compress():
+    cells, index = compress([100, 5, 7, 100])
+    assert cells.tolist() == [5, 7, 100]
+    assert index.tolist() == [2, 0, 1, 2]
+
+
+def test_compress_keeps_a_cell_per_gap():
+    cells, index = compress([100, 5, 6, 100], gaps=True)
+    # 5 and 6 are adjacent; 7..99 become one gap cell starting at 7
+    assert cells.tolist() == [5, 6, 7, 100]
+    assert index.tolist() == [3, 0, 1, 3]
+
+
+def test_rasterize_polygon_matches_point_in_polygon():
+    # An L shape: the 6x6 square minus its top-right 3x3 corner
+    xs, ys = [0, 2, 2, 5, 5, 0], [0, 0, 3, 3, 5, 5]
+    filled = rasterize_polygon(xs, ys, 7, 7)
+    expected = [[x <= 5 and y <= 5 and (x <= 2 or y >= 3) for x in range(7)]
+                for y in range(7)]
+    assert filled.tolist() == expected
+
+
+def test_rasterize_polygon_rejects_diagonal_edges():
+    with pytest.raises(ValueError):
+        rasterize_polygon([0, 2, 0], [0, 2, 2], 3, 3)
+
+
+def test_label_components():
+    mask = np.array([[1, 1, 0, 0],
+                     [0, 0, 0, 1],
+                     [1, 0, 1, 1],
+                     [0, 1, 0, 0]], dtype=bool)
+    labels, count = label_components(mask)
+    assert count == 4
+    assert (labels > 0).tolist() == mask.tolist()
+    assert labels[0, 0] == labels[0, 1]
+    assert labels[1, 3] == labels[2, 2] == labels[2, 3]
+    assert labels[2, 0] != labels[3, 1]
+
+    labels, count = label_components(mask, diagonal=True)
+    assert count == 2
+    assert labels[2, 0] == labels[3, 1] == labels[2, 2]
+
+
+def test_fill_outside():
+    walls = np.array([[0, 0, 0, 0, 0],
+                      [0, 1, 1, 1, 0],
+                      [0, 1, 0, 1, 0],
+                      [0, 1, 1, 1, 0],
+                      [0, 0, 0, 0, 0]], dtype=bool)
+    outside = fill_outside(walls)
+    assert not outside[2, 2]
+    assert outside.sum() == 16
@@ -0,0 +1,98 @@
+"""Tests for the graph and union-find helpers in aoc_utils.graph"""
+
+import random
+
+import pytest
+
+from aoc_utils.graph import DisjointSet, Graph
+
+# a -> b -> d -> e, a -> c -> d, plus an unconnected f -> e
+DAG = {"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": ["e"], "f": ["e"]}
+
+
+def names(graph, ids):
+    return [graph.names[node] for node in ids]
+
+
+def test_topological_order_puts_every_edge_forward():
+    graph = Graph.from_adjacency(DAG)
+    order = names(graph, graph.topological_order())
+    assert sorted(order) == ["a", "b", "c", "d", "e", "f"]
+    for source, targets in DAG.items():
+        for target in targets:
+            assert order.index(source) < order.index(target)
+
+
+def test_topological_order_from_source_skips_unreachable_nodes():
+    graph = Graph.from_adjacency(DAG)
+    order = names(graph, graph.topological_order(graph.ids["b"]))
+    assert order == ["b", "d", "e"]
+
+
+def test_topological_order_rejects_cycles():
+    graph = Graph.from_adjacency({"a": ["b"], "b": ["c"], "c": ["a"]})
+    with pytest.raises(ValueError):
+        graph.topological_order()
+
+
+def test_scc_of_a_dag_is_one_node_each_sinks_first():
+    graph = Graph.from_adjacency(DAG)
+    components = graph.strongly_connected_components()
+    assert all(len(component) == 1 for component in components)
+    order = names(graph, [component[0] for component in reversed(components)])
+    for source, targets in DAG.items():
+        for target in targets:
+            assert order.index(source) < order.index(target)
+
+
+def test_scc_groups_cycles():
+    graph = Graph.from_adjacency({"a": ["b"], "b": ["a", "c"], "c": ["d"],
+                                  "d": ["c", "e"]})
+    components = [sorted(names(graph, component))
+                  for component in graph.strongly_connected_components()]
+    assert components == [["e"], ["c", "d"], ["a", "b"]]
+
+
+def test_count_paths():
+    graph = Graph.from_adjacency(DAG)
+    assert graph.count_paths("a", "e") == 2
+    assert graph.count_paths("a", "e", through=("c",)) == 1
+    assert graph.count_paths("f", "a") == 0
+    assert graph.count_paths("a", "missing") == 0
+
+
+def test_count_paths_is_zero_when_a_cycle_is_reachable():
+    graph = Graph.from_adjacency({"a": ["b", "out"], "b": ["a"]})
+    assert graph.count_paths("a", "out") == 0
+
+
+def partition(dsu, n):
+    return sorted(sorted(i for i in range(n) if dsu.find(i) == root)
+                  for root in {dsu.find(i) for i in range(n)})
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_union_many_matches_union_edge_by_edge(seed):
+    rng = random.Random(seed)
+    n = 60
+    edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(45)]
+
+    one_by_one = DisjointSet(n)
+    merges = sum(one_by_one.union(a, b) for a, b in edges)
+    batched = DisjointSet(n)
+    assert batched.union_many(edges) == merges
+
+    assert partition(batched, n) == partition(one_by_one, n)
+    assert batched.components == one_by_one.components
+    assert sorted(batched.component_sizes()) == sorted(one_by_one.component_sizes())
+    assert batched.size_of(edges[0][0]) == one_by_one.size_of(edges[0][0])
+
+
+def test_union_many_after_union_and_with_no_edges():
+    dsu = DisjointSet(6)
+    dsu.union(4, 5)
+    assert dsu.union_many([]) == 0
+    assert dsu.union_many([(0, 1), (1, 5), (2, 3)]) == 3
+    assert partition(dsu, 6) == [[0, 1, 4, 5], [2, 3]]
+    labels = dsu.labels(dense=True)
+    assert sorted(set(labels.tolist())) == [0, 1]
@@ -0,0 +1,90 @@
+"""Tests for the grid helpers in aoc_utils.utils"""
+
+import numpy as np
+import pytest
+
+from aoc_utils.utils import BitGrid, SummedAreaTable
+
+
+def brute_sum(values, x1, y1, x2, y2):
+    return sum(values[y][x] for y in range(y1, y2 + 1) for x in range(x1, x2 + 1))
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_rect_sum_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    values = rng.integers(-9, 10, size=(7, 11))
+    table = SummedAreaTable(values)
+    assert (table.width, table.height) == (11, 7)
+
+    rows = values.tolist()
+    for _ in range(50):
+        x1, x2 = sorted(rng.integers(0, 11, size=2).tolist())
+        y1, y2 = sorted(rng.integers(0, 7, size=2).tolist())
+        assert table.rect_sum(x1, y1, x2, y2) == brute_sum(rows, x1, y1, x2, y2)
+
+
+def test_rect_sum_and_rect_full_vectorized():
+    mask = np.array([[1, 1, 0],
+                     [1, 1, 1],
+                     [0, 1, 1]], dtype=bool)
+    table = SummedAreaTable(mask)
+    x1, y1 = np.array([0, 1, 0]), np.array([0, 1, 0])
+    x2, y2 = np.array([1, 2, 2]), np.array([1, 2, 2])
+    assert table.rect_sum(x1, y1, x2, y2).tolist() == [4, 4, 7]
+    assert table.rect_full(x1, y1, x2, y2).tolist() == [True, True, False]
+    assert table.rect_full(2, 0, 2, 0) is False
+
+
+def test_rect_sum_does_not_overflow():
+    values = np.full((2, 2), 2 ** 62, dtype=object)
+    assert SummedAreaTable(values).rect_sum(0, 0, 1, 1) == 2 ** 64
+
+
+LINES = ["#.#",
+         "###",
+         "..#"]
+
+
+def test_bitgrid_get_and_set_bounds():
+    grid = BitGrid.from_lines(LINES)
+    assert (grid.width, grid.height, grid.count()) == (3, 3, 6)
+    assert grid.get(0, 0) and not grid.get(1, 0)
+    for x, y in [(-1, 0), (3, 0), (0, -1), (0, 3)]:
+        assert not grid.get(x, y)
+        with pytest.raises(IndexError):
+            grid.set(x, y)
+    grid.set(1, 0)
+    grid.set(2, 2, False)
+    assert grid.to_lines() == ["###", "###", "..."]
+
+
+def test_bitgrid_shifts_drop_cells_instead_of_wrapping():
+    grid = BitGrid.from_lines(LINES)
+    assert grid.shift(1, 0).to_lines() == [".#.", ".##", "..."]
+    assert grid.shift(-1, 0).to_lines() == [".#.", "##.", ".#."]
+    assert grid.shift(0, 1).to_lines() == ["...", "#.#", "###"]
+    assert grid.shift(0, -2).to_lines() == ["..#", "...", "..."]
+    assert not grid.shift(3, 0)
+    assert (~grid).to_lines() == [".#.", "...", "##."]
+
+
+def test_bitgrid_neighbors_at_least_matches_brute_force():
+    rng = np.random.default_rng(0)
+    lines = ["".join(row) for row in rng.choice(["#", "."], size=(9, 13))]
+    grid = BitGrid.from_lines(lines)
+    for diagonal in (False, True):
+        offsets = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                   if (dx or dy) and (diagonal or not (dx and dy))]
+        for k in range(len(offsets) + 2):
+            expected = {(x, y) for y in range(9) for x in range(13)
+                        if sum(grid.get(x + dx, y + dy) for dx, dy in offsets) >= k}
+            assert set(grid.neighbors_at_least(k, diagonal).find_all()) == expected
+
+
+def test_bitgrid_equality_and_hash():
+    grid = BitGrid.from_lines(LINES)
+    same = BitGrid.from_lines(LINES)
+    assert grid == same and hash(grid) == hash(same)
+    assert grid != BitGrid.from_lines(LINES + ["..."])
+    assert len({grid, same, grid.shift(1, 0)}) == 2